@@ -0,0 +1,41 @@
+"""cro audits table
+
+Revision ID: 3f9a1c27b8e4
+Revises: d46ac01b975d
+Create Date: 2026-10-16 09:12:41.204118
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9a1c27b8e4"
+down_revision: Union[str, Sequence[str], None] = "d46ac01b975d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "cro_audits",
+        sa.Column("audit_id", sqlmodel.sql.sqltypes.AutoString(length=36), nullable=False),
+        sa.Column("website_url", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("payload", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.PrimaryKeyConstraint("audit_id"),
+    )
+    op.create_index(op.f("ix_cro_audits_website_url"), "cro_audits", ["website_url"], unique=False)
+    op.create_index(op.f("ix_cro_audits_created_at"), "cro_audits", ["created_at"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_cro_audits_created_at"), table_name="cro_audits")
+    op.drop_index(op.f("ix_cro_audits_website_url"), table_name="cro_audits")
+    op.drop_table("cro_audits")
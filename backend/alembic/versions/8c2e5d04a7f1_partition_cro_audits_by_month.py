@@ -0,0 +1,104 @@
+"""partition cro audits by month
+
+Revision ID: 8c2e5d04a7f1
+Revises: 3f9a1c27b8e4
+Create Date: 2026-10-16 21:40:12.518306
+
+"""
+
+from datetime import datetime
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "8c2e5d04a7f1"
+down_revision: Union[str, Sequence[str], None] = "3f9a1c27b8e4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Months created past the current one, the retention sweeper keeps this window ahead
+PARTITIONS_AHEAD = 2
+
+
+def _add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("ALTER TABLE cro_audits RENAME TO cro_audits_unpartitioned")
+    op.execute("ALTER INDEX cro_audits_pkey RENAME TO cro_audits_unpartitioned_pkey")
+    op.execute(
+        "ALTER INDEX ix_cro_audits_website_url RENAME TO ix_cro_audits_unpartitioned_website_url"
+    )
+    op.execute(
+        "ALTER INDEX ix_cro_audits_created_at RENAME TO ix_cro_audits_unpartitioned_created_at"
+    )
+    op.execute(
+        """
+        CREATE TABLE cro_audits (
+            audit_id VARCHAR(36) NOT NULL,
+            website_url VARCHAR NOT NULL,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            payload JSONB NOT NULL,
+            PRIMARY KEY (audit_id, created_at)
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+    op.create_index(op.f("ix_cro_audits_website_url"), "cro_audits", ["website_url"], unique=False)
+    op.create_index(op.f("ix_cro_audits_created_at"), "cro_audits", ["created_at"], unique=False)
+
+    # One partition per month from the oldest stored audit up to the window ahead
+    oldest = (
+        op.get_bind()
+        .execute(sa.text("SELECT min(created_at) FROM cro_audits_unpartitioned"))
+        .scalar()
+    )
+    today = datetime.utcnow()
+    month = datetime((oldest or today).year, (oldest or today).month, 1)
+    last = _add_months(datetime(today.year, today.month, 1), PARTITIONS_AHEAD)
+    while month <= last:
+        end = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE cro_audits_y{month.year:04d}m{month.month:02d} PARTITION OF cro_audits "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{end.isoformat()}')"
+        )
+        month = end
+
+    op.execute(
+        "INSERT INTO cro_audits (audit_id, website_url, created_at, payload) "
+        "SELECT audit_id, website_url, created_at, payload FROM cro_audits_unpartitioned"
+    )
+    op.execute("DROP TABLE cro_audits_unpartitioned")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("ALTER TABLE cro_audits RENAME TO cro_audits_partitioned")
+    op.execute("ALTER INDEX cro_audits_pkey RENAME TO cro_audits_partitioned_pkey")
+    op.execute(
+        "ALTER INDEX ix_cro_audits_website_url RENAME TO ix_cro_audits_partitioned_website_url"
+    )
+    op.execute(
+        "ALTER INDEX ix_cro_audits_created_at RENAME TO ix_cro_audits_partitioned_created_at"
+    )
+    op.create_table(
+        "cro_audits",
+        sa.Column("audit_id", sa.String(length=36), nullable=False),
+        sa.Column("website_url", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("payload", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.PrimaryKeyConstraint("audit_id"),
+    )
+    op.execute(
+        "INSERT INTO cro_audits (audit_id, website_url, created_at, payload) "
+        "SELECT audit_id, website_url, created_at, payload FROM cro_audits_partitioned"
+    )
+    # Dropping the parent drops every partition with it
+    op.execute("DROP TABLE cro_audits_partitioned")
+    op.create_index(op.f("ix_cro_audits_website_url"), "cro_audits", ["website_url"], unique=False)
+    op.create_index(op.f("ix_cro_audits_created_at"), "cro_audits", ["created_at"], unique=False)
@@ -0,0 +1,33 @@
+"""cro audits keyset index
+
+Revision ID: c41b7e9a2d56
+Revises: 8c2e5d04a7f1
+Create Date: 2026-10-16 23:20:37.902144
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c41b7e9a2d56"
+down_revision: Union[str, Sequence[str], None] = "8c2e5d04a7f1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Leading created_at serves every range filter the single column index did
+    op.create_index(
+        "ix_cro_audits_created_at_audit_id", "cro_audits", ["created_at", "audit_id"], unique=False
+    )
+    op.drop_index(op.f("ix_cro_audits_created_at"), table_name="cro_audits")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f("ix_cro_audits_created_at"), "cro_audits", ["created_at"], unique=False)
+    op.drop_index("ix_cro_audits_created_at_audit_id", table_name="cro_audits")
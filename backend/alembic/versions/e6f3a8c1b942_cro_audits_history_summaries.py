@@ -0,0 +1,105 @@
+"""cro audits history summaries
+
+Revision ID: e6f3a8c1b942
+Revises: c41b7e9a2d56
+Create Date: 2026-10-16 23:41:05.377420
+
+"""
+
+from typing import Sequence, Union
+from urllib.parse import urlsplit
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e6f3a8c1b942"
+down_revision: Union[str, Sequence[str], None] = "c41b7e9a2d56"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SUMMARY_COLUMNS = {
+    "confidence_score": sa.Integer(),
+    "total_uplift_percentage": sa.Float(),
+    "monthly_revenue_uplift": sa.BigInteger(),
+    "issue_count": sa.Integer(),
+    "high_severity_issues": sa.Integer(),
+    "medium_severity_issues": sa.Integer(),
+    "low_severity_issues": sa.Integer(),
+}
+
+
+def _normalize_website_url(website_url: str) -> str:
+    """
+    Frozen copy of `normalize_website_url` as of this revision.
+
+    The migration must backfill the same values whatever the application code later
+    becomes, so it does not import it.
+    """
+    parts = urlsplit(str(website_url))
+    host = (parts.hostname or "").lower()
+    if parts.port and (parts.scheme, parts.port) not in (("http", 80), ("https", 443)):
+        host = f"{host}:{parts.port}"
+    path = parts.path.rstrip("/")
+    query = f"?{parts.query}" if parts.query else ""
+    return f"{parts.scheme.lower()}://{host}{path}{query}"
+
+
+def _severity_count(severity: str) -> str:
+    return (
+        "(SELECT count(*) FROM jsonb_array_elements(payload->'issues_found') AS issue "
+        f"WHERE issue->>'severity' = '{severity}')"
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("cro_audits", sa.Column("normalized_url", sa.String(), nullable=True))
+    for name, column_type in SUMMARY_COLUMNS.items():
+        op.add_column("cro_audits", sa.Column(name, column_type, nullable=True))
+
+    op.execute(
+        "UPDATE cro_audits SET "
+        "confidence_score = COALESCE((payload->>'confidence_score')::integer, 0), "
+        "total_uplift_percentage = "
+        "COALESCE((payload->'revenue_potential'->>'total_uplift_percentage')::float, 0), "
+        "monthly_revenue_uplift = "
+        "COALESCE((payload->'revenue_potential'->>'monthly_revenue_uplift')::bigint, 0), "
+        "issue_count = jsonb_array_length(payload->'issues_found'), "
+        f"high_severity_issues = {_severity_count('High')}, "
+        f"medium_severity_issues = {_severity_count('Medium')}, "
+        f"low_severity_issues = {_severity_count('Low')}"
+    )
+    # Url normalization is defined in Python, apply it once per distinct url
+    bind = op.get_bind()
+    urls = bind.execute(sa.text("SELECT DISTINCT website_url FROM cro_audits")).scalars().all()
+    for url in urls:
+        bind.execute(
+            sa.text(
+                "UPDATE cro_audits SET normalized_url = :normalized_url "
+                "WHERE website_url = :website_url"
+            ),
+            {"normalized_url": _normalize_website_url(url), "website_url": url},
+        )
+
+    op.alter_column("cro_audits", "normalized_url", nullable=False)
+    for name in SUMMARY_COLUMNS:
+        op.alter_column("cro_audits", name, nullable=False)
+    op.create_index(
+        "ix_cro_audits_normalized_url_created_at",
+        "cro_audits",
+        ["normalized_url", sa.text("created_at DESC"), sa.text("audit_id DESC")],
+        unique=False,
+        postgresql_include=["website_url", *SUMMARY_COLUMNS],
+    )
+    # Superseded by the normalized url index, nothing looks audits up by their raw url
+    op.drop_index(op.f("ix_cro_audits_website_url"), table_name="cro_audits")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f("ix_cro_audits_website_url"), "cro_audits", ["website_url"], unique=False)
+    op.drop_index("ix_cro_audits_normalized_url_created_at", table_name="cro_audits")
+    for name in SUMMARY_COLUMNS:
+        op.drop_column("cro_audits", name)
+    op.drop_column("cro_audits", "normalized_url")
@@ -0,0 +1,42 @@
+"""leads table
+
+Revision ID: f17d2b6e8a35
+Revises: e6f3a8c1b942
+Create Date: 2026-10-17 00:02:18.640913
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f17d2b6e8a35"
+down_revision: Union[str, Sequence[str], None] = "e6f3a8c1b942"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "leads",
+        sa.Column("lead_id", sqlmodel.sql.sqltypes.AutoString(length=36), nullable=False),
+        sa.Column("audit_id", sqlmodel.sql.sqltypes.AutoString(length=36), nullable=False),
+        sa.Column("name", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("email", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("phone", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("lead_id"),
+    )
+    op.create_index(op.f("ix_leads_audit_id"), "leads", ["audit_id"], unique=False)
+    op.create_index(op.f("ix_leads_created_at"), "leads", ["created_at"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_leads_created_at"), table_name="leads")
+    op.drop_index(op.f("ix_leads_audit_id"), table_name="leads")
+    op.drop_table("leads")
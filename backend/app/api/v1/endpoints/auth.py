@@ -1,7 +1,13 @@
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Depends, status
 
 from app.controllers import AuthController
-from app.schemas import ResetPasswordResponse, TokenResponse, VerificationTokenResponse
+from app.core.security.dependencies import protected_auth
+from app.schemas import (
+    BaseResponse,
+    ResetPasswordResponse,
+    TokenResponse,
+    VerificationTokenResponse,
+)
 from app.services import AuthService
 
 
@@ -52,3 +58,12 @@ class AuthRouter:
             methods=["PATCH"],
             response_model=ResetPasswordResponse,
         )
+
+        # Load of the bcrypt pool, internal so it needs a signed-in user
+        self.router.add_api_route(
+            "/metrics",
+            self.controller.get_metrics,
+            methods=["GET"],
+            response_model=BaseResponse,
+            dependencies=[Depends(protected_auth)],
+        )
@@ -1,53 +1,286 @@
-from fastapi import APIRouter, HTTPException
-from app.services.cro_audit_service import (
-    SiteAnalysisRequest, CROAuditResult,
-    generate_cro_issues, generate_competitor_data,
-    calculate_revenue_potential, generate_recommendations
+import asyncio
+import math
+from datetime import datetime
+from typing import Any, AsyncIterator, List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from app.core.config import settings
+from app.core.jobs import Job, JobStatus
+from app.core.security.dependencies import protected_auth
+from app.core.write_behind import lead_buffer
+from app.models.domain import Lead, LeadCreate
+from app.services import CROAuditService
+from app.services.audit_export import (
+    EXPORT_MEDIA_TYPES, ExportFormat, export_audits, iter_export_pages
+)
+from app.services.audit_history import AuditHistoryPage, list_audit_history
+from app.services.audit_scenarios import AuditScenarioRequest, apply_scenario
+from app.services.cro_audit_batch import generate_audits_batch
+from app.services.fix_prioritization import FixPlan, FixPrioritizationRequest, prioritize_fixes
+from app.services.industry_benchmarks import get_benchmark_index
+from app.services.revenue_scenarios import (
+    SCENARIO_AXES, RevenueScenarioGridRequest,
+    calculate_revenue_grid, serialize_revenue_grid_npz
 )
-import uuid
-import random
+from app.services.cro_audit_service import SiteAnalysisRequest, CROAuditResult
+import json
+
+site_analysis_requests_adapter = TypeAdapter(List[SiteAnalysisRequest])
+
+
+def encode_section(payload: Any) -> Any:
+    if isinstance(payload, BaseModel):
+        return payload.model_dump(mode="json")
+    if isinstance(payload, list):
+        return [encode_section(item) for item in payload]
+    return payload
+
 
 class CROAuditRouter:
-    def __init__(self):
+    def __init__(self, cro_audit_service: CROAuditService):
         self.router = APIRouter()
-        self.audit_results = {}
-        self.router.post("/analyze", response_model=CROAuditResult)(self.analyze_website)
+        self.cro_audit_service = cro_audit_service
+        self.audit_store = cro_audit_service.audit_store
+        self.router.post("/analyze", response_model=Job, status_code=202)(self.analyze_website)
+        self.router.post(
+            "/analyze/batch",
+            response_model=List[CROAuditResult],
+            openapi_extra={
+                "requestBody": {
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "array",
+                                "items": {"$ref": "#/components/schemas/SiteAnalysisRequest"},
+                            }
+                        },
+                        "application/x-ndjson": {"schema": {"type": "string"}},
+                    },
+                    "required": True,
+                }
+            },
+        )(self.analyze_websites_batch)
+        self.router.post(
+            "/analyze/stream",
+            response_class=StreamingResponse,
+            responses={200: {"content": {"application/x-ndjson": {}, "text/event-stream": {}}}},
+        )(self.analyze_website_stream)
+        self.router.post("/scenarios/grid")(self.calculate_scenario_grid)
+        self.router.post("/prioritize", response_model=FixPlan)(self.prioritize_fixes)
+        self.router.get("/audits", response_model=AuditHistoryPage)(self.list_audits)
+        self.router.get(
+            "/audits/export",
+            response_class=StreamingResponse,
+            # Dumps every stored audit, unlike the rest of this router it needs a signed-in user
+            dependencies=[Depends(protected_auth)],
+            responses={200: {"content": {"application/x-ndjson": {}, "text/csv": {}}}},
+        )(self.export_audits)
         self.router.get("/audit/{audit_id}", response_model=CROAuditResult)(self.get_audit_result)
+        self.router.patch("/audit/{audit_id}/scenario", response_model=CROAuditResult)(
+            self.apply_audit_scenario
+        )
+        self.router.get("/audit/{audit_id}/fix-plan", response_model=FixPlan)(
+            self.get_audit_fix_plan
+        )
+        self.router.post("/contact", status_code=202)(self.submit_contact_info)
+        self.router.get("/benchmarks/{industry}")(self.get_industry_benchmark)
+        self.router.get("/metrics")(self.get_metrics)
 
     async def analyze_website(self, request: SiteAnalysisRequest):
+        return await self.cro_audit_service.submit(request)
+
+    async def analyze_website_stream(self, request: Request, site_request: SiteAnalysisRequest):
+        use_sse = "text/event-stream" in request.headers.get("accept", "")
+
+        async def body() -> AsyncIterator[str]:
+            async for section, payload in self.cro_audit_service.stream(site_request):
+                data = json.dumps(encode_section(payload))
+                if use_sse:
+                    yield f"event: {section}\ndata: {data}\n\n"
+                else:
+                    yield f'{{"section": "{section}", "data": {data}}}\n'
+
+        return StreamingResponse(
+            body(),
+            media_type="text/event-stream" if use_sse else "application/x-ndjson",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    async def analyze_websites_batch(self, request: Request):
+        body = await request.body()
         try:
-            audit_id = str(uuid.uuid4())
-            issues = generate_cro_issues(str(request.website_url), request.current_conversion_rate, request.average_order_value)
-            competitors = generate_competitor_data(request.industry, request.current_conversion_rate)
-            revenue_potential = calculate_revenue_potential(
-                request.monthly_visitors,
-                request.current_conversion_rate,
-                request.average_order_value,
-                issues
+            if request.headers.get("content-type", "").startswith("application/x-ndjson"):
+                raw_requests = [json.loads(line) for line in body.splitlines() if line.strip()]
+            else:
+                raw_requests = json.loads(body)
+            site_requests = site_analysis_requests_adapter.validate_python(raw_requests)
+        except (ValueError, ValidationError) as e:
+            raise HTTPException(status_code=422, detail=f"Invalid batch payload: {str(e)}")
+        if len(site_requests) > settings.audit.BATCH_MAX_SITES:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Batch exceeds the limit of {settings.audit.BATCH_MAX_SITES} sites",
             )
-            recommendations = generate_recommendations(issues)
-            confidence_score = random.randint(85, 97)
-            result = CROAuditResult(
-                audit_id=audit_id,
-                website_url=str(request.website_url),
-                current_metrics={
-                    "monthly_visitors": request.monthly_visitors,
-                    "conversion_rate": request.current_conversion_rate,
-                    "average_order_value": request.average_order_value,
-                    "monthly_revenue": round(request.monthly_visitors * (request.current_conversion_rate / 100) * request.average_order_value)
-                },
-                issues_found=issues,
-                competitor_analysis=competitors,
-                revenue_potential=revenue_potential,
-                recommendations=recommendations,
-                confidence_score=confidence_score
+
+        try:
+            # Seconds of numpy work for a full batch, kept off the event loop
+            results = await self.cro_audit_service.job_queue.run_cpu(
+                generate_audits_batch, site_requests
             )
-            self.audit_results[audit_id] = result
-            return result
+            await self.audit_store.save_many(results)
         except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"Batch analysis failed: {str(e)}")
+        # Payloads are already JSON-ready, skip per-item response model validation and
+        # render the body off the loop, it is ~100 ms for a full batch
+        return await asyncio.to_thread(JSONResponse, results)
+
+    async def calculate_scenario_grid(self, request: RevenueScenarioGridRequest):
+        if request.format == "npz":
+            limit = settings.audit.SCENARIO_GRID_MAX_VALUES
+        else:
+            limit = settings.audit.SCENARIO_GRID_MAX_JSON_VALUES
+        if request.value_count > limit:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Scenario grid exceeds the limit of {limit} values "
+                f"(cells x metrics) for {request.format}",
+            )
+        # Broadcasting and encoding a large grid takes a while, keep it off the event loop
+        return await asyncio.to_thread(self._render_scenario_grid, request)
+
+    @staticmethod
+    def _render_scenario_grid(request: RevenueScenarioGridRequest) -> Response:
+        grid = calculate_revenue_grid(request)
+        if request.format == "npz":
+            return Response(
+                content=serialize_revenue_grid_npz(request, grid),
+                media_type="application/octet-stream",
+                headers={"Content-Disposition": 'attachment; filename="revenue_scenarios.npz"'},
+            )
+        return JSONResponse(
+            content={
+                "axes": list(SCENARIO_AXES),
+                "shape": list(request.shape),
+                "metrics": {metric: values.tolist() for metric, values in grid.items()},
+            }
+        )
+
+    async def prioritize_fixes(self, request: FixPrioritizationRequest):
+        if len(request.issues) > settings.audit.FIX_PLAN_MAX_ISSUES:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Fix plan exceeds the limit of {settings.audit.FIX_PLAN_MAX_ISSUES} issues",
+            )
+        return prioritize_fixes(
+            request.issues,
+            request.effort_budget_days,
+            request.monthly_visitors,
+            request.current_conversion_rate,
+            request.average_order_value,
+        )
+
+    async def get_audit_fix_plan(self, audit_id: str, effort_budget_days: float = Query(..., gt=0)):
+        # Query parameters accept "inf" and "nan", and FastAPI does not apply allow_inf_nan
+        if not math.isfinite(effort_budget_days):
+            raise HTTPException(status_code=422, detail="effort_budget_days must be finite")
+        result = await self.audit_store.get(audit_id)
+        if result is None:
+            raise HTTPException(status_code=404, detail="Audit not found")
+        return prioritize_fixes(
+            result.issues_found,
+            effort_budget_days,
+            result.current_metrics["monthly_visitors"],
+            result.current_metrics["conversion_rate"],
+            result.current_metrics["average_order_value"],
+        )
 
-    async def get_audit_result(self, audit_id: str):
-        if audit_id not in self.audit_results:
+    async def apply_audit_scenario(self, audit_id: str, scenario: AuditScenarioRequest):
+        result = await self.audit_store.get(audit_id)
+        if result is None:
             raise HTTPException(status_code=404, detail="Audit not found")
-        return self.audit_results[audit_id]
+        sections = await self.audit_store.get_sections(audit_id)
+        # The stored audit is immutable and cached as such, the scenario is only returned
+        content, _ = apply_scenario(result, sections, scenario)
+        return Response(content=content, media_type="application/json")
+
+    async def list_audits(
+        self,
+        website_url: str,
+        cursor: Optional[str] = None,
+        limit: int = Query(20, ge=1, le=100),
+    ):
+        try:
+            return await list_audit_history(
+                self.audit_store.audit_repository, website_url, cursor, limit
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    async def export_audits(
+        self,
+        format: ExportFormat = "ndjson",
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ):
+        pages = iter_export_pages(
+            self.audit_store.audit_repository,
+            settings.audit.EXPORT_PAGE_SIZE,
+            since=since,
+            until=until,
+        )
+        return StreamingResponse(
+            export_audits(pages, format),
+            media_type=EXPORT_MEDIA_TYPES[format],
+            headers={"Content-Disposition": f'attachment; filename="audits.{format}"'},
+        )
+
+    async def get_audit_result(self, request: Request, audit_id: str):
+        job = await self.cro_audit_service.get_job(audit_id)
+        if job is not None and job.status != JobStatus.DONE:
+            status_code = 500 if job.status == JobStatus.FAILED else 202
+            return JSONResponse(status_code=status_code, content=job.model_dump(mode="json"))
+        # Stored audits are immutable: serve the cached bytes, skipping response_model
+        # validation, serialization and the gzip middleware
+        encoded = await self.audit_store.get_encoded(audit_id)
+        if encoded is None:
+            raise HTTPException(status_code=404, detail="Audit not found")
+        return encoded.response(request.headers)
+
+    async def submit_contact_info(self, contact: LeadCreate, audit_id: str):
+        """Capture a lead for an audit; it is written to the database in the next batch."""
+        if (
+            await self.cro_audit_service.get_job(audit_id) is None
+            and await self.audit_store.get(audit_id) is None
+        ):
+            raise HTTPException(status_code=404, detail="Audit not found")
+        lead = Lead(audit_id=audit_id, **contact.model_dump())
+        lead_buffer.put(lead)
+        return {
+            "message": "Contact information received",
+            "status": "success",
+            "lead_id": lead.lead_id,
+            "next_steps": "Detailed report will be sent within 24 hours",
+        }
+
+    async def get_industry_benchmark(
+        self,
+        industry: str,
+        conversion_rate: Optional[float] = None,
+        average_order_value: Optional[float] = None,
+    ):
+        index = get_benchmark_index()
+        if index is None:
+            raise HTTPException(status_code=503, detail="Industry benchmarks are unavailable")
+        benchmark = index.summary(industry)
+        ranks = {"conversion_rate": conversion_rate, "average_order_value": average_order_value}
+        benchmark["percentile_ranks"] = {
+            metric: index.percentile_rank(industry, metric, value)
+            for metric, value in ranks.items()
+            if value is not None
+        }
+        return benchmark
+
+    async def get_metrics(self):
+        return self.cro_audit_service.metrics()
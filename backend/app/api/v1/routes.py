@@ -1,24 +1,48 @@
 from fastapi import APIRouter, Depends
 
 from app.api.v1.endpoints import UserRouter, AuthRouter, CROAuditRouter
+from app.core.config import settings
 from app.core.db import postgres_db
+from app.core.fetcher import site_fetcher
+from app.core.jobs import job_queue
 from app.core.security.dependencies import protected_auth
-from app.repositories import UserRepository, ProfileRepository, ResetPasswordRepository
-from app.services import UserService, AuthService
+from app.core.shared_cache import shared_cache
+from app.repositories import (
+    AuditRepository,
+    UserRepository,
+    ProfileRepository,
+    ResetPasswordRepository,
+)
+from app.services import AuditStore, CROAuditService, UserService, AuthService
 
 
 def create_api_router() -> APIRouter:
     api_router = APIRouter()
-    user_repository = UserRepository(postgres_db.client)
-    profile_repository = ProfileRepository(postgres_db.client)
-    reset_password_repository = ResetPasswordRepository(postgres_db.client)
+    user_repository = UserRepository(postgres_db)
+    profile_repository = ProfileRepository(postgres_db)
+    reset_password_repository = ResetPasswordRepository(postgres_db)
+    audit_repository = AuditRepository(postgres_db)
 
     auth_service = AuthService(user_repository, profile_repository, reset_password_repository)
     user_service = UserService(user_repository)
+    audit_store = AuditStore(
+        audit_repository,
+        hot_cache_size=settings.audit.HOT_CACHE_SIZE,
+        encoded_cache_size=settings.audit.ENCODED_CACHE_SIZE,
+        shared_cache=shared_cache,
+    )
+    cro_audit_service = CROAuditService(
+        audit_store,
+        job_queue,
+        deterministic=settings.audit.DETERMINISTIC_MODE,
+        memo_size=settings.audit.MEMO_SIZE,
+        memo_ttl=settings.audit.MEMO_TTL_SECONDS,
+        site_fetcher=site_fetcher if settings.fetcher.ENABLED else None,
+    )
 
     auth_router = AuthRouter(auth_service)
     user_router = UserRouter(user_service)
-    cro_audit_router = CROAuditRouter()
+    cro_audit_router = CROAuditRouter(cro_audit_service)
 
     api_router.include_router(auth_router.router, prefix="/auth", tags=["Authentication"])
     api_router.include_router(
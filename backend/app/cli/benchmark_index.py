@@ -0,0 +1,56 @@
+"""
+Rebuild or inspect the memory-mapped industry benchmark index.
+
+    python -m app.cli.benchmark_index build --summary app/data/industry_benchmarks.csv
+    python -m app.cli.benchmark_index build --observations sites.csv --output /srv/index.bin
+    python -m app.cli.benchmark_index show ecommerce
+
+Running workers keep their current mapping; restart them to pick up a rebuilt file.
+"""
+
+import argparse
+import json
+from pathlib import Path
+from typing import List, Optional
+
+from app.services.industry_benchmarks import (
+    DEFAULT_INDEX_PATH,
+    IndustryBenchmarkIndex,
+    build_benchmark_index,
+    read_observations_csv,
+    read_summary_csv,
+)
+
+DEFAULT_SUMMARY_PATH = DEFAULT_INDEX_PATH.with_suffix(".csv")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser("build", help="pack a CSV source into an index file")
+    source = build.add_mutually_exclusive_group()
+    source.add_argument("--summary", type=Path, help="industry,metric,sample_size,p5..p95 rows")
+    source.add_argument("--observations", type=Path, help="industry,conversion_rate,aov rows")
+    build.add_argument("--output", type=Path, default=DEFAULT_INDEX_PATH)
+
+    show = commands.add_parser("show", help="print the percentiles of one or all industries")
+    show.add_argument("industry", nargs="?")
+    show.add_argument("--index", type=Path, default=DEFAULT_INDEX_PATH)
+
+    args = parser.parse_args(argv)
+    if args.command == "build":
+        if args.observations:
+            industries = read_observations_csv(args.observations)
+        else:
+            industries = read_summary_csv(args.summary or DEFAULT_SUMMARY_PATH)
+        count = build_benchmark_index(industries, args.output)
+        print(f"Wrote {count} industries to {args.output} ({args.output.stat().st_size} bytes)")
+    else:
+        index = IndustryBenchmarkIndex(args.index)
+        industries = [args.industry] if args.industry else index.industries
+        print(json.dumps([index.summary(industry) for industry in industries], indent=2))
+
+
+if __name__ == "__main__":
+    main()
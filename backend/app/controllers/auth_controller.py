@@ -6,8 +6,10 @@ from fastapi import BackgroundTasks, Depends, Response
 from app.core.config import settings
 from app.core.monitoring.decorators import monitor_transaction
 from app.core.security.dependencies import refresh_auth
+from app.core.security.hashing import password_hasher
 from app.models.domain import SignupRequest
 from app.schemas import (
+    BaseResponse,
     MagicLinkRequest,
     ResetPasswordRequest,
     ResetPasswordResponse,
@@ -172,3 +174,11 @@ class AuthController:
         return ResetPasswordResponse(
             message="Password reset successfully", status_code=HTTPStatus.OK, data=None
         )
+
+    @monitor_transaction(op="api.auth.metrics", tags={"endpoint": "auth->metrics"})
+    async def get_metrics(self) -> BaseResponse:
+        return BaseResponse(
+            message="Auth metrics fetched successfully",
+            status_code=HTTPStatus.OK,
+            data={"password_hashing": password_hasher.metrics()},
+        )
@@ -0,0 +1,70 @@
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+CacheKey = TypeVar("CacheKey", bound=Hashable)
+CacheValue = TypeVar("CacheValue")
+
+
+class LRUCache(Generic[CacheKey, CacheValue]):
+    """
+    Bounded in-process least-recently-used cache with optional expiry.
+
+    Args:
+        max_size: Maximum number of entries kept before the oldest one is evicted.
+        ttl: Optional lifetime of an entry in seconds, checked lazily on read.
+    """
+
+    def __init__(self, max_size: int, ttl: Optional[float] = None):
+        if max_size <= 0:
+            raise ValueError("max_size must be a positive integer")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[CacheKey, Tuple[float, CacheValue]] = OrderedDict()
+
+    def get(self, key: CacheKey) -> Optional[CacheValue]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at and expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: CacheKey, value: CacheValue, ttl: Optional[float] = None) -> None:
+        ttl = ttl if ttl is not None else self.ttl
+        expires_at = time.monotonic() + ttl if ttl else 0.0
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: CacheKey) -> Optional[CacheValue]:
+        entry = self._entries.pop(key, None)
+        return entry[1] if entry else None
+
+    def pop_where(self, predicate: Callable[[CacheValue], bool]) -> int:
+        """Drop every entry whose value matches, returns how many were dropped."""
+        keys = [key for key, (_, value) in self._entries.items() if predicate(value)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
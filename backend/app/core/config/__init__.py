@@ -1,11 +1,14 @@
 from pydantic_settings import BaseSettings
 
 from .application import ApplicationSettings
+from .audit import AuditSettings
 from .aws import AWSSettings
 from .cache import CacheSettings
 from .database import DatabaseSettings
 from .email import EmailSettings
+from .fetcher import FetcherSettings
 from .logging import LoggingSettings
+from .retention import RetentionSettings
 from .security import SecuritySettings
 
 
@@ -17,6 +20,9 @@ class Settings(BaseSettings):
     cache: CacheSettings = CacheSettings()
     email: EmailSettings = EmailSettings()
     aws: AWSSettings = AWSSettings()
+    audit: AuditSettings = AuditSettings()
+    fetcher: FetcherSettings = FetcherSettings()
+    retention: RetentionSettings = RetentionSettings()
 
     class Config:
         case_sensitive = True
@@ -0,0 +1,48 @@
+from typing import Optional
+
+from pydantic_settings import BaseSettings
+
+
+class AuditSettings(BaseSettings):
+    # Storage Settings
+    HOT_CACHE_SIZE: int = 1024  # audits kept in the in-process LRU tier
+    ENCODED_CACHE_SIZE: int = 1024  # serialized and precompressed audit responses
+
+    # Export Settings
+    EXPORT_PAGE_SIZE: int = 1000  # audits fetched per keyset page of a bulk export
+
+    # Lead Capture Settings
+    LEAD_BATCH_SIZE: int = 500  # leads per multi-row insert
+    LEAD_FLUSH_INTERVAL_SECONDS: float = 1.0  # longest a lead waits for a batch to fill
+    LEAD_BUFFER_SIZE: int = 50000  # pending leads before submissions are rejected
+
+    # Pipeline Settings
+    DETERMINISTIC_MODE: bool = True  # seed each audit from its normalized request
+    MEMO_SIZE: int = 4096
+    MEMO_TTL_SECONDS: int = 3600
+
+    # Job Queue Settings
+    JOB_WORKERS: int = 8  # asyncio tasks draining the queue
+    JOB_PROCESS_WORKERS: int = 2  # processes for CPU-bound pipeline work, 0 runs it in a thread
+    JOB_MAX_QUEUE_SIZE: int = 1000
+    JOB_STORE_SIZE: int = 10000
+
+    # Batch Analysis Settings
+    BATCH_MAX_SITES: int = 1000
+
+    # Industry Benchmark Settings
+    BENCHMARK_INDEX_PATH: Optional[str] = None  # defaults to app/data/industry_benchmarks.bin
+
+    # Issue Catalog Settings
+    CATALOG_PATH: Optional[str] = None  # defaults to app/data/cro_catalog.json
+    CATALOG_RELOAD_SECONDS: float = 1.0  # file change check interval, negative disables reload
+
+    # Fix Prioritization Settings
+    FIX_PLAN_MAX_ISSUES: int = 2000
+
+    # Revenue Scenario Settings
+    SCENARIO_GRID_MAX_VALUES: int = 2_000_000  # cells x metrics in an npz response
+    SCENARIO_GRID_MAX_JSON_VALUES: int = 100_000  # as nested lists every value is a Python float
+
+    class Config:
+        env_prefix = "AUDIT_"
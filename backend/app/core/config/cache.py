@@ -27,5 +27,11 @@ class CacheSettings(BaseSettings):
     REDIS_POOL_MIN_SIZE: int = 1
     REDIS_POOL_MAX_SIZE: int = 10
 
+    # Node-local Shared Cache Settings, one SQLite file read by every worker on the host
+    SHARED_ENABLED: bool = True
+    SHARED_PATH: Optional[str] = None  # defaults to cro-audit-cache.sqlite3 in the temp dir
+    SHARED_MAX_BYTES: int = 256 * 1024 * 1024
+    SHARED_BUSY_TIMEOUT: float = 0.05  # seconds a write waits for another worker's lock
+
     class Config:
         env_prefix = "CACHE_"
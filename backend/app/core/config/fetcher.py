@@ -0,0 +1,24 @@
+from pydantic_settings import BaseSettings
+
+
+class FetcherSettings(BaseSettings):
+    # General Fetcher Settings
+    ENABLED: bool = True  # fetch the audited page, otherwise audits use catalog draws only
+    USER_AGENT: str = "CROAuditBot/1.0 (+https://cro-audit.app/bot)"
+    ALLOW_PRIVATE_HOSTS: bool = False  # allow loopback/private targets, for local fixtures only
+
+    # Connection Pool Settings
+    MAX_CONNECTIONS: int = 100  # global in-flight requests
+    MAX_CONNECTIONS_PER_HOST: int = 6
+    MAX_KEEPALIVE_CONNECTIONS: int = 50
+    KEEPALIVE_EXPIRY: float = 30.0
+
+    # Limits
+    CONNECT_TIMEOUT: float = 5.0
+    READ_TIMEOUT: float = 10.0
+    TOTAL_TIMEOUT: float = 20.0  # wall clock budget of one fetch including redirects
+    MAX_RESPONSE_BYTES: int = 5 * 1024 * 1024
+    MAX_REDIRECTS: int = 5
+
+    class Config:
+        env_prefix = "FETCH_"
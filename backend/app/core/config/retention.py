@@ -0,0 +1,18 @@
+from typing import Optional
+
+from pydantic_settings import BaseSettings
+
+
+class RetentionSettings(BaseSettings):
+    # Sweeper Settings
+    ENABLED: bool = True  # off when partitions are managed outside the app
+    SWEEP_INTERVAL_SECONDS: float = 3600.0
+    RETRY_SECONDS: float = 30.0  # delay after a failed sweep, e.g. before the schema exists
+
+    # Audit Partition Settings
+    AUDIT_DAYS: Optional[int] = 365  # audits older than this are expired, None keeps them all
+    AUDIT_PARTITIONS_AHEAD: int = 2  # monthly partitions created beyond the current one
+    AUDIT_ARCHIVE: bool = False  # detach expired partitions as standalone tables, not drop them
+
+    class Config:
+        env_prefix = "RETENTION_"
@@ -13,11 +13,20 @@ class SecuritySettings(BaseSettings):
     VERIFICATION_TOKEN_EXPIRE_MINUTES: int = 10
     RESET_PASSWORD_OTP_EXPIRE_MINUTES: int = 1
     COOKIE_SECURE: bool = False
+    VERIFIED_TOKEN_CACHE_SIZE: int = 10000  # verified access tokens kept until exp, 0 disables
+    TOKEN_VERSION_CACHE_SIZE: int = 10000  # users whose current token version is cached
+    TOKEN_VERSION_CACHE_TTL_SECONDS: float = 30.0  # how late workers on other hosts see a rotation
 
     # Password Settings
     PASSWORD_MIN_LENGTH: int = 8
     PASSWORD_MAX_LENGTH: int = 50
     PASSWORD_REGEX: str = r"^(?=.*[A-Za-z])(?=.*\d)[A-Za-z\d]{8,}$"
+    PASSWORD_HASH_ROUNDS: Optional[int] = None  # fixed bcrypt cost, skips calibration
+    PASSWORD_HASH_TARGET_SECONDS: float = 0.25  # calibrated cost keeps one hash within this
+    PASSWORD_HASH_MIN_ROUNDS: int = 10
+    PASSWORD_HASH_MAX_ROUNDS: int = 15
+    PASSWORD_HASH_WORKERS: int = 2  # threads running bcrypt off the event loop
+    PASSWORD_HASH_MAX_PENDING: int = 16  # hashes queued or running before sign-ins get 503
 
     # Authentication Settings
     AUTH_HEADER_NAME: str = "Authorization"
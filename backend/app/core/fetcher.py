@@ -0,0 +1,259 @@
+import asyncio
+import ipaddress
+import logging
+import socket
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Iterable, List, Optional
+
+import httpcore
+import httpx
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+
+class FetchedPage(BaseModel):
+    url: str
+    final_url: Optional[str] = None
+    status_code: Optional[int] = None
+    content_type: Optional[str] = None
+    content: bytes = b""
+    truncated: bool = False
+    elapsed: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.status_code is not None and self.status_code < 400
+
+
+class BlockedHostError(httpx.RequestError):
+    pass
+
+
+def is_public_address(host: str) -> bool:
+    """Whether `host` is a global IP address; scoped IPv6 is judged without its zone."""
+    try:
+        return ipaddress.ip_address(host.split("%", 1)[0]).is_global
+    except ValueError:
+        return False
+
+
+class PublicHostBackend(httpcore.AsyncNetworkBackend):
+    """
+    Network backend that only opens TCP connections to public addresses.
+
+    The host is resolved once and the socket connects to one of the checked addresses, so
+    a name cannot pass the check and then resolve to a private address for the connection
+    (DNS rebinding). TLS still verifies against the hostname, httpcore passes it as SNI.
+    """
+
+    def __init__(self) -> None:
+        self._backend = httpcore.AnyIOBackend()
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+        socket_options: Optional[Iterable] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        try:
+            addresses = await asyncio.get_running_loop().getaddrinfo(
+                host, port, type=socket.SOCK_STREAM
+            )
+        except socket.gaierror as e:
+            raise BlockedHostError(f"Cannot resolve {host}: {e}")
+        if not addresses:
+            raise BlockedHostError(f"Cannot resolve {host}")
+        checked = []
+        for *_, sockaddr in addresses:
+            if not is_public_address(sockaddr[0]):
+                raise BlockedHostError(f"{host} resolves to non-public {sockaddr[0]}")
+            checked.append(sockaddr[0])
+        for address in dict.fromkeys(checked):
+            try:
+                return await self._backend.connect_tcp(
+                    address,
+                    port,
+                    timeout=timeout,
+                    local_address=local_address,
+                    socket_options=socket_options,
+                )
+            except httpcore.ConnectError as e:
+                error = e
+        raise error
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+class PublicHostTransport(httpx.AsyncHTTPTransport):
+    """`httpx.AsyncHTTPTransport` whose connections go through `PublicHostBackend`."""
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        # httpx has no option for the network backend, swap it on the pool it built
+        self._pool._network_backend = PublicHostBackend()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        try:
+            return await super().handle_async_request(request)
+        except BlockedHostError as e:
+            e.request = request
+            raise
+
+
+class SiteFetcher:
+    """
+    Shared async HTTP client used to retrieve audited pages.
+
+    One `httpx.AsyncClient` keeps a keep-alive connection pool for the whole process. A
+    global semaphore bounds in-flight fetches and a per-host semaphore stops a single site
+    from taking every slot. Each fetch has connect/read timeouts, a wall clock budget and
+    a body size cap; failures are reported on the returned page instead of raised.
+    """
+
+    def __init__(self) -> None:
+        self._client: Optional[httpx.AsyncClient] = None
+        self._global_slots: Optional[asyncio.Semaphore] = None
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+        self._host_users: Dict[str, int] = {}
+        self.max_connections_per_host = 6
+        self.max_response_bytes = 5 * 1024 * 1024
+        self.total_timeout = 20.0
+        self.allow_private_hosts = False
+        self._fetched = 0
+        self._failed = 0
+        self._truncated = 0
+        self._bytes = 0
+        self._in_flight = 0
+
+    @property
+    def started(self) -> bool:
+        return self._client is not None
+
+    async def start(
+        self,
+        max_connections: int = 100,
+        max_connections_per_host: int = 6,
+        max_keepalive_connections: int = 50,
+        keepalive_expiry: float = 30.0,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 10.0,
+        total_timeout: float = 20.0,
+        max_response_bytes: int = 5 * 1024 * 1024,
+        max_redirects: int = 5,
+        user_agent: str = "CROAuditBot/1.0",
+        allow_private_hosts: bool = False,
+    ) -> None:
+        if self._client is not None:
+            return
+        self.max_connections_per_host = max_connections_per_host
+        self.max_response_bytes = max_response_bytes
+        self.total_timeout = total_timeout
+        self.allow_private_hosts = allow_private_hosts
+        self._global_slots = asyncio.Semaphore(max_connections)
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        # Every connection, redirect hops included, is checked against the address it opens
+        transport_class = httpx.AsyncHTTPTransport if allow_private_hosts else PublicHostTransport
+        self._client = httpx.AsyncClient(
+            transport=transport_class(limits=limits),
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+            follow_redirects=True,
+            max_redirects=max_redirects,
+            headers={"User-Agent": user_agent, "Accept": "text/html,*/*;q=0.8"},
+        )
+        logger.info(
+            "Site fetcher started",
+            extra={"max_connections": max_connections, "per_host": max_connections_per_host},
+        )
+
+    async def stop(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        logger.info("Site fetcher stopped")
+
+    async def fetch(self, url: str) -> FetchedPage:
+        if self._client is None:
+            raise RuntimeError("Site fetcher is not running")
+        host = httpx.URL(url).host
+        page = FetchedPage(url=url)
+        # Wait for the host first so a busy site does not hold global slots while queued
+        async with self._host_slot(host), self._global_slots:
+            started_at = time.perf_counter()
+            self._in_flight += 1
+            try:
+                async with asyncio.timeout(self.total_timeout):
+                    await self._read(url, page)
+            except TimeoutError:
+                page.error = "Timed out"
+            except httpx.HTTPError as e:
+                page.error = f"{type(e).__name__}: {e}"
+            finally:
+                self._in_flight -= 1
+                page.elapsed = time.perf_counter() - started_at
+        self._record(page)
+        return page
+
+    async def fetch_many(self, urls: Iterable[str]) -> List[FetchedPage]:
+        return list(await asyncio.gather(*(self.fetch(url) for url in urls)))
+
+    def metrics(self) -> Dict[str, int]:
+        return {
+            "in_flight": self._in_flight,
+            "fetched": self._fetched,
+            "failed": self._failed,
+            "truncated": self._truncated,
+            "bytes": self._bytes,
+        }
+
+    async def _read(self, url: str, page: FetchedPage) -> None:
+        async with self._client.stream("GET", url) as response:
+            page.final_url = str(response.url)
+            page.status_code = response.status_code
+            page.content_type = response.headers.get("content-type")
+            body = bytearray()
+            async for chunk in response.aiter_bytes():
+                body += chunk
+                if len(body) >= self.max_response_bytes:
+                    # Stop reading, closing the stream drops the rest of the body
+                    del body[self.max_response_bytes :]
+                    page.truncated = True
+                    break
+            page.content = bytes(body)
+
+    def _record(self, page: FetchedPage) -> None:
+        if page.error is None:
+            self._fetched += 1
+        else:
+            self._failed += 1
+            logger.warning(f"Fetching {page.url} failed: {page.error}")
+        self._truncated += page.truncated
+        self._bytes += len(page.content)
+
+    @asynccontextmanager
+    async def _host_slot(self, host: str) -> AsyncIterator[None]:
+        slots = self._host_slots.get(host)
+        if slots is None:
+            slots = self._host_slots[host] = asyncio.Semaphore(self.max_connections_per_host)
+        self._host_users[host] = self._host_users.get(host, 0) + 1
+        try:
+            async with slots:
+                yield
+        finally:
+            self._host_users[host] -= 1
+            # Forget idle hosts so the table does not grow with every audited site
+            if not self._host_users[host]:
+                del self._host_users[host]
+                del self._host_slots[host]
+
+
+site_fetcher = SiteFetcher()
@@ -0,0 +1,239 @@
+import codecs
+import re
+import time
+from functools import lru_cache
+from html.parser import HTMLParser
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from pydantic import BaseModel
+
+# Tags whose content is code rather than page text
+RAW_TEXT_TAGS = frozenset({"script", "style", "noscript", "template"})
+# Text kept from the previous chunk so patterns still match across chunk boundaries
+TEXT_OVERLAP = 64
+
+
+class PageRule:
+    """
+    Declarative rule evaluated by `HTMLRuleEngine`.
+
+    A rule subscribes to start tags (`tags`, empty for every tag) optionally filtered by an
+    `attributes` pattern, and/or to a `text` pattern searched in visible page text. Every
+    matching event is a hit. In "missing" mode the rule fires when fewer than `threshold`
+    hits were seen, in "excess" mode when more than `threshold` were seen; either way the
+    rule stops receiving events as soon as its outcome is settled.
+
+    Patterns must be lowercase: they run against lowercased input, which is several times
+    faster than case-insensitive matching. Attribute patterns see a `name=value name=value`
+    rendering of the tag attributes, so `^(?!.*loading=lazy)` matches tags without lazy
+    loading.
+    """
+
+    def __init__(
+        self,
+        issue: str,
+        tags: Iterable[str] = (),
+        attributes: Optional[str] = None,
+        text: Optional[str] = None,
+        mode: Literal["missing", "excess"] = "missing",
+        threshold: int = 1,
+    ):
+        if attributes is None and text is None and not tags:
+            raise ValueError(f"Rule '{issue}' does not subscribe to any event")
+        self.issue = issue
+        self.tags: FrozenSet[str] = frozenset(tag.lower() for tag in tags)
+        self.attributes = re.compile(attributes, re.DOTALL) if attributes else None
+        self.text = re.compile(text, re.DOTALL) if text else None
+        self.mode = mode
+        self.threshold = threshold
+        self.watches_tags = bool(self.tags) or self.attributes is not None
+
+    def settled(self, hits: int) -> bool:
+        return hits >= self.threshold if self.mode == "missing" else hits > self.threshold
+
+    def fires(self, hits: int) -> bool:
+        return hits < self.threshold if self.mode == "missing" else hits > self.threshold
+
+
+class RuleEngineResult(BaseModel):
+    issues: List[str]
+    hits: Dict[str, int]
+    rule_cpu_seconds: Dict[str, float]
+    parse_cpu_seconds: float
+    bytes_scanned: int
+
+
+class HTMLRuleEngine:
+    """
+    Evaluate many `PageRule`s over one incremental parse of a page.
+
+    The page is decoded and fed to a single `HTMLParser` in fixed-size chunks, and every
+    start tag or text event is dispatched only to the rules subscribed to it. Working
+    memory is bounded by the chunk size rather than the page size, and the CPU time
+    spent inside each rule is measured separately from parsing.
+    """
+
+    def __init__(self, rules: Sequence[PageRule], chunk_size: int = 64 * 1024):
+        self.rules = list(rules)
+        self.chunk_size = chunk_size
+        self.tag_rules: Dict[str, Tuple[int, ...]] = {}
+        self.any_tag_rules: Tuple[int, ...] = tuple(
+            index for index, rule in enumerate(self.rules) if rule.watches_tags and not rule.tags
+        )
+        self.text_rules: Tuple[int, ...] = tuple(
+            index for index, rule in enumerate(self.rules) if rule.text is not None
+        )
+        for index, rule in enumerate(self.rules):
+            for tag in rule.tags:
+                self.tag_rules[tag] = self.tag_rules.get(tag, ()) + (index,)
+
+    def run(self, content: bytes, encoding: Optional[str] = None) -> RuleEngineResult:
+        return self.run_chunks(self._chunks(content), encoding)
+
+    def run_chunks(
+        self, chunks: Iterable[bytes], encoding: Optional[str] = None
+    ) -> RuleEngineResult:
+        scan = _RuleScan(self)
+        started_at = time.thread_time_ns()
+        decoder = codecs.getincrementaldecoder(_codec(encoding))(errors="replace")
+        scanned = 0
+        for chunk in chunks:
+            scanned += len(chunk)
+            scan.feed(decoder.decode(chunk))
+            if scan.all_settled():
+                break
+        scan.feed(decoder.decode(b"", final=True))
+        scan.close()
+        total_ns = time.thread_time_ns() - started_at
+
+        rule_ns = sum(scan.cpu_ns)
+        return RuleEngineResult(
+            issues=[rule.issue for rule, hits in zip(self.rules, scan.hits) if rule.fires(hits)],
+            hits={rule.issue: hits for rule, hits in zip(self.rules, scan.hits)},
+            rule_cpu_seconds={
+                rule.issue: cpu_ns / 1e9 for rule, cpu_ns in zip(self.rules, scan.cpu_ns)
+            },
+            parse_cpu_seconds=max(total_ns - rule_ns, 0) / 1e9,
+            bytes_scanned=scanned,
+        )
+
+    def _chunks(self, content: bytes) -> Iterator[bytes]:
+        view = memoryview(content)
+        for offset in range(0, len(view), self.chunk_size):
+            yield view[offset : offset + self.chunk_size]
+
+
+class _RuleScan(HTMLParser):
+    def __init__(self, engine: HTMLRuleEngine):
+        super().__init__(convert_charrefs=True)
+        self.engine = engine
+        self.rules = engine.rules
+        self.hits = [0] * len(self.rules)
+        self.cpu_ns = [0] * len(self.rules)
+        self.done = [False] * len(self.rules)
+        self.pending = len(self.rules)
+        self.raw_text_depth = 0
+        self.text_tail = ""
+        self._build_dispatch()
+
+    def all_settled(self) -> bool:
+        return self.pending == 0
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag in RAW_TEXT_TAGS:
+            self.raw_text_depth += 1
+        indexes, gate = self.tag_dispatch.get(tag, self.any_tag_dispatch)
+        if not indexes:
+            return
+        attribute_text = " ".join(f"{name}={value or ''}" for name, value in attrs).lower()
+        if gate is not None and not gate.search(attribute_text):
+            return
+        for index in indexes:
+            if self.done[index]:
+                continue
+            started_at = time.thread_time_ns()
+            pattern = self.rules[index].attributes
+            if pattern is None or pattern.search(attribute_text):
+                self._hit(index)
+            self.cpu_ns[index] += time.thread_time_ns() - started_at
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in RAW_TEXT_TAGS and self.raw_text_depth:
+            self.raw_text_depth -= 1
+
+    def handle_data(self, data: str) -> None:
+        if self.raw_text_depth or data.isspace():
+            return
+        text = self.text_tail + data.lower()
+        self.text_tail = text[-TEXT_OVERLAP:]
+        indexes, gate = self.text_dispatch
+        if not indexes or not gate.search(text):
+            return
+        for index in indexes:
+            if self.done[index]:
+                continue
+            started_at = time.thread_time_ns()
+            if self.rules[index].text.search(text):
+                self._hit(index)
+            self.cpu_ns[index] += time.thread_time_ns() - started_at
+
+    def _hit(self, index: int) -> None:
+        self.hits[index] += 1
+        if self.rules[index].settled(self.hits[index]):
+            self.done[index] = True
+            self.pending -= 1
+            self._build_dispatch()
+
+    def _build_dispatch(self) -> None:
+        """
+        Route each event to the rules still waiting for it.
+
+        Every route carries a gate, one combined pattern of its rules, so the common event
+        that interests no rule costs a single regex search instead of one per rule.
+        """
+        active = [not done for done in self.done]
+        any_tag = [index for index in self.engine.any_tag_rules if active[index]]
+        self.any_tag_dispatch = self._attribute_route(any_tag)
+        self.tag_dispatch = {
+            tag: self._attribute_route([index for index in indexes if active[index]] + any_tag)
+            for tag, indexes in self.engine.tag_rules.items()
+        }
+        text = tuple(index for index in self.engine.text_rules if active[index])
+        self.text_dispatch = (
+            text,
+            _combined_pattern(tuple(self.rules[index].text.pattern for index in text)),
+        )
+
+    def _attribute_route(self, indexes: List[int]) -> Tuple[Tuple[int, ...], Optional[re.Pattern]]:
+        patterns = [self.rules[index].attributes for index in indexes]
+        if any(pattern is None for pattern in patterns):
+            # A rule without an attribute filter hits on every matching tag
+            return tuple(indexes), None
+        return tuple(indexes), _combined_pattern(tuple(pattern.pattern for pattern in patterns))
+
+
+@lru_cache(maxsize=256)
+def _combined_pattern(patterns: Tuple[str, ...]) -> re.Pattern:
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.DOTALL)
+
+
+def _codec(encoding: Optional[str]) -> str:
+    try:
+        return codecs.lookup(encoding or "utf-8").name
+    except LookupError:
+        return "utf-8"
+
+
+def charset_from_content_type(content_type: Optional[str]) -> Optional[str]:
+    match = re.search(r"charset=[\"']?([\w.:-]+)", content_type or "", re.IGNORECASE)
+    return match.group(1) if match else None
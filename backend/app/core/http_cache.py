@@ -0,0 +1,100 @@
+import gzip
+import hashlib
+from typing import Dict, Mapping, Optional, Set
+
+from fastapi.responses import Response
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, responses fall back to gzip
+    brotli = None
+
+# Stored audits never change, so clients and proxies may keep them for a year
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Preferred first when the client accepts several
+PRECOMPRESSED_ENCODINGS = ("br", "gzip")
+
+
+def accepted_encodings(accept_encoding: str) -> Set[str]:
+    """Content codings an Accept-Encoding header allows, leaving out the ones with q=0."""
+    encodings = set()
+    for item in accept_encoding.lower().split(","):
+        coding, _, quality = (part.strip() for part in item.partition(";"))
+        if quality.startswith("q="):
+            try:
+                if float(quality[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        if coding:
+            encodings.add(coding)
+    return encodings
+
+
+def etag_matches(if_none_match: str, etags: Set[str]) -> bool:
+    """Weak comparison, as If-None-Match requires."""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") in etags:
+            return True
+    return False
+
+
+class EncodedBody:
+    """
+    Immutable response body serialized once and kept in every content coding.
+
+    Each coding is its own representation with its own strong ETag, derived from the
+    identity bytes. Serving picks a coding from Accept-Encoding and returns the stored
+    bytes as is, and a conditional request whose If-None-Match names any of the
+    representations gets a 304 without the body being looked at.
+    """
+
+    def __init__(
+        self, content: bytes, media_type: str = "application/json", brotli_quality: int = 11
+    ):
+        self.media_type = media_type
+        digest = hashlib.sha256(content).hexdigest()[:32]
+        self.bodies: Dict[str, bytes] = {"identity": content}
+        compressed = {"gzip": gzip.compress(content, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            compressed["br"] = brotli.compress(content, quality=brotli_quality)
+        for coding, body in compressed.items():
+            # Tiny bodies can grow when compressed
+            if len(body) < len(content):
+                self.bodies[coding] = body
+        self.etags: Dict[str, str] = {
+            coding: f'"{digest}"' if coding == "identity" else f'"{digest}-{coding}"'
+            for coding in self.bodies
+        }
+        self.etag_set = set(self.etags.values())
+
+    @property
+    def size(self) -> int:
+        return sum(len(body) for body in self.bodies.values())
+
+    def negotiate(self, accept_encoding: str) -> str:
+        accepted = accepted_encodings(accept_encoding)
+        for coding in PRECOMPRESSED_ENCODINGS:
+            if coding in self.bodies and (coding in accepted or "*" in accepted):
+                return coding
+        return "identity"
+
+    def response(self, headers: Mapping[str, str], status_code: int = 200) -> Response:
+        coding = self.negotiate(headers.get("accept-encoding", ""))
+        response_headers = {
+            "ETag": self.etags[coding],
+            "Cache-Control": IMMUTABLE_CACHE_CONTROL,
+            "Vary": "Accept-Encoding",
+        }
+        if_none_match: Optional[str] = headers.get("if-none-match")
+        if if_none_match and etag_matches(if_none_match, self.etag_set):
+            return Response(status_code=304, headers=response_headers)
+        if coding != "identity":
+            response_headers["Content-Encoding"] = coding
+        return Response(
+            content=self.bodies[coding],
+            status_code=status_code,
+            media_type=self.media_type,
+            headers=response_headers,
+        )
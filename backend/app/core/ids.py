@@ -0,0 +1,37 @@
+import os
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Optional
+
+UNIX_EPOCH = datetime(1970, 1, 1)
+
+
+def time_ordered_id() -> str:
+    """
+    A random UUID in the version 7 layout, led by its creation time in Unix milliseconds.
+
+    Audits are stored with that time as their `created_at`, so a point read can recover
+    the row's monthly partition from the id alone, see `id_created_at`.
+    """
+    milliseconds = time.time_ns() // 1_000_000
+    random_bits = int.from_bytes(os.urandom(10), "big")
+    value = (
+        milliseconds << 80
+        | 0x7 << 76
+        | (random_bits >> 62 & 0xFFF) << 64
+        | 0b10 << 62
+        | random_bits & ((1 << 62) - 1)
+    )
+    return str(uuid.UUID(int=value))
+
+
+def id_created_at(value: str) -> Optional[datetime]:
+    """The naive UTC creation time of a `time_ordered_id`, None for any other id."""
+    try:
+        parsed = uuid.UUID(value)
+    except ValueError:
+        return None
+    if parsed.version != 7:
+        return None
+    return UNIX_EPOCH + timedelta(milliseconds=parsed.int >> 80)
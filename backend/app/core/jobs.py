@@ -0,0 +1,199 @@
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from enum import Enum
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from app.core.cache import LRUCache
+from app.core.exceptions import ServiceException
+from app.core.ids import time_ordered_id
+from app.core.shared_cache import SharedCache
+from app.core.write_behind import WriteBehindBuffer
+
+logger = logging.getLogger(__name__)
+
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class Job(BaseModel):
+    job_id: str = Field(default_factory=time_ordered_id)
+    status: JobStatus = JobStatus.QUEUED
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+
+
+JobWork = Callable[[Job], Awaitable[Any]]
+
+
+class JobQueue:
+    """
+    Bounded job queue drained by a pool of asyncio worker tasks.
+
+    Workers run the submitted coroutine on the event loop, which keeps I/O cheap, and
+    CPU-bound steps are pushed to a process pool through `run_cpu`. Job state lives in a
+    bounded store so callers can poll it by id after the request that created it returns.
+    With a shared cache, every state change is also published there so a job can be
+    polled through any worker on the host, not only the one running it. Publishing goes
+    through a write-behind buffer, which keeps SQLite off the event loop and writes the
+    changes in order.
+    """
+
+    SHARED_NAMESPACE = "job"
+    # Seconds a state change can take to reach the other workers
+    SHARED_PUBLISH_INTERVAL = 0.05
+
+    def __init__(self) -> None:
+        self.jobs: LRUCache[str, Job] = LRUCache(max_size=10000)
+        self.shared_cache: Optional[SharedCache] = None
+        self._published: WriteBehindBuffer[Tuple[str, bytes]] = WriteBehindBuffer("job states")
+        self._queue: Optional[asyncio.Queue[Tuple[Job, JobWork, float]]] = None
+        self._workers: list[asyncio.Task] = []
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._running = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._wait_time_total = 0.0
+        self._wait_time_max = 0.0
+
+    async def start(
+        self,
+        workers: int,
+        process_workers: int,
+        max_queue_size: int,
+        store_size: int,
+        shared_cache: Optional[SharedCache] = None,
+    ) -> None:
+        if self._workers:
+            return
+        self.jobs = LRUCache(max_size=store_size)
+        self.shared_cache = shared_cache
+        if shared_cache is not None:
+            await self._published.start(
+                self._publish_batch,
+                batch_size=500,
+                flush_interval=self.SHARED_PUBLISH_INTERVAL,
+                max_size=store_size,
+            )
+        self._queue = asyncio.Queue(maxsize=max_queue_size)
+        if process_workers > 0:
+            self._executor = ProcessPoolExecutor(
+                max_workers=process_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"job-worker-{index}")
+            for index in range(workers)
+        ]
+        logger.info(
+            "Job queue started",
+            extra={"workers": workers, "process_workers": process_workers},
+        )
+
+    async def stop(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        await self._published.stop()
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        logger.info("Job queue stopped")
+
+    def submit(self, work: JobWork, job: Optional[Job] = None) -> Job:
+        if self._queue is None:
+            raise ServiceException(message="Job queue is not running")
+        job = job or Job()
+        try:
+            self._queue.put_nowait((job, work, time.monotonic()))
+        except asyncio.QueueFull:
+            self._rejected += 1
+            raise ServiceException(message="Job queue is full, please retry shortly")
+        self.jobs.set(job.job_id, job)
+        self._publish(job)
+        return job
+
+    async def get(self, job_id: str) -> Optional[Job]:
+        job = self.jobs.get(job_id)
+        if job is None and self.shared_cache is not None:
+            content = await self.shared_cache.aget(self.SHARED_NAMESPACE, job_id)
+            if content is not None:
+                job = Job.model_validate_json(content)
+        return job
+
+    async def run_cpu(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a picklable CPU-bound callable in the process pool, or a thread without one."""
+        if self._executor is None:
+            return await asyncio.to_thread(func, *args, **kwargs)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    def metrics(self) -> Dict[str, Any]:
+        started = self._completed + self._failed + self._running
+        return {
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            "running": self._running,
+            "completed": self._completed,
+            "failed": self._failed,
+            "rejected": self._rejected,
+            "wait_time_avg_seconds": (self._wait_time_total / started) if started else 0.0,
+            "wait_time_max_seconds": self._wait_time_max,
+        }
+
+    async def _worker(self) -> None:
+        assert self._queue is not None
+        while True:
+            job, work, enqueued_at = await self._queue.get()
+            wait_time = time.monotonic() - enqueued_at
+            self._wait_time_total += wait_time
+            self._wait_time_max = max(self._wait_time_max, wait_time)
+            self._running += 1
+            job.status = JobStatus.RUNNING
+            job.started_at = datetime.utcnow()
+            self._publish(job)
+            try:
+                await work(job)
+                job.status = JobStatus.DONE
+                self._completed += 1
+            except asyncio.CancelledError:
+                job.status = JobStatus.FAILED
+                job.error = "Job cancelled"
+                raise
+            except Exception as e:
+                logger.error(f"Job {job.job_id} failed: {str(e)}", exc_info=True)
+                job.status = JobStatus.FAILED
+                job.error = str(e)
+                self._failed += 1
+            finally:
+                job.finished_at = datetime.utcnow()
+                self._publish(job)
+                self._running -= 1
+                self._queue.task_done()
+
+    def _publish(self, job: Job) -> None:
+        if self.shared_cache is None:
+            return
+        try:
+            self._published.put((job.job_id, job.model_dump_json().encode()))
+        except ServiceException as e:
+            # The shared cache is best effort, other workers miss this state change
+            logger.warning(f"Job {job.job_id} state not published: {e.message}")
+
+    async def _publish_batch(self, batch: List[Tuple[str, bytes]]) -> None:
+        await self.shared_cache.aset_many(self.SHARED_NAMESPACE, batch)
+
+
+job_queue = JobQueue()
@@ -7,8 +7,10 @@ from datetime import datetime
 from typing import List, Optional
 
 from fastapi import Request, Response
+from starlette.datastructures import Headers
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.types import ASGIApp
+from starlette.middleware.gzip import GZipMiddleware, GZipResponder
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
@@ -254,3 +256,52 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
             response.headers[header_name] = header_value
 
         return response
+
+
+class StreamingAwareGZipResponder(GZipResponder):
+    def __init__(
+        self, app: ASGIApp, minimum_size: int, compresslevel: int, excluded_media_types: set
+    ):
+        super().__init__(app, minimum_size, compresslevel=compresslevel)
+        self.excluded_media_types = excluded_media_types
+
+    async def send_with_gzip(self, message: Message) -> None:
+        await super().send_with_gzip(message)
+        if message["type"] == "http.response.start":
+            media_type = Headers(raw=message["headers"]).get("content-type", "").split(";")[0]
+            if media_type.strip() in self.excluded_media_types:
+                # Reuse the pass-through path for already encoded bodies
+                self.content_encoding_set = True
+
+
+class StreamingAwareGZipMiddleware(GZipMiddleware):
+    """
+    GZip middleware that leaves event streams untouched.
+
+    Compressing SSE/NDJSON streams makes gzip hold chunks back until its buffer fills,
+    which defeats streaming partial results to the client.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 500,
+        compresslevel: int = 9,
+        excluded_media_types: Optional[List[str]] = None,
+    ):
+        super().__init__(app, minimum_size=minimum_size, compresslevel=compresslevel)
+        self.excluded_media_types = set(
+            excluded_media_types or ["text/event-stream", "application/x-ndjson"]
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and "gzip" in Headers(scope=scope).get("Accept-Encoding", ""):
+            responder = StreamingAwareGZipResponder(
+                self.app,
+                self.minimum_size,
+                compresslevel=self.compresslevel,
+                excluded_media_types=self.excluded_media_types,
+            )
+            await responder(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
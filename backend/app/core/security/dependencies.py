@@ -4,12 +4,9 @@ from fastapi import Cookie, Depends, Request, Response, Security
 from fastapi.security import HTTPBearer
 
 from app.core.db import postgres_db
-from app.core.exceptions import (
-    AuthenticationException,
-    NotFoundException,
-    UnauthorizedException,
-)
+from app.core.exceptions import AuthenticationException, UnauthorizedException
 from app.core.security.security import verify_token
+from app.core.security.token_cache import verified_tokens
 from app.repositories import ProfileRepository, UserRepository
 from app.services import UserService
 
@@ -17,8 +14,8 @@ security = HTTPBearer()
 
 
 async def get_user_service() -> UserService:
-    user_repository = UserRepository(postgres_db.client)
-    profile_repository = ProfileRepository(postgres_db.client)
+    user_repository = UserRepository(postgres_db)
+    profile_repository = ProfileRepository(postgres_db)
     user_service = UserService(user_repository)
     return user_service
 
@@ -33,18 +30,14 @@ async def protected_auth(
 
     access_token = authorization.credentials
 
-    access_token_payload = verify_token(access_token, "access")
+    access_token_payload = verified_tokens.verify(access_token, "access")
     if access_token_payload is None:
         raise AuthenticationException(message="Invalid token payload")
-    user = await user_service.get_user(user_id=int(access_token_payload["sub"]))
-    if user is None:
-        raise NotFoundException(message="User not found")
-
-    user_check = await user_service.get_by_token_creation_at(
+    user = await user_service.get_authenticated_user(
         user_id=int(access_token_payload["sub"]),
         token_creation_at=access_token_payload["iat"],
     )
-    if not user_check:
+    if user is None:
         raise UnauthorizedException(
             message="Invalid token, please use the refresh token to refresh the access token"
         )
@@ -64,15 +57,11 @@ async def refresh_auth(
     if refresh_token_payload is None:
         response.delete_cookie("refresh_token")
         raise AuthenticationException(message="Invalid token payload")
-    user = await user_service.get_user(user_id=int(refresh_token_payload["sub"]))
-    if user is None:
-        response.delete_cookie("refresh_token")
-        raise AuthenticationException(message="Invalid token")
-    user_check = await user_service.get_by_token_creation_at(
+    user = await user_service.get_authenticated_user(
         user_id=int(refresh_token_payload["sub"]),
         token_creation_at=refresh_token_payload["iat"],
     )
-    if not user_check:
+    if user is None:
         response.delete_cookie("refresh_token")
         raise UnauthorizedException(
             message="Invalid token, please login to get a new refresh token"
@@ -0,0 +1,142 @@
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from app.core.config import settings
+from app.core.exceptions import ServiceException
+from app.core.security.security import (
+    calibrate_bcrypt_rounds,
+    get_password_hash,
+    set_bcrypt_rounds,
+    verify_and_update_password,
+    verify_password,
+)
+
+logger = logging.getLogger(__name__)
+
+Result = TypeVar("Result")
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a small dedicated thread pool instead of the event loop.
+
+    A bcrypt call takes a few hundred milliseconds of CPU; made inline it stalls every other
+    request on the worker for that long. bcrypt releases the GIL while it hashes, so worker
+    threads run it truly in parallel with the loop. At most `max_pending` calls are queued
+    or running at once, beyond that a call fails straight away with 503: a login burst then
+    costs the rejected clients a retry instead of costing everyone a growing queue.
+
+    `configure` sets the bcrypt cost at startup, calibrated so one hash takes about a
+    target latency on the machine the worker runs on.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+        self.rounds: Optional[int] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._hash_total = 0.0
+        self._hash_max = 0.0
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._submit(verify_password, plain_password, hashed_password)
+
+    async def verify_and_update(
+        self, plain_password: str, hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        return await self._submit(verify_and_update_password, plain_password, hashed_password)
+
+    async def configure(
+        self,
+        fixed_rounds: Optional[int],
+        target_seconds: float,
+        min_rounds: int,
+        max_rounds: int,
+    ) -> int:
+        if fixed_rounds:
+            rounds = fixed_rounds
+        else:
+            loop = asyncio.get_running_loop()
+            rounds = await loop.run_in_executor(
+                self._executor, calibrate_bcrypt_rounds, target_seconds, min_rounds, max_rounds
+            )
+        set_bcrypt_rounds(rounds)
+        self.rounds = rounds
+        logger.info(
+            f"Password hashing uses bcrypt with {rounds} rounds",
+            extra={"calibrated": not fixed_rounds, "target_seconds": target_seconds},
+        )
+        return rounds
+
+    def metrics(self) -> Dict[str, Any]:
+        completed = self._completed or 1
+        return {
+            "rounds": self.rounds,
+            "workers": self.workers,
+            "pending": self._pending,
+            "completed": self._completed,
+            "rejected": self._rejected,
+            "queue_wait_avg_seconds": self._wait_total / completed,
+            "queue_wait_max_seconds": self._wait_max,
+            "hash_avg_seconds": self._hash_total / completed,
+            "hash_max_seconds": self._hash_max,
+        }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _submit(self, func: Callable[..., Result], *args: Any) -> Result:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._rejected += 1
+                raise ServiceException(
+                    message="Too many sign-ins in progress, please retry shortly"
+                )
+            self._pending += 1
+        submitted_at = time.perf_counter()
+
+        def run() -> Result:
+            started_at = time.perf_counter()
+            try:
+                return func(*args)
+            finally:
+                finished_at = time.perf_counter()
+                with self._lock:
+                    self._completed += 1
+                    self._wait_total += started_at - submitted_at
+                    self._wait_max = max(self._wait_max, started_at - submitted_at)
+                    self._hash_total += finished_at - started_at
+                    self._hash_max = max(self._hash_max, finished_at - started_at)
+
+        try:
+            future = self._executor.submit(run)
+        except RuntimeError:
+            self._release()
+            raise
+        # Released once the thread is done or the call is dropped unstarted, a caller that
+        # stops waiting does not free the worker its hash still occupies
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _release(self, future: Any = None) -> None:
+        with self._lock:
+            self._pending -= 1
+
+
+password_hasher = PasswordHasher(
+    workers=settings.security.PASSWORD_HASH_WORKERS,
+    max_pending=settings.security.PASSWORD_HASH_MAX_PENDING,
+)
@@ -1,5 +1,7 @@
+import math
 import random
 import string
+import time
 from datetime import datetime, timedelta
 from typing import Any, Dict, Literal, Optional, Tuple
 
@@ -10,7 +12,7 @@ from app.core.config import settings
 
 # Create CryptContext once
 pwd_context = CryptContext(
-    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=12, bcrypt__ident="2b"
+    schemes=["bcrypt"], deprecated="auto", bcrypt__default_rounds=12, bcrypt__ident="2b"
 )
 
 
@@ -18,6 +20,7 @@ def create_access_token(
     data: Dict[str, Any],
     created_at: datetime = datetime.utcnow(),
     expires_delta: Optional[timedelta] = None,
+    issued_at: Optional[datetime] = None,
 ) -> Tuple[str, datetime]:
     """
     Create a new access token
@@ -25,12 +28,13 @@ def create_access_token(
     Args:
         data: Payload to encode in the token
         expires_delta: Optional custom expiration time
+        issued_at: Optional issue time, already stored as the user's token creation time
 
     Returns:
         Encoded JWT token
     """
     to_encode = data.copy()
-    iat = datetime.timestamp(datetime.utcnow())
+    iat = datetime.timestamp(issued_at or datetime.utcnow())
     expire = created_at + (
         expires_delta or timedelta(minutes=settings.security.ACCESS_TOKEN_EXPIRE_MINUTES)
     )
@@ -46,7 +50,9 @@ def create_access_token(
 
 
 def create_refresh_token(
-    data: Dict[str, Any], expires_delta: Optional[timedelta] = None
+    data: Dict[str, Any],
+    expires_delta: Optional[timedelta] = None,
+    issued_at: Optional[datetime] = None,
 ) -> tuple[str, datetime]:
     """
     Create a new refresh token
@@ -55,7 +61,7 @@ def create_refresh_token(
         Tuple of (token string, expiration datetime)
     """
     to_encode = data.copy()
-    iat = datetime.timestamp(datetime.utcnow())
+    iat = datetime.timestamp(issued_at or datetime.utcnow())
     expire = datetime.utcnow() + (
         expires_delta or timedelta(days=settings.security.REFRESH_TOKEN_EXPIRE_DAYS)
     )
@@ -159,6 +165,78 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and rehash it if its hash is below the current cost
+
+    Args:
+        plain_password: Plain text password to verify
+        hashed_password: Hashed password to check against
+
+    Returns:
+        Tuple of (whether the password matches, new hash to store or None)
+    """
+    if not pwd_context.verify(plain_password, hashed_password):
+        return False, None
+    if pwd_context.needs_update(hashed_password):
+        return True, pwd_context.hash(plain_password)
+    return True, None
+
+
+def bcrypt_hash_seconds(rounds: int, samples: int = 3) -> float:
+    """
+    Measure how long one bcrypt hash takes on this machine
+
+    Args:
+        rounds: bcrypt cost, log2 of the key expansion rounds
+        samples: Hashes timed, the fastest one is least disturbed by other load
+
+    Returns:
+        Seconds per hash
+    """
+    handler = pwd_context.handler("bcrypt").using(rounds=rounds)
+    timings = []
+    for _ in range(samples):
+        started_at = time.perf_counter()
+        handler.hash("calibration-password")
+        timings.append(time.perf_counter() - started_at)
+    return min(timings)
+
+
+def calibrate_bcrypt_rounds(target_seconds: float, min_rounds: int, max_rounds: int) -> int:
+    """
+    Pick the highest bcrypt cost whose hash stays within a latency target
+
+    Each extra round doubles the work, so the cost is measured once at `min_rounds` and
+    extrapolated rather than timing every cost up to the target.
+
+    Args:
+        target_seconds: Longest a single hash may take
+        min_rounds: Lowest cost accepted, however slow the machine
+        max_rounds: Highest cost used, however fast the machine
+
+    Returns:
+        bcrypt rounds to hash new passwords with
+    """
+    base_seconds = bcrypt_hash_seconds(min_rounds)
+    if base_seconds >= target_seconds:
+        return min_rounds
+    return min(max_rounds, min_rounds + math.floor(math.log2(target_seconds / base_seconds)))
+
+
+def set_bcrypt_rounds(rounds: int) -> None:
+    """
+    Hash new passwords with `rounds` and flag weaker existing hashes for an upgrade
+
+    Only weaker hashes need an update, stronger ones are left alone, so workers that
+    calibrate a round apart never rehash the same password back and forth.
+    """
+    # `rounds` would also cap the cost, set the default and the floor only
+    pwd_context.update(bcrypt__default_rounds=rounds, bcrypt__min_rounds=rounds)
+
+
 def create_otp(length: int = 6) -> Dict[str, Any]:
     """
     Generate a random OTP
@@ -0,0 +1,136 @@
+import hashlib
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Literal, Optional, Tuple
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.core.security.security import verify_token
+from app.core.shared_cache import SharedCache, shared_cache
+
+TokenType = Literal["access", "refresh", "verification"]
+
+
+class VerifiedTokenCache:
+    """
+    Payloads of tokens that already passed `verify_token`, kept until the token expires.
+
+    A bearer token is sent unchanged with every request for its whole lifetime, so its
+    signature only needs checking once. Entries are keyed by a SHA-256 digest of the token
+    and its type, which keeps the raw tokens out of memory, and live until the token's
+    `exp`, after which `verify_token` runs again and rejects it as expired.
+
+    Verification never depended on the database, whether the token is still the user's
+    current one is `TokenVersionCache`'s concern. `invalidate_user` drops a user's entries
+    when their token creation time rotates, so tokens replaced by a login or refresh stop
+    being served from memory right away.
+    """
+
+    def __init__(self, max_size: int):
+        self._entries: Optional[LRUCache[bytes, Dict[str, Any]]] = (
+            LRUCache(max_size=max_size) if max_size > 0 else None
+        )
+
+    def verify(self, token: str, token_type: TokenType) -> Optional[Dict[str, Any]]:
+        if self._entries is None:
+            return verify_token(token, token_type)
+        key = hashlib.sha256(f"{token_type}:{token}".encode()).digest()
+        payload = self._entries.get(key)
+        if payload is None:
+            payload = verify_token(token, token_type)
+            if payload is None:
+                return None
+            ttl = payload["exp"] - time.time()
+            if ttl > 0:
+                self._entries.set(key, payload, ttl=ttl)
+        # Callers get their own copy, the cached payload is shared between requests
+        return dict(payload)
+
+    def invalidate_user(self, user_id: Any) -> int:
+        if self._entries is None:
+            return 0
+        sub = str(user_id)
+        return self._entries.pop_where(lambda payload: payload["sub"] == sub)
+
+    def clear(self) -> None:
+        if self._entries is not None:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return self._entries.stats() if self._entries is not None else {}
+
+
+class TokenVersionCache:
+    """
+    Each user's current `token_creation_at` together with the user, by user id.
+
+    A token is current while its `iat` falls in the second starting at the user's token
+    creation time, the same window `UserRepository.get_by_token_creation_at` queries. A
+    cached user answers that check without the database; an `iat` outside the window is a
+    miss, not a rejection, so a token issued after the entry was cached still reaches the
+    query.
+
+    Login and refresh rotate the creation time and `invalidate` the user: this process
+    drops its entry and the revocation time is published to the node-local shared cache.
+    A hit checks that time and drops entries fetched before it, so every worker on the
+    host stops serving the old token at once. Workers on other hosts, or every worker
+    while the shared cache is disabled, see the rotation once their entry is `ttl`
+    seconds old.
+    """
+
+    SHARED_NAMESPACE = "token_revocations"
+
+    def __init__(self, max_size: int, ttl: float, shared_cache: Optional[SharedCache] = None):
+        self._entries: Optional[LRUCache[int, Tuple[Dict[str, Any], float]]] = (
+            LRUCache(max_size=max_size, ttl=ttl) if max_size > 0 else None
+        )
+        self.shared_cache = shared_cache
+
+    async def get(self, user_id: int, token_creation_at: datetime) -> Optional[Dict[str, Any]]:
+        if self._entries is None:
+            return None
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        user, fetched_at = entry
+        if user["token_creation_at"] is None:
+            return None
+        window_end = token_creation_at + timedelta(seconds=1)
+        if not token_creation_at <= user["token_creation_at"] < window_end:
+            return None
+        if self.shared_cache is not None:
+            revoked_at = await self.shared_cache.aget(self.SHARED_NAMESPACE, str(user_id))
+            if revoked_at is not None and float(revoked_at) >= fetched_at:
+                self._entries.pop(user_id)
+                return None
+        return dict(user)
+
+    def set(self, user_id: int, user: Dict[str, Any], fetched_at: float) -> None:
+        """Cache `user`, as read from the database by a query started at `fetched_at`."""
+        if self._entries is not None:
+            self._entries.set(user_id, (user, fetched_at))
+
+    async def invalidate(self, user_id: int) -> None:
+        if self._entries is not None:
+            self._entries.pop(user_id)
+        if self.shared_cache is not None:
+            # Wall clock time, the only clock every process on the host agrees on
+            revoked_at = repr(time.time()).encode()
+            await self.shared_cache.aset(self.SHARED_NAMESPACE, str(user_id), revoked_at)
+
+    def stats(self) -> Dict[str, int]:
+        return self._entries.stats() if self._entries is not None else {}
+
+
+verified_tokens = VerifiedTokenCache(max_size=settings.security.VERIFIED_TOKEN_CACHE_SIZE)
+token_versions = TokenVersionCache(
+    max_size=settings.security.TOKEN_VERSION_CACHE_SIZE,
+    ttl=settings.security.TOKEN_VERSION_CACHE_TTL_SECONDS,
+    shared_cache=shared_cache,
+)
+
+
+async def revoke_cached_tokens(user_id: int) -> None:
+    """Forget what the host's workers cached about a user's tokens, after a rotation or update."""
+    verified_tokens.invalidate_user(user_id)
+    await token_versions.invalidate(int(user_id))
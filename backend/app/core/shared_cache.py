@@ -0,0 +1,182 @@
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Share of the entries dropped, oldest first, when the cache outgrows its size bound
+EVICTION_FRACTION = 0.1
+
+
+class SharedCache:
+    """
+    Node-local key/value cache shared by every worker process on a host.
+
+    Entries live in one SQLite file in WAL mode, so readers in any process never block
+    on a writer and a lookup is a primary key read from the shared page cache, a few
+    microseconds with no external service. Every write checks the pages in use and,
+    once they exceed `max_bytes`, deletes the oldest written entries in one batch, so
+    the file stays bounded (freed pages are reused rather than returned to the OS).
+
+    The cache is best effort: until `open` is called, and whenever the database is locked
+    or broken, reads miss and writes are dropped instead of failing the request.
+    Connections are opened lazily per process, as uvicorn workers must not share one
+    across a fork.
+
+    The methods block on SQLite, a write can wait `busy_timeout` for another process's
+    lock. Async code uses the `a`-prefixed forms, which run them in a thread; the
+    process's connection is shared by those threads behind a lock.
+    """
+
+    def __init__(self) -> None:
+        self.path: Optional[Path] = None
+        self.max_bytes = 0
+        self.busy_timeout = 0.05
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.errors = 0
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+        self._page_size = 4096
+
+    def open(self, path: Path, max_bytes: int, busy_timeout: float = 0.05) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be a positive integer")
+        self.close()
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.busy_timeout = busy_timeout
+        # A lock inherited across a fork could be held by a thread that did not survive it
+        self._lock = threading.Lock()
+        with self._lock:
+            self._connect()
+        logger.info("Shared cache opened", extra={"path": str(self.path), "max_bytes": max_bytes})
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None
+
+    def get(self, namespace: str, key: str) -> Optional[bytes]:
+        if not self.enabled:
+            return None
+        try:
+            with self._lock:
+                row = (
+                    self._connect()
+                    .execute(
+                        "SELECT value FROM entries WHERE namespace = ? AND key = ?",
+                        (namespace, key),
+                    )
+                    .fetchone()
+                )
+        except sqlite3.Error as e:
+            self._failed("read", e)
+            return None
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return row[0]
+
+    def set(self, namespace: str, key: str, value: bytes) -> None:
+        self.set_many(namespace, ((key, value),))
+
+    def set_many(self, namespace: str, items: Iterable[Tuple[str, bytes]]) -> None:
+        rows = [(namespace, key, value) for key, value in items]
+        if not rows or not self.enabled:
+            return
+        try:
+            with self._lock, self._connect() as connection:
+                connection.execute("BEGIN IMMEDIATE")
+                # Replacing an entry gives it a new rowid, making it the newest
+                connection.executemany(
+                    "INSERT OR REPLACE INTO entries (namespace, key, value) VALUES (?, ?, ?)", rows
+                )
+                self.writes += len(rows)
+                if self._used_bytes(connection) > self.max_bytes:
+                    self._evict(connection)
+        except sqlite3.Error as e:
+            self._failed("write", e)
+
+    async def aget(self, namespace: str, key: str) -> Optional[bytes]:
+        if not self.enabled:
+            return None
+        return await asyncio.to_thread(self.get, namespace, key)
+
+    async def aset(self, namespace: str, key: str, value: bytes) -> None:
+        await self.aset_many(namespace, ((key, value),))
+
+    async def aset_many(self, namespace: str, items: Iterable[Tuple[str, bytes]]) -> None:
+        """`set_many` in a thread, `items` can be a generator that is costly to consume."""
+        if self.enabled:
+            await asyncio.to_thread(self.set_many, namespace, items)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None and self._pid == os.getpid():
+                self._connection.close()
+            self._connection = None
+            self.path = None
+
+    def stats(self) -> Dict[str, Any]:
+        stats: Dict[str, Any] = {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "errors": self.errors,
+        }
+        if self.enabled:
+            try:
+                with self._lock:
+                    stats["used_bytes"] = self._used_bytes(self._connect())
+            except sqlite3.Error:
+                pass
+        return stats
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is not None and self._pid == os.getpid():
+            return self._connection
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(
+            self.path, timeout=self.busy_timeout, isolation_level=None, check_same_thread=False
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        # Entries can be rebuilt from Postgres, so a power loss may drop the last writes
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "namespace TEXT NOT NULL, key TEXT NOT NULL, value BLOB NOT NULL, "
+            "PRIMARY KEY (namespace, key))"
+        )
+        self._page_size = connection.execute("PRAGMA page_size").fetchone()[0]
+        self._connection, self._pid = connection, os.getpid()
+        return connection
+
+    def _used_bytes(self, connection: sqlite3.Connection) -> int:
+        pages = connection.execute("PRAGMA page_count").fetchone()[0]
+        free_pages = connection.execute("PRAGMA freelist_count").fetchone()[0]
+        return (pages - free_pages) * self._page_size
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        oldest, newest = connection.execute("SELECT min(rowid), max(rowid) FROM entries").fetchone()
+        if oldest is None:
+            return
+        cutoff = oldest + max(int((newest - oldest + 1) * EVICTION_FRACTION), 1)
+        # Never evict the entries that were just written
+        cursor = connection.execute("DELETE FROM entries WHERE rowid < ?", (min(cutoff, newest),))
+        self.evictions += cursor.rowcount
+
+    def _failed(self, operation: str, error: sqlite3.Error) -> None:
+        self.errors += 1
+        logger.warning(f"Shared cache {operation} failed: {str(error)}")
+
+
+shared_cache = SharedCache()
@@ -0,0 +1,61 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+
+FlightKey = TypeVar("FlightKey", bound=Hashable)
+FlightResult = TypeVar("FlightResult")
+
+
+class SingleFlight(Generic[FlightKey, FlightResult]):
+    """
+    Coalesce concurrent calls for the same key into one shared computation.
+
+    The first caller for a key starts the work as its own task and later callers await
+    that task until it finishes. Every caller waits through `asyncio.shield`, so a
+    cancelled caller (e.g. a disconnected client) stops waiting without cancelling the
+    work the others are waiting for; the task runs to completion even when every caller
+    is gone. Results and exceptions are shared by all callers of a flight, and the key is
+    released as soon as the task finishes, so later calls start fresh.
+    """
+
+    def __init__(self) -> None:
+        self._flights: Dict[FlightKey, asyncio.Task] = {}
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+        self.abandoned = 0
+
+    async def do(self, key: FlightKey, work: Callable[[], Awaitable[FlightResult]]) -> FlightResult:
+        self.calls += 1
+        task = self._flights.get(key)
+        if task is None:
+            self.executions += 1
+            task = asyncio.ensure_future(work())
+            self._flights[key] = task
+            task.add_done_callback(lambda finished: self._release(key, finished))
+        else:
+            self.coalesced += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.done():
+                self.abandoned += 1
+            raise
+
+    def in_flight(self, key: FlightKey) -> bool:
+        return key in self._flights
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "in_flight": len(self._flights),
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "abandoned_waits": self.abandoned,
+        }
+
+    def _release(self, key: FlightKey, task: asyncio.Task) -> None:
+        if self._flights.get(key) is task:
+            del self._flights[key]
+        # Mark the outcome as retrieved, a flight with no waiters left must not log it
+        if not task.cancelled():
+            task.exception()
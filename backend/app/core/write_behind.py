@@ -0,0 +1,127 @@
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Generic, List, Optional, TypeVar
+
+from app.core.exceptions import ServiceException
+
+logger = logging.getLogger(__name__)
+
+Item = TypeVar("Item")
+FlushBatch = Callable[[List[Item]], Awaitable[Any]]
+
+
+class WriteBehindBuffer(Generic[Item]):
+    """
+    In-process buffer that accepts writes at once and persists them in batches.
+
+    `put` only appends to a list, so callers never wait on the database and their latency
+    stays flat however many writes arrive at once. A background task flushes the buffer
+    with one `flush` call per batch of up to `batch_size` items, as soon as a batch is
+    full or every `flush_interval` seconds otherwise. A failed batch goes back to the
+    front of the buffer and is retried on the next interval; `put` rejects writes only
+    once `max_size` items are waiting. `stop` flushes whatever is still buffered.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._items: List[Item] = []
+        self._flush: Optional[FlushBatch] = None
+        self._batch_size = 500
+        self._flush_interval = 1.0
+        self._max_size = 50000
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+        self._accepted = 0
+        self._rejected = 0
+        self._flushed = 0
+        self._batches = 0
+        self._failures = 0
+        self._flush_time_max = 0.0
+
+    async def start(
+        self, flush: FlushBatch, batch_size: int, flush_interval: float, max_size: int
+    ) -> None:
+        if self._task is not None:
+            return
+        self._flush = flush
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._max_size = max_size
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name=f"{self.name}-write-behind")
+        logger.info(
+            f"Write-behind buffer {self.name} started",
+            extra={"batch_size": batch_size, "flush_interval": flush_interval},
+        )
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        # Not cancelled: an interrupted INSERT would leave it unknown whether the batch landed
+        self._stopping = True
+        self._wakeup.set()
+        await self._task
+        self._task = None
+        while self._items:
+            if not await self._flush_batch():
+                logger.error(
+                    f"Write-behind buffer {self.name} dropped {len(self._items)} items on shutdown"
+                )
+                self._items.clear()
+        logger.info(f"Write-behind buffer {self.name} stopped")
+
+    def put(self, item: Item) -> None:
+        if self._task is None:
+            raise ServiceException(message=f"{self.name.capitalize()} buffer is not running")
+        if len(self._items) >= self._max_size:
+            self._rejected += 1
+            raise ServiceException(message=f"Too many pending {self.name}, please retry shortly")
+        self._items.append(item)
+        self._accepted += 1
+        if len(self._items) >= self._batch_size:
+            self._wakeup.set()
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "pending": len(self._items),
+            "accepted": self._accepted,
+            "rejected": self._rejected,
+            "flushed": self._flushed,
+            "batches": self._batches,
+            "failed_batches": self._failures,
+            "flush_time_max_seconds": self._flush_time_max,
+        }
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            while self._items:
+                # A failing database is retried on the next interval, not in a tight loop
+                if not await self._flush_batch():
+                    break
+
+    async def _flush_batch(self) -> bool:
+        batch = self._items[: self._batch_size]
+        del self._items[: len(batch)]
+        started_at = time.perf_counter()
+        try:
+            await self._flush(batch)
+        except Exception as e:
+            self._failures += 1
+            self._items[:0] = batch
+            logger.error(f"Write-behind buffer {self.name} flush failed: {str(e)}")
+            return False
+        self._flush_time_max = max(self._flush_time_max, time.perf_counter() - started_at)
+        self._flushed += len(batch)
+        self._batches += 1
+        return True
+
+
+lead_buffer: WriteBehindBuffer = WriteBehindBuffer(name="leads")
@@ -5,7 +5,6 @@ from typing import Any, AsyncGenerator, Dict
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 
 from app.api.v1.routes import create_api_router
@@ -15,14 +14,25 @@ from app.core.config import settings
 from app.core.config.logging import LoggingSettings
 from app.core.db import postgres_db
 from app.core.exceptions import setup_exception_handlers
+from app.core.fetcher import site_fetcher
+from app.core.jobs import job_queue
 from app.core.middlewares import (
     RateLimitMiddleware,
     RequestIDMiddleware,
     RequestLoggingMiddleware,
     ResponseTimeMiddleware,
+    StreamingAwareGZipMiddleware,
 )
 from app.core.monitoring import SentryContextMiddleware, get_sentry_service
+from app.core.security.hashing import password_hasher
+from app.core.shared_cache import shared_cache
+from app.core.write_behind import lead_buffer
+from app.repositories import AuditRepository, LeadRepository
+from app.services.audit_retention import audit_retention_sweeper
+from app.services.cro_catalog import get_catalog_loader
+from app.services.industry_benchmarks import get_benchmark_index
 import os
+import tempfile
 logging_settings = LoggingSettings()
 logging.config.dictConfig(logging_settings.get_logging_config())
 logger = logging.getLogger(__name__)
@@ -64,33 +74,102 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         logger.error(f"Error during PostgreSQL setup: {str(e)}", exc_info=True)
         raise
 
+    if settings.retention.ENABLED:
+        # The sweeper's first pass ran before the database was connected, make sure this
+        # month's partition exists before the first audit is stored
+        try:
+            await audit_retention_sweeper.ensure_partitions()
+        except Exception as e:
+            logger.error(f"Error creating audit partitions: {str(e)}", exc_info=True)
+
     api_router = create_api_router()
     app.include_router(api_router, prefix="/api/v1")
     yield
 
     logger.info("Shutting down application...")
 
+    # Background tasks still write to the database while they stop
     try:
-        await postgres_db.close_db_connection()
-        logger.info("MongoDB connection closed")
+        await cleanup_tasks(app)
     except Exception as e:
-        logger.error(f"Error closing MongoDB connection: {str(e)}", exc_info=True)
+        logger.error(f"Error during cleanup tasks: {str(e)}", exc_info=True)
 
     try:
-        await cleanup_tasks(app)
+        await postgres_db.close_db_connection()
+        logger.info("MongoDB connection closed")
     except Exception as e:
-        logger.error(f"Error during cleanup tasks: {str(e)}", exc_info=True)
+        logger.error(f"Error closing MongoDB connection: {str(e)}", exc_info=True)
 
 
 async def startup_tasks(app: FastAPI) -> None:
     """Additional startup tasks"""
     # Initialize any background tasks
+    if settings.cache.SHARED_ENABLED:
+        shared_cache.open(
+            path=settings.cache.SHARED_PATH
+            or os.path.join(tempfile.gettempdir(), "cro-audit-cache.sqlite3"),
+            max_bytes=settings.cache.SHARED_MAX_BYTES,
+            busy_timeout=settings.cache.SHARED_BUSY_TIMEOUT,
+        )
+    await job_queue.start(
+        workers=settings.audit.JOB_WORKERS,
+        process_workers=settings.audit.JOB_PROCESS_WORKERS,
+        max_queue_size=settings.audit.JOB_MAX_QUEUE_SIZE,
+        store_size=settings.audit.JOB_STORE_SIZE,
+        shared_cache=shared_cache,
+    )
+    if settings.fetcher.ENABLED:
+        await site_fetcher.start(
+            max_connections=settings.fetcher.MAX_CONNECTIONS,
+            max_connections_per_host=settings.fetcher.MAX_CONNECTIONS_PER_HOST,
+            max_keepalive_connections=settings.fetcher.MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.fetcher.KEEPALIVE_EXPIRY,
+            connect_timeout=settings.fetcher.CONNECT_TIMEOUT,
+            read_timeout=settings.fetcher.READ_TIMEOUT,
+            total_timeout=settings.fetcher.TOTAL_TIMEOUT,
+            max_response_bytes=settings.fetcher.MAX_RESPONSE_BYTES,
+            max_redirects=settings.fetcher.MAX_REDIRECTS,
+            user_agent=settings.fetcher.USER_AGENT,
+            allow_private_hosts=settings.fetcher.ALLOW_PRIVATE_HOSTS,
+        )
+    await password_hasher.configure(
+        fixed_rounds=settings.security.PASSWORD_HASH_ROUNDS,
+        target_seconds=settings.security.PASSWORD_HASH_TARGET_SECONDS,
+        min_rounds=settings.security.PASSWORD_HASH_MIN_ROUNDS,
+        max_rounds=settings.security.PASSWORD_HASH_MAX_ROUNDS,
+    )
+    await lead_buffer.start(
+        flush=lambda leads: LeadRepository(postgres_db).create_many(leads=leads),
+        batch_size=settings.audit.LEAD_BATCH_SIZE,
+        flush_interval=settings.audit.LEAD_FLUSH_INTERVAL_SECONDS,
+        max_size=settings.audit.LEAD_BUFFER_SIZE,
+    )
+    if settings.retention.ENABLED:
+        await audit_retention_sweeper.start(
+            audit_repository=AuditRepository(postgres_db),
+            retention_days=settings.retention.AUDIT_DAYS,
+            partitions_ahead=settings.retention.AUDIT_PARTITIONS_AHEAD,
+            interval_seconds=settings.retention.SWEEP_INTERVAL_SECONDS,
+            retry_seconds=settings.retention.RETRY_SECONDS,
+            archive=settings.retention.AUDIT_ARCHIVE,
+        )
     # Setup any additional services
+    # Map the benchmark index up front rather than on the first audit
+    get_benchmark_index(settings.audit.BENCHMARK_INDEX_PATH)
+    # Compile the issue catalog before serving, an invalid catalog fails startup
+    get_catalog_loader(settings.audit.CATALOG_PATH, settings.audit.CATALOG_RELOAD_SECONDS)
 
 
 async def cleanup_tasks(app: FastAPI) -> None:
     """Additional cleanup tasks"""
     # Cleanup any background tasks
+    # Write buffered leads before the database connection goes away
+    await lead_buffer.stop()
+    await job_queue.stop()
+    await site_fetcher.stop()
+    await audit_retention_sweeper.stop()
+    password_hasher.shutdown()
+    shared_cache.close()
     # Cleanup any additional services
 
 
@@ -129,7 +208,9 @@ def setup_middlewares(app: FastAPI) -> None:
 
     app.add_middleware(TrustedHostMiddleware, allowed_hosts=settings.app.ALLOWED_HOSTS)
 
-    app.add_middleware(GZipMiddleware, minimum_size=settings.app.MIDDLEWARE_GZIP_MINIMUM_SIZE)
+    app.add_middleware(
+        StreamingAwareGZipMiddleware, minimum_size=settings.app.MIDDLEWARE_GZIP_MINIMUM_SIZE
+    )
 
     if settings.logging.SENTRY_ENABLED:
         app.add_middleware(SentryContextMiddleware)
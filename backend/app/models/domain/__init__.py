@@ -5,6 +5,8 @@ from app.models.domain.user import (
     UserUpdate
 )
 from app.models.domain.profile import ProfileCreate, ProfileUpdate, Profile
+from app.models.domain.cro_audit import CROAuditRecord
+from app.models.domain.lead import Lead, LeadCreate
 
 __all__ = [
     "User",
@@ -13,5 +15,8 @@ __all__ = [
     "SignupRequest",
     "ProfileCreate",
     "ProfileUpdate",
-    "Profile"
+    "Profile",
+    "CROAuditRecord",
+    "Lead",
+    "LeadCreate",
 ]
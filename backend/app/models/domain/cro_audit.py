@@ -0,0 +1,53 @@
+from datetime import datetime
+from typing import Any, Dict
+
+from sqlalchemy import BigInteger, Column, Index
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Field, SQLModel
+
+
+class CROAuditRecord(SQLModel, table=True):
+    __tablename__ = "cro_audits"
+    __table_args__ = (
+        # Keyset pagination order of exports, see `AuditRepository.export_page`
+        Index("ix_cro_audits_created_at_audit_id", "created_at", "audit_id"),
+        # Monthly range partitions on created_at, maintained by the audit retention sweeper
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+    audit_id: str = Field(primary_key=True, max_length=36, description="The id of the audit")
+    website_url: str = Field(..., description="The audited website url")
+    normalized_url: str = Field(..., description="The website url in its canonical form")
+    # Part of the primary key, as every unique constraint of a partitioned table must be
+    created_at: datetime = Field(default_factory=datetime.utcnow, primary_key=True)
+
+    # Summary columns copied from the payload, so listings never decode a report
+    confidence_score: int = Field(...)
+    total_uplift_percentage: float = Field(...)
+    monthly_revenue_uplift: int = Field(sa_column=Column(BigInteger, nullable=False))
+    issue_count: int = Field(...)
+    high_severity_issues: int = Field(...)
+    medium_severity_issues: int = Field(...)
+    low_severity_issues: int = Field(...)
+
+    payload: Dict[str, Any] = Field(
+        sa_column=Column(JSONB, nullable=False), description="The serialized audit result"
+    )
+
+
+# Newest first history of a site, covering every summary column for index-only scans
+Index(
+    "ix_cro_audits_normalized_url_created_at",
+    CROAuditRecord.normalized_url,
+    CROAuditRecord.created_at.desc(),
+    CROAuditRecord.audit_id.desc(),
+    postgresql_include=[
+        "website_url",
+        "confidence_score",
+        "total_uplift_percentage",
+        "monthly_revenue_uplift",
+        "issue_count",
+        "high_severity_issues",
+        "medium_severity_issues",
+        "low_severity_issues",
+    ],
+)
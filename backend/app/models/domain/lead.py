@@ -0,0 +1,25 @@
+import uuid
+from datetime import datetime
+from typing import Optional
+
+from pydantic import EmailStr
+from sqlmodel import Field, SQLModel
+
+from app.models.domain.validators import PhoneValidatorMixin
+
+
+class LeadCreate(PhoneValidatorMixin, SQLModel):
+    name: str = Field(..., min_length=1, max_length=200, description="The name of the lead")
+    email: EmailStr = Field(..., description="The email of the lead")
+    phone: Optional[str] = Field(None, description="The phone number of the lead")
+
+
+class Lead(SQLModel, table=True):
+    __tablename__ = "leads"
+    lead_id: str = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True, max_length=36)
+    audit_id: str = Field(..., index=True, max_length=36, description="The audit the lead is for")
+    name: str = Field(..., description="The name of the lead")
+    email: str = Field(..., description="The email of the lead")
+    phone: Optional[str] = Field(None, description="The phone number of the lead")
+    # When the lead was submitted, not when its batch was written
+    created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
@@ -1,5 +1,13 @@
 from app.repositories.profile_repository import ProfileRepository
 from app.repositories.user_repository import UserRepository
 from app.repositories.reset_password_repository import ResetPasswordRepository
+from app.repositories.audit_repository import AuditRepository
+from app.repositories.lead_repository import LeadRepository
 
-__all__ = ["UserRepository", "ProfileRepository", "ResetPasswordRepository"]
+__all__ = [
+    "UserRepository",
+    "ProfileRepository",
+    "ResetPasswordRepository",
+    "AuditRepository",
+    "LeadRepository",
+]
@@ -0,0 +1,178 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import Row, Text, cast, insert, text, tuple_
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.db import PostgresConnector
+from app.core.ids import id_created_at
+from app.core.monitoring.decorators import monitor_transaction
+from app.models.domain import CROAuditRecord
+
+
+class AuditRepository:
+    def __init__(self, db_connector: PostgresConnector):
+        self.db_connector = db_connector
+
+    @monitor_transaction(op="db.audit.create")
+    async def create(
+        self,
+        session: AsyncSession,
+        audit_id: str,
+        website_url: str,
+        payload: Dict[str, Any],
+        summary: Dict[str, Any],
+    ) -> CROAuditRecord:
+        db_audit = CROAuditRecord(
+            audit_id=audit_id,
+            website_url=website_url,
+            created_at=id_created_at(audit_id) or datetime.utcnow(),
+            payload=payload,
+            **summary,
+        )
+        session.add(db_audit)
+        return db_audit
+
+    @monitor_transaction(op="db.audit.create_many")
+    async def create_many(
+        self,
+        session: AsyncSession,
+        payloads: List[Dict[str, Any]],
+        summaries: List[Dict[str, Any]],
+    ) -> int:
+        if not payloads:
+            return 0
+        created_at = datetime.utcnow()
+        statement = insert(CROAuditRecord).values(
+            [
+                {
+                    "audit_id": payload["audit_id"],
+                    "website_url": payload["website_url"],
+                    "created_at": id_created_at(payload["audit_id"]) or created_at,
+                    "payload": payload,
+                    **summary,
+                }
+                for payload, summary in zip(payloads, summaries)
+            ]
+        )
+        await session.execute(statement)
+        return len(payloads)
+
+    @monitor_transaction(op="db.audit.get_by_id")
+    async def get_by_id(self, session: AsyncSession, audit_id: str) -> Optional[CROAuditRecord]:
+        statement = select(CROAuditRecord).where(CROAuditRecord.audit_id == audit_id)
+        created_at = id_created_at(audit_id)
+        if created_at is not None:
+            # Audits are stored at the time in their id, which prunes the read to one
+            # partition; older random ids still probe every partition's index
+            statement = statement.where(CROAuditRecord.created_at == created_at)
+        result = await session.execute(statement)
+        return result.scalar_one_or_none()
+
+    @monitor_transaction(op="db.audit.list_partitions")
+    async def list_partitions(self, session: AsyncSession) -> List[str]:
+        statement = text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = CAST(:parent AS regclass)"
+        )
+        result = await session.execute(statement, {"parent": CROAuditRecord.__tablename__})
+        return list(result.scalars())
+
+    @monitor_transaction(op="db.audit.create_partition")
+    async def create_partition(
+        self, session: AsyncSession, name: str, start: datetime, end: datetime
+    ) -> None:
+        # DDL takes no bind parameters, names and bounds are generated by the sweeper
+        await session.execute(
+            text(
+                f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF {CROAuditRecord.__tablename__} '
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            )
+        )
+
+    @monitor_transaction(op="db.audit.drop_partition")
+    async def drop_partition(self, session: AsyncSession, name: str) -> None:
+        await session.execute(text(f'DROP TABLE IF EXISTS "{name}"'))
+
+    @monitor_transaction(op="db.audit.detach_partition")
+    async def detach_partition(self, session: AsyncSession, name: str) -> None:
+        await session.execute(
+            text(f'ALTER TABLE {CROAuditRecord.__tablename__} DETACH PARTITION "{name}"')
+        )
+
+    @monitor_transaction(op="db.audit.export_page")
+    async def export_page(
+        self,
+        session: AsyncSession,
+        after: Optional[Tuple[datetime, str]],
+        limit: int,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Row]:
+        """
+        The next `limit` audits in (created_at, audit_id) order after the `after` key.
+
+        Each page is a range scan of the keyset index that starts where the previous one
+        ended, so its cost does not grow with the offset. Payloads come back as JSON text,
+        nothing is decoded for rows that are streamed out unchanged.
+        """
+        statement = (
+            select(
+                CROAuditRecord.audit_id,
+                CROAuditRecord.website_url,
+                CROAuditRecord.created_at,
+                cast(CROAuditRecord.payload, Text).label("payload"),
+            )
+            .order_by(CROAuditRecord.created_at, CROAuditRecord.audit_id)
+            .limit(limit)
+        )
+        if after is not None:
+            statement = statement.where(
+                tuple_(CROAuditRecord.created_at, CROAuditRecord.audit_id) > tuple_(*after)
+            )
+        if since is not None:
+            statement = statement.where(CROAuditRecord.created_at >= since)
+        if until is not None:
+            statement = statement.where(CROAuditRecord.created_at < until)
+        result = await session.execute(statement)
+        return list(result.all())
+
+    @monitor_transaction(op="db.audit.list_by_url")
+    async def list_by_url(
+        self,
+        session: AsyncSession,
+        normalized_url: str,
+        before: Optional[Tuple[datetime, str]],
+        limit: int,
+    ) -> List[Row]:
+        """
+        A site's audits newest first, starting after the `before` key.
+
+        Every selected column is in the history index, so pages are index-only scans and
+        no payload is read.
+        """
+        statement = (
+            select(
+                CROAuditRecord.audit_id,
+                CROAuditRecord.website_url,
+                CROAuditRecord.created_at,
+                CROAuditRecord.confidence_score,
+                CROAuditRecord.total_uplift_percentage,
+                CROAuditRecord.monthly_revenue_uplift,
+                CROAuditRecord.issue_count,
+                CROAuditRecord.high_severity_issues,
+                CROAuditRecord.medium_severity_issues,
+                CROAuditRecord.low_severity_issues,
+            )
+            .where(CROAuditRecord.normalized_url == normalized_url)
+            .order_by(CROAuditRecord.created_at.desc(), CROAuditRecord.audit_id.desc())
+            .limit(limit)
+        )
+        if before is not None:
+            statement = statement.where(
+                tuple_(CROAuditRecord.created_at, CROAuditRecord.audit_id) < tuple_(*before)
+            )
+        result = await session.execute(statement)
+        return list(result.all())
@@ -0,0 +1,23 @@
+from typing import List
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.db import PostgresConnector
+from app.core.monitoring.decorators import monitor_transaction
+from app.models.domain import Lead
+
+
+class LeadRepository:
+    def __init__(self, db_connector: PostgresConnector):
+        self.db_connector = db_connector
+
+    @monitor_transaction(op="db.lead.create_many")
+    async def create_many(self, session: AsyncSession, leads: List[Lead]) -> int:
+        """Insert leads in one multi-row statement, skipping ids that are already stored."""
+        if not leads:
+            return 0
+        # A batch retried after an interrupted commit may have been written already
+        statement = insert(Lead).values([lead.model_dump() for lead in leads])
+        await session.execute(statement.on_conflict_do_nothing(index_elements=["lead_id"]))
+        return len(leads)
@@ -1,6 +1,8 @@
 from datetime import datetime, timedelta
 from typing import Optional
 
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import insert
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -21,6 +23,30 @@ class UserRepository:
         session.add(db_user)
         return db_user
 
+    @monitor_transaction(op="db.user.create_if_absent")
+    async def create_if_absent(
+        self, session: AsyncSession, user_create: UserCreate, token_creation_at: datetime
+    ) -> Optional[User]:
+        """Insert a user unless the email is taken, None if it is; one statement either way."""
+        now = datetime.utcnow()
+        db_user = User(
+            **user_create.dict(),
+            created_at=now,
+            updated_at=now,
+            token_creation_at=token_creation_at,
+        )
+        statement = (
+            insert(User)
+            .values(**db_user.model_dump(exclude={"id"}))
+            .on_conflict_do_nothing(index_elements=["email"])
+            .returning(User)
+        )
+        result = await session.execute(statement)
+        user = result.scalar_one_or_none()
+        if user is None:
+            return None
+        return User(**user.dict())
+
     @monitor_transaction(op="db.user.get_by_id")
     async def get_by_id(self, session: AsyncSession, user_id: int) -> Optional[User]:
         statement = select(User).where(User.id == user_id)
@@ -55,32 +81,36 @@ class UserRepository:
     
     @monitor_transaction(op="db.user.update_token_creation_at")
     async def update_token_creation_at(self, session: AsyncSession, user_id: int, token_creation_at: datetime) -> datetime:
-        statement = select(User).where(User.id == user_id)
+        statement = (
+            update(User)
+            .where(User.id == user_id)
+            .values(token_creation_at=token_creation_at, updated_at=datetime.utcnow())
+            .returning(User.id)
+        )
         result = await session.execute(statement)
-        user = result.scalar_one_or_none()
-        if user is None:
+        if result.scalar_one_or_none() is None:
             raise NotFoundException(message="User not found")
-
-        user.token_creation_at = token_creation_at
-        user.updated_at = datetime.utcnow()
-        session.add(user)
         return token_creation_at
 
-
-    @monitor_transaction(op="db.user.update_last_login")
-    async def update_last_login(self, session: AsyncSession, user_id: int) -> None:
-        statement = select(User).where(User.id == user_id)
+    @monitor_transaction(op="db.user.record_login")
+    async def record_login(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        token_creation_at: datetime,
+        hashed_password: Optional[str] = None,
+    ) -> datetime:
+        """Stamp a login and its token creation time, and store an upgraded hash, in one UPDATE."""
+        now = datetime.utcnow()
+        values = {"last_login": now, "updated_at": now, "token_creation_at": token_creation_at}
+        if hashed_password is not None:
+            values["password"] = hashed_password
+        statement = update(User).where(User.id == user_id).values(**values).returning(User.id)
         result = await session.execute(statement)
-        user = result.scalar_one_or_none()
-        if user is None:
+        if result.scalar_one_or_none() is None:
             raise NotFoundException(message="User not found")
+        return token_creation_at
 
-        user.last_login = datetime.utcnow()
-        user.updated_at = datetime.utcnow()
-        session.add(user)
-        await session.commit()
-
-    
     @monitor_transaction(op="db.user.get_by_token_creation_at")
     async def get_by_token_creation_at(
         self, session: AsyncSession, user_id: int, token_creation_at: datetime
@@ -1,4 +1,6 @@
 from app.services.auth_service import AuthService
 from app.services.user_service import UserService
+from app.services.audit_store import AuditStore
+from app.services.audit_service import CROAuditService
 
-__all__ = ["UserService", "AuthService"]
+__all__ = ["UserService", "AuthService", "AuditStore", "CROAuditService"]
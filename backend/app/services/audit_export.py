@@ -0,0 +1,147 @@
+import asyncio
+import csv
+import json
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Literal, Optional, Sequence
+
+from app.repositories import AuditRepository
+
+ExportFormat = Literal["ndjson", "csv"]
+
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+# One CSV row per issue, audit level columns repeated on each of its rows
+CSV_COLUMNS = (
+    "audit_id",
+    "website_url",
+    "created_at",
+    "monthly_visitors",
+    "conversion_rate",
+    "average_order_value",
+    "monthly_revenue",
+    "total_uplift_percentage",
+    "monthly_revenue_uplift",
+    "confidence_score",
+    "issue_category",
+    "issue",
+    "issue_severity",
+    "issue_impact_score",
+    "issue_potential_uplift",
+    "issue_description",
+)
+
+
+async def iter_export_pages(
+    audit_repository: AuditRepository,
+    page_size: int,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> AsyncIterator[Sequence[Any]]:
+    """
+    Every stored audit in (created_at, audit_id) order, one keyset page at a time.
+
+    Each page is its own short query resuming after the last key of the previous one, so
+    memory stays at one page and no transaction or connection is held for the length of
+    the export.
+    """
+    after = None
+    while True:
+        rows = await audit_repository.export_page(
+            after=after, limit=page_size, since=since, until=until
+        )
+        if rows:
+            yield rows
+        if len(rows) < page_size:
+            return
+        after = (rows[-1].created_at, rows[-1].audit_id)
+
+
+def _encode_ndjson(rows: Sequence[Any]) -> bytes:
+    # Payloads arrive as JSON object text, the creation time is spliced in without a decode
+    return "".join(
+        f'{{"created_at": "{row.created_at.isoformat()}", {row.payload[1:]}\n' for row in rows
+    ).encode()
+
+
+class _Chunks(list):
+    """File-like sink for csv writers that keeps the written strings."""
+
+    write = list.append
+
+
+class _CSVEncoder:
+    """
+    Flattens audits into one CSV row per issue.
+
+    The audit level columns are formatted once per audit and the same prefix is reused
+    for each of its issues, only the issue columns are formatted per row.
+    """
+
+    def __init__(self) -> None:
+        self.chunks = _Chunks()
+        self.prefix = _Chunks()
+        # A prefix ends with the separator its first issue column follows
+        self.audit_writer = csv.writer(self.prefix, lineterminator=",")
+        self.issue_writer = csv.writer(self.chunks)
+
+    def header(self) -> bytes:
+        self.chunks.append(",".join(CSV_COLUMNS) + "\r\n")
+        return self.flush()
+
+    def encode(self, rows: Sequence[Any]) -> bytes:
+        for row in rows:
+            payload: Dict[str, Any] = json.loads(row.payload)
+            metrics = payload.get("current_metrics", {})
+            revenue = payload.get("revenue_potential", {})
+            self.audit_writer.writerow(
+                (
+                    row.audit_id,
+                    row.website_url,
+                    row.created_at.isoformat(),
+                    metrics.get("monthly_visitors"),
+                    metrics.get("conversion_rate"),
+                    metrics.get("average_order_value"),
+                    metrics.get("monthly_revenue"),
+                    revenue.get("total_uplift_percentage"),
+                    revenue.get("monthly_revenue_uplift"),
+                    payload.get("confidence_score"),
+                )
+            )
+            prefix = self.prefix.pop()
+            for issue in payload.get("issues_found") or [{}]:
+                self.chunks.append(prefix)
+                self.issue_writer.writerow(
+                    (
+                        issue.get("category"),
+                        issue.get("issue"),
+                        issue.get("severity"),
+                        issue.get("impact_score"),
+                        issue.get("potential_uplift"),
+                        issue.get("description"),
+                    )
+                )
+        return self.flush()
+
+    def flush(self) -> bytes:
+        content = "".join(self.chunks).encode()
+        self.chunks.clear()
+        return content
+
+
+async def export_audits(
+    pages: AsyncIterator[Sequence[Any]], export_format: ExportFormat
+) -> AsyncIterator[bytes]:
+    """
+    Encode export pages as NDJSON or CSV, one chunk per page.
+
+    Encoding a page takes milliseconds of CPU, it runs in a thread so the event loop keeps
+    serving other requests while an export streams.
+    """
+    if export_format == "ndjson":
+        encode = _encode_ndjson
+    else:
+        encoder = _CSVEncoder()
+        encode = encoder.encode
+        yield encoder.header()
+    async for rows in pages:
+        yield await asyncio.to_thread(encode, rows)
@@ -0,0 +1,81 @@
+import base64
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.repositories import AuditRepository
+
+from ..schemas.base import BaseModel
+from .cro_audit_service import normalize_website_url
+
+
+class AuditSummary(BaseModel):
+    audit_id: str
+    website_url: str
+    created_at: datetime
+    confidence_score: int
+    total_uplift_percentage: float
+    monthly_revenue_uplift: int
+    issue_count: int
+    high_severity_issues: int
+    medium_severity_issues: int
+    low_severity_issues: int
+
+
+class AuditHistoryPage(BaseModel):
+    audits: List[AuditSummary]
+    # Pass back as `cursor` for the next, older page; None on the last page
+    next_cursor: Optional[str] = None
+
+
+def audit_summary_columns(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """The denormalized listing columns of a serialized audit, stored next to its payload."""
+    issues = payload.get("issues_found", [])
+    severities = Counter(issue["severity"] for issue in issues)
+    revenue = payload.get("revenue_potential", {})
+    return {
+        "normalized_url": normalize_website_url(payload["website_url"]),
+        "confidence_score": payload["confidence_score"],
+        "total_uplift_percentage": revenue.get("total_uplift_percentage", 0.0),
+        "monthly_revenue_uplift": revenue.get("monthly_revenue_uplift", 0),
+        "issue_count": len(issues),
+        "high_severity_issues": severities["High"],
+        "medium_severity_issues": severities["Medium"],
+        "low_severity_issues": severities["Low"],
+    }
+
+
+def encode_cursor(created_at: datetime, audit_id: str) -> str:
+    key = f"{created_at.isoformat()}|{audit_id}".encode()
+    return base64.urlsafe_b64encode(key).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """The (created_at, audit_id) key a cursor resumes after, ValueError if malformed."""
+    try:
+        key = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, audit_id = key.split("|", 1)
+        return datetime.fromisoformat(created_at), audit_id
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {str(e)}") from e
+
+
+async def list_audit_history(
+    audit_repository: AuditRepository, website_url: str, cursor: Optional[str], limit: int
+) -> AuditHistoryPage:
+    """
+    One page of a site's audits, newest first.
+
+    Urls match in their normalized form, so http://Shop.com/ and http://shop.com list the
+    same history. Pages are keyset ranges of the history index, one more row than asked
+    for tells whether an older page exists.
+    """
+    before = decode_cursor(cursor) if cursor else None
+    rows = await audit_repository.list_by_url(
+        normalized_url=normalize_website_url(website_url), before=before, limit=limit + 1
+    )
+    audits = [AuditSummary.model_validate(row, from_attributes=True) for row in rows[:limit]]
+    next_cursor = None
+    if len(rows) > limit:
+        next_cursor = encode_cursor(audits[-1].created_at, audits[-1].audit_id)
+    return AuditHistoryPage(audits=audits, next_cursor=next_cursor)
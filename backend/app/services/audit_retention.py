@@ -0,0 +1,153 @@
+import asyncio
+import logging
+import re
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from app.repositories import AuditRepository
+
+logger = logging.getLogger(__name__)
+
+PARTITION_NAME = re.compile(r"^cro_audits_y(\d{4})m(\d{2})$")
+
+
+def month_start(value: datetime) -> datetime:
+    return datetime(value.year, value.month, 1)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: datetime) -> str:
+    return f"cro_audits_y{month.year:04d}m{month.month:02d}"
+
+
+def partition_month(name: str) -> Optional[datetime]:
+    """The month a partition covers, None for tables the sweeper does not manage."""
+    match = PARTITION_NAME.match(name)
+    if match is None:
+        return None
+    return datetime(int(match.group(1)), int(match.group(2)), 1)
+
+
+class AuditRetentionSweeper:
+    """
+    Background maintenance of the monthly `cro_audits` partitions.
+
+    Each sweep creates the partitions for the current month and the next
+    `partitions_ahead` ones, so inserts always have a partition to land in, and removes
+    every partition whose whole month is older than the retention period. Expiry is a
+    metadata operation on a whole partition, dropped or detached into a standalone table
+    for archiving, so it costs the same for ten rows or ten million and leaves no dead
+    tuples or index bloat behind as row-by-row deletes would.
+    """
+
+    def __init__(self) -> None:
+        self.audit_repository: Optional[AuditRepository] = None
+        self.retention_days: Optional[int] = None
+        self.partitions_ahead = 2
+        self.archive = False
+        self._task: Optional[asyncio.Task] = None
+        self._sweeps = 0
+        self._failures = 0
+        self._created = 0
+        self._expired = 0
+        self._last_sweep_at: Optional[datetime] = None
+
+    async def start(
+        self,
+        audit_repository: AuditRepository,
+        retention_days: Optional[int],
+        partitions_ahead: int,
+        interval_seconds: float,
+        retry_seconds: float,
+        archive: bool = False,
+    ) -> None:
+        if self._task is not None:
+            return
+        self.audit_repository = audit_repository
+        self.retention_days = retention_days
+        self.partitions_ahead = partitions_ahead
+        self.archive = archive
+        self._task = asyncio.create_task(self._run(interval_seconds, retry_seconds))
+        logger.info(
+            "Audit retention sweeper started",
+            extra={"retention_days": retention_days, "archive": archive},
+        )
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        logger.info("Audit retention sweeper stopped")
+
+    async def ensure_partitions(self, now: Optional[datetime] = None) -> List[str]:
+        """Create the current month's partition and the ones ahead, if they are missing."""
+        current = month_start(now or datetime.utcnow())
+        created = []
+        for offset in range(self.partitions_ahead + 1):
+            start = add_months(current, offset)
+            name = partition_name(start)
+            await self.audit_repository.create_partition(
+                name=name, start=start, end=add_months(start, 1)
+            )
+            created.append(name)
+        return created
+
+    async def sweep(self, now: Optional[datetime] = None) -> Dict[str, List[str]]:
+        now = now or datetime.utcnow()
+        created = await self.ensure_partitions(now)
+
+        expired = []
+        if self.retention_days is not None:
+            cutoff = now - timedelta(days=self.retention_days)
+            for name in sorted(await self.audit_repository.list_partitions()):
+                month = partition_month(name)
+                if month is None or add_months(month, 1) > cutoff:
+                    continue
+                if self.archive:
+                    await self.audit_repository.detach_partition(name=name)
+                else:
+                    await self.audit_repository.drop_partition(name=name)
+                expired.append(name)
+                logger.info(
+                    "Expired audit partition",
+                    extra={"partition": name, "archived": self.archive},
+                )
+
+        self._sweeps += 1
+        self._created += len(created)
+        self._expired += len(expired)
+        self._last_sweep_at = now
+        return {"ensured": created, "expired": expired}
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self._task is not None,
+            "sweeps": self._sweeps,
+            "failures": self._failures,
+            "partitions_ensured": self._created,
+            "partitions_expired": self._expired,
+            "last_sweep_at": self._last_sweep_at.isoformat() if self._last_sweep_at else None,
+        }
+
+    async def _run(self, interval_seconds: float, retry_seconds: float) -> None:
+        while True:
+            try:
+                await self.sweep()
+                delay = interval_seconds
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Startup runs before the database is connected, the first sweeps may fail
+                self._failures += 1
+                logger.warning(f"Audit retention sweep failed: {str(e)}")
+                delay = retry_seconds
+            await asyncio.sleep(delay)
+
+
+audit_retention_sweeper = AuditRetentionSweeper()
@@ -0,0 +1,140 @@
+import json
+import random
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Mapping, Optional, Tuple
+
+from pydantic import Field, TypeAdapter
+
+from ..schemas.base import BaseModel
+from .cro_audit_service import (
+    CROAuditResult,
+    build_current_metrics,
+    calculate_revenue_potential,
+    simulate_issue_uplift,
+)
+
+# Scenario inputs and the `current_metrics` keys the audit stores them under
+SCENARIO_INPUTS = {
+    "monthly_visitors": "monthly_visitors",
+    "current_conversion_rate": "conversion_rate",
+    "average_order_value": "average_order_value",
+}
+
+# Inputs and sections every audit section is computed from. Competitors are sampled
+# market data and issues come from the page, neither is redrawn for a what-if scenario.
+SECTION_DEPENDENCIES: Dict[str, Tuple[str, ...]] = {
+    "audit_id": (),
+    "website_url": ("website_url",),
+    "current_metrics": ("monthly_visitors", "current_conversion_rate", "average_order_value"),
+    "issues_found": ("website_url",),
+    "competitor_analysis": ("industry",),
+    "revenue_potential": (
+        "monthly_visitors",
+        "current_conversion_rate",
+        "average_order_value",
+        "issues_found",
+    ),
+    "recommendations": ("issues_found",),
+    "confidence_score": ("issues_found",),
+}
+
+SECTION_NAMES: Tuple[str, ...] = tuple(CROAuditResult.model_fields)
+SECTION_ADAPTERS: Dict[str, TypeAdapter] = {
+    name: TypeAdapter(field.annotation) for name, field in CROAuditResult.model_fields.items()
+}
+SECTION_KEYS: Dict[str, bytes] = {name: json.dumps(name).encode() + b":" for name in SECTION_NAMES}
+
+
+class AuditScenarioRequest(BaseModel):
+    monthly_visitors: Optional[int] = Field(None, ge=0)
+    current_conversion_rate: Optional[float] = Field(None, ge=0)
+    average_order_value: Optional[float] = Field(None, ge=0)
+
+
+def invalidated_sections(changed: Iterable[str]) -> Tuple[str, ...]:
+    """Sections that depend on any of `changed`, directly or through other sections."""
+    return _invalidated_sections(frozenset(changed))
+
+
+@lru_cache(maxsize=None)
+def _invalidated_sections(changed: FrozenSet[str]) -> Tuple[str, ...]:
+    stale = set()
+    pending = set(changed)
+    while pending:
+        dependents = {
+            section
+            for section, dependencies in SECTION_DEPENDENCIES.items()
+            if section not in stale and pending.intersection(dependencies)
+        }
+        stale |= dependents
+        pending = dependents
+    # Result field order is also a valid evaluation order of the graph
+    return tuple(section for section in SECTION_NAMES if section in stale)
+
+
+def serialize_sections(result: CROAuditResult) -> Dict[str, bytes]:
+    """Each section of an audit as its JSON value, ready to be spliced into a response."""
+    return {name: SECTION_ADAPTERS[name].dump_json(getattr(result, name)) for name in SECTION_NAMES}
+
+
+def _current_metrics(result: CROAuditResult, inputs: Mapping[str, Any]) -> Dict:
+    return build_current_metrics(
+        inputs["monthly_visitors"], inputs["current_conversion_rate"], inputs["average_order_value"]
+    )
+
+
+def _revenue_potential(result: CROAuditResult, inputs: Mapping[str, Any]) -> Dict:
+    # The uplift distribution depends on the issues only, keep the stored one rather than
+    # redrawing it, so the scenario moves revenue and nothing else
+    stored = result.revenue_potential
+    simulation = stored.get("uplift_percentage_range")
+    roi_timeframe = stored.get("roi_timeframe")
+    rng = None
+    if simulation is None or roi_timeframe is None:
+        # Audits stored before uplift ranges existed: draw them from the stored issues
+        rng = random.Random(result.audit_id)
+        simulation = simulation or simulate_issue_uplift(result.issues_found, rng)
+    return calculate_revenue_potential(
+        inputs["monthly_visitors"],
+        inputs["current_conversion_rate"],
+        inputs["average_order_value"],
+        result.issues_found,
+        rng,
+        simulation,
+        roi_timeframe,
+    )
+
+
+SECTION_BUILDERS: Dict[str, Callable[[CROAuditResult, Mapping[str, Any]], Any]] = {
+    "current_metrics": _current_metrics,
+    "revenue_potential": _revenue_potential,
+}
+
+
+def apply_scenario(
+    result: CROAuditResult, sections: Mapping[str, bytes], scenario: AuditScenarioRequest
+) -> Tuple[bytes, Tuple[str, ...]]:
+    """
+    Re-evaluate a stored audit under new traffic and revenue inputs.
+
+    Only the sections `invalidated_sections` reaches from the changed inputs are
+    recomputed and serialized again; every other section is spliced into the response
+    from its already serialized `sections` bytes. Returns the JSON body and the sections
+    that were recomputed.
+    """
+    inputs = {name: result.current_metrics[key] for name, key in SCENARIO_INPUTS.items()}
+    changed = set()
+    for name, value in scenario.model_dump(exclude_none=True).items():
+        if value != inputs[name]:
+            inputs[name] = value
+            changed.add(name)
+
+    stale = invalidated_sections(changed)
+    parts = []
+    for name in SECTION_NAMES:
+        if name in stale:
+            value = SECTION_ADAPTERS[name].dump_json(SECTION_BUILDERS[name](result, inputs))
+        else:
+            value = sections[name]
+        parts.append(SECTION_KEYS[name] + value)
+    return b"{" + b",".join(parts) + b"}", stale
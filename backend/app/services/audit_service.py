@@ -0,0 +1,239 @@
+import asyncio
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
+
+from app.core.cache import LRUCache
+from app.core.fetcher import FetchedPage, SiteFetcher
+from app.core.jobs import Job, JobQueue, JobStatus
+from app.core.monitoring.decorators import monitor_transaction
+from app.core.singleflight import SingleFlight
+from app.core.write_behind import lead_buffer
+from app.services.audit_retention import audit_retention_sweeper
+from app.services.audit_store import AuditStore
+from app.services.cro_audit_service import (
+    CROAuditResult,
+    SiteAnalysisRequest,
+    assemble_audit_result,
+    audit_request_key,
+    iter_audit_sections,
+    iter_result_sections,
+    run_audit_pipeline,
+)
+from app.services.cro_catalog import get_catalog, get_catalog_loader
+from app.services.page_analysis import detect_page_issues
+
+
+class SectionFeed:
+    """Audit sections published by one streaming run, readable by any number of callers."""
+
+    def __init__(self) -> None:
+        self.sections: List[Tuple[str, Any]] = []
+        self.closed = False
+        self._error: Optional[BaseException] = None
+        self._updated = asyncio.Event()
+
+    def append(self, section: Tuple[str, Any]) -> None:
+        self.sections.append(section)
+        self._notify()
+
+    def close(self, error: Optional[BaseException] = None) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        self._error = error
+        self._notify()
+
+    async def __aiter__(self) -> AsyncIterator[Tuple[str, Any]]:
+        index = 0
+        while True:
+            if index < len(self.sections):
+                yield self.sections[index]
+                index += 1
+            elif self.closed:
+                if self._error is not None:
+                    raise self._error
+                return
+            else:
+                await self._updated.wait()
+
+    def _notify(self) -> None:
+        # A fresh event per update, readers waiting on the old one all wake up
+        updated, self._updated = self._updated, asyncio.Event()
+        updated.set()
+
+
+class CROAuditService:
+    def __init__(
+        self,
+        audit_store: AuditStore,
+        job_queue: JobQueue,
+        deterministic: bool = True,
+        memo_size: int = 4096,
+        memo_ttl: float = 3600,
+        site_fetcher: Optional[SiteFetcher] = None,
+    ):
+        self.audit_store = audit_store
+        self.job_queue = job_queue
+        self.site_fetcher = site_fetcher
+        self.deterministic = deterministic
+        # Identical deterministic requests map to identical reports, so they can be served
+        # from memory instead of re-running the pipeline and storing a duplicate audit
+        self.memo: LRUCache[str, CROAuditResult] = LRUCache(max_size=memo_size, ttl=memo_ttl)
+        # Double clicks and client retries send the same request while the first one is
+        # still running: streams share one pipeline run, submits share one job
+        self.stream_flights: SingleFlight[str, CROAuditResult] = SingleFlight()
+        self.stream_feeds: Dict[str, SectionFeed] = {}
+        self._stream_waits: Set[asyncio.Future] = set()
+        self.submitted_jobs: Dict[str, Job] = {}
+        self.coalesced_submits = 0
+
+    def get_memoized(self, request: SiteAnalysisRequest) -> Optional[CROAuditResult]:
+        if not self.deterministic:
+            return None
+        return self.memo.get(self._request_key(request))
+
+    @monitor_transaction(op="cro_audit.submit", tags={"service": "cro_audit->submit"})
+    async def submit(self, request: SiteAnalysisRequest) -> Job:
+        """Queue an audit and return its job; the job id doubles as the audit id."""
+        result = self.get_memoized(request)
+        if result is not None:
+            now = datetime.utcnow()
+            return Job(
+                job_id=result.audit_id,
+                status=JobStatus.DONE,
+                created_at=now,
+                started_at=now,
+                finished_at=now,
+            )
+
+        key = self._request_key(request)
+        job = self.submitted_jobs.get(key)
+        if job is not None and job.status in (JobStatus.QUEUED, JobStatus.RUNNING):
+            self.coalesced_submits += 1
+            return job
+
+        async def execute(job: Job) -> None:
+            try:
+                page = await self._fetch_page(request)
+                result = await self.job_queue.run_cpu(
+                    run_audit_pipeline, request, self.deterministic, page
+                )
+                await self._store(request, result.model_copy(update={"audit_id": job.job_id}))
+            finally:
+                if self.submitted_jobs.get(key) is job:
+                    del self.submitted_jobs[key]
+
+        job = self.job_queue.submit(execute)
+        self.submitted_jobs[key] = job
+        return job
+
+    async def stream(self, request: SiteAnalysisRequest) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Yield audit sections as they are produced, then persist the assembled audit.
+
+        Identical requests streamed at the same time share one run: the run is a flight of
+        `stream_flights` that publishes its sections to a `SectionFeed`, and every caller
+        reads the feed from the start. The run is shielded from its callers, a client that
+        disconnects stops reading without stopping the audit the others are waiting for.
+        """
+        result = self.get_memoized(request)
+        if result is not None:
+            for section in iter_result_sections(result):
+                yield section
+            return
+
+        key = self._request_key(request)
+        feed = self.stream_feeds.get(key)
+        if feed is None or feed.closed:
+            feed = SectionFeed()
+            self.stream_feeds[key] = feed
+        waiter = asyncio.ensure_future(
+            self.stream_flights.do(key, lambda: self._produce_stream(request, key, feed))
+        )
+        self._stream_waits.add(waiter)
+        waiter.add_done_callback(lambda finished: self._finish_feed(key, feed, finished))
+        async for section in feed:
+            yield section
+
+    async def _produce_stream(
+        self, request: SiteAnalysisRequest, key: str, feed: SectionFeed
+    ) -> CROAuditResult:
+        try:
+            page = await self._fetch_page(request)
+            # Rule scanning a multi-megabyte page takes seconds, it runs where jobs run it
+            detected_issues = await self.job_queue.run_cpu(detect_page_issues, page)
+            producer = iter_audit_sections(
+                request, self.deterministic, detected_issues=detected_issues
+            )
+            while True:
+                # Each section, the uplift simulation included, is computed off the loop
+                section = await asyncio.to_thread(next, producer, None)
+                if section is None:
+                    break
+                feed.append(section)
+            result = await self._store(request, assemble_audit_result(feed.sections))
+        except BaseException as e:
+            feed.close(error=e)
+            raise
+        finally:
+            if self.stream_feeds.get(key) is feed:
+                del self.stream_feeds[key]
+        feed.close()
+        return result
+
+    def _finish_feed(self, key: str, feed: SectionFeed, waiter: asyncio.Future) -> None:
+        self._stream_waits.discard(waiter)
+        if self.stream_feeds.get(key) is feed:
+            del self.stream_feeds[key]
+        # Retrieved here as well, readers already got the failure through the feed
+        error = asyncio.CancelledError() if waiter.cancelled() else waiter.exception()
+        if feed.closed:
+            return
+        # The caller joined a flight that was already finishing with another feed
+        if error is not None:
+            feed.close(error=error)
+        else:
+            for section in iter_result_sections(waiter.result()):
+                feed.append(section)
+            feed.close()
+
+    async def get_job(self, job_id: str) -> Optional[Job]:
+        return await self.job_queue.get(job_id)
+
+    async def _fetch_page(self, request: SiteAnalysisRequest) -> Optional[FetchedPage]:
+        if self.site_fetcher is None or not self.site_fetcher.started:
+            return None
+        return await self.site_fetcher.fetch(str(request.website_url))
+
+    async def _store(self, request: SiteAnalysisRequest, result: CROAuditResult) -> CROAuditResult:
+        result = await self.audit_store.save(result)
+        if self.deterministic:
+            self.memo.set(self._request_key(request), result)
+        return result
+
+    def _request_key(self, request: SiteAnalysisRequest) -> str:
+        # Normalized request plus catalog digest, a catalog reload changes the report
+        return f"{get_catalog().digest}|{audit_request_key(request)}"
+
+    def metrics(self) -> Dict[str, Any]:
+        metrics = {
+            "memo": self.memo.stats(),
+            "jobs": self.job_queue.metrics(),
+            "catalog": get_catalog_loader().metrics(),
+            "encoded_audits": self.audit_store.encoded_cache.stats(),
+            "shared_cache": (
+                self.audit_store.shared_cache.stats() if self.audit_store.shared_cache else None
+            ),
+            "retention": audit_retention_sweeper.stats(),
+            "leads": lead_buffer.metrics(),
+            "coalescing": {
+                "stream": self.stream_flights.stats(),
+                "submit": {
+                    "in_flight": len(self.submitted_jobs),
+                    "coalesced": self.coalesced_submits,
+                },
+            },
+        }
+        if self.site_fetcher is not None:
+            metrics["fetcher"] = self.site_fetcher.metrics()
+        return metrics
@@ -0,0 +1,115 @@
+import asyncio
+import json
+from typing import Any, Dict, List, Optional
+
+from app.core.cache import LRUCache
+from app.core.http_cache import EncodedBody
+from app.core.monitoring.decorators import monitor_transaction
+from app.core.shared_cache import SharedCache
+from app.repositories import AuditRepository
+from app.services.audit_history import audit_summary_columns
+from app.services.audit_scenarios import serialize_sections
+from app.services.cro_audit_service import CROAuditResult
+
+
+class AuditStore:
+    """
+    Durable audit storage with a bounded in-memory hot tier.
+
+    Writes go through to Postgres, the node-local shared cache and the LRU tier. Reads
+    try the LRU tier, then the shared cache, which holds audits written by every worker
+    on the host, and fall back to the database. Since a stored audit never changes, its
+    serialized and compressed response bodies are cached as well.
+    """
+
+    SHARED_NAMESPACE = "audit"
+
+    def __init__(
+        self,
+        audit_repository: AuditRepository,
+        hot_cache_size: int,
+        encoded_cache_size: int = 1024,
+        shared_cache: Optional[SharedCache] = None,
+    ):
+        self.audit_repository = audit_repository
+        self.shared_cache = shared_cache
+        self.hot_cache: LRUCache[str, CROAuditResult] = LRUCache(max_size=hot_cache_size)
+        self.encoded_cache: LRUCache[str, EncodedBody] = LRUCache(max_size=encoded_cache_size)
+        self.section_cache: LRUCache[str, Dict[str, bytes]] = LRUCache(max_size=encoded_cache_size)
+
+    @monitor_transaction(op="audit_store.save", tags={"service": "audit_store->save"})
+    async def save(self, result: CROAuditResult) -> CROAuditResult:
+        payload = result.model_dump(mode="json")
+        await self.audit_repository.create(
+            audit_id=result.audit_id,
+            website_url=result.website_url,
+            payload=payload,
+            summary=audit_summary_columns(payload),
+        )
+        if self.shared_cache is not None:
+            await self.shared_cache.aset(
+                self.SHARED_NAMESPACE, result.audit_id, result.model_dump_json().encode()
+            )
+        self.hot_cache.set(result.audit_id, result)
+        return result
+
+    @monitor_transaction(op="audit_store.save_many", tags={"service": "audit_store->save_many"})
+    async def save_many(self, payloads: List[Dict[str, Any]]) -> int:
+        """Persist already-serialized audits; they enter the hot tier on first read."""
+        count = await self.audit_repository.create_many(
+            payloads=payloads, summaries=[audit_summary_columns(payload) for payload in payloads]
+        )
+        if self.shared_cache is not None:
+            # The generator is consumed in the cache's thread, encoding included
+            await self.shared_cache.aset_many(
+                self.SHARED_NAMESPACE,
+                ((payload["audit_id"], json.dumps(payload).encode()) for payload in payloads),
+            )
+        return count
+
+    async def get(self, audit_id: str) -> Optional[CROAuditResult]:
+        result = self.hot_cache.get(audit_id)
+        if result is not None:
+            return result
+
+        content = None
+        if self.shared_cache is not None:
+            content = await self.shared_cache.aget(self.SHARED_NAMESPACE, audit_id)
+        if content is not None:
+            result = CROAuditResult.model_validate_json(content)
+        else:
+            record = await self.audit_repository.get_by_id(audit_id=audit_id)
+            if record is None:
+                return None
+            result = CROAuditResult.model_validate(record.payload)
+            if self.shared_cache is not None:
+                await self.shared_cache.aset(
+                    self.SHARED_NAMESPACE, audit_id, result.model_dump_json().encode()
+                )
+        self.hot_cache.set(audit_id, result)
+        return result
+
+    async def get_encoded(self, audit_id: str) -> Optional[EncodedBody]:
+        """The audit as ready-to-send JSON bytes in every content coding, see `EncodedBody`."""
+        encoded = self.encoded_cache.get(audit_id)
+        if encoded is not None:
+            return encoded
+        result = await self.get(audit_id)
+        if result is None:
+            return None
+        # Compression runs once per audit, keep it off the event loop
+        encoded = await asyncio.to_thread(EncodedBody, result.model_dump_json().encode())
+        self.encoded_cache.set(audit_id, encoded)
+        return encoded
+
+    async def get_sections(self, audit_id: str) -> Optional[Dict[str, bytes]]:
+        """The audit's sections serialized one by one, see `serialize_sections`."""
+        sections = self.section_cache.get(audit_id)
+        if sections is not None:
+            return sections
+        result = await self.get(audit_id)
+        if result is None:
+            return None
+        sections = serialize_sections(result)
+        self.section_cache.set(audit_id, sections)
+        return sections
@@ -5,15 +5,15 @@ import sentry_sdk
 
 from app.core.exceptions import ConflictException, ErrorDetail, UnauthorizedException
 from app.core.monitoring.decorators import monitor_transaction
+from app.core.security.hashing import password_hasher
 from app.core.security.security import (
     create_access_token,
     create_otp,
     create_refresh_token,
     create_verification_token,
-    get_password_hash,
-    verify_password,
     verify_token,
 )
+from app.core.security.token_cache import revoke_cached_tokens
 from app.models.domain import (
     SignupRequest,
     UserCreate,
@@ -39,14 +39,7 @@ class AuthService:
     @monitor_transaction(op="auth.signup", tags={"service": "auth->signup"})
     async def signup(self, signup_data: SignupRequest):
         try:
-            existing_user = await self.user_repository.get_by_email(email=signup_data.email)
-            if existing_user:
-                raise ConflictException(
-                    message="Email already registered",
-                    details=[ErrorDetail(field="email", message="Email already registered")],
-                )
-
-            hashed_password = get_password_hash(signup_data.password)
+            hashed_password = await password_hasher.hash(signup_data.password)
 
             user = UserCreate(
                 full_name=signup_data.full_name,
@@ -54,18 +47,27 @@ class AuthService:
                 password=hashed_password,
             )
 
-            created_user = await self.user_repository.create(user_create=user)
-
-
-            refresh_token, token_created_at = create_refresh_token(data={"sub": str(created_user.id)})
+            # The row is written with its token creation time, the tokens are issued at it
+            token_created_at = datetime.utcnow()
+            created_user = await self.user_repository.create_if_absent(
+                user_create=user, token_creation_at=token_created_at
+            )
+            if created_user is None:
+                raise ConflictException(
+                    message="Email already registered",
+                    details=[ErrorDetail(field="email", message="Email already registered")],
+                )
 
-            access_token, _ = create_access_token(
-                data={"sub": str(created_user.id)}, created_at=token_created_at
+            refresh_token, _ = create_refresh_token(
+                data={"sub": str(created_user.id)}, issued_at=token_created_at
             )
 
-            await self.user_repository.update_token_creation_at(
-                user_id=created_user.id, token_creation_at=token_created_at
+            access_token, _ = create_access_token(
+                data={"sub": str(created_user.id)},
+                created_at=token_created_at,
+                issued_at=token_created_at,
             )
+            await revoke_cached_tokens(created_user.id)
 
             # Combine user and profile data for response
             response_data = {**created_user.dict()}
@@ -92,6 +94,7 @@ class AuthService:
             created_at=refresh_data["iat"],
         )
         await self.user_repository.update_token_creation_at(user_id=int(refresh_data["sub"]), token_creation_at=token_create_at)
+        await revoke_cached_tokens(refresh_data["sub"])
         return access_token
 
     @monitor_transaction(op="auth.login", tags={"service": "auth->login"})
@@ -105,20 +108,24 @@ class AuthService:
                 details=[ErrorDetail(field="email", message="Invalid email or password")],
             )
 
-        if not verify_password(password, user.password):
+        valid, upgraded_hash = await password_hasher.verify_and_update(password, user.password)
+        if not valid:
             raise UnauthorizedException(
                 message="Invalid credentials",
                 details=[ErrorDetail(field="password", message="Invalid email or password")],
             )
 
-        await self.user_repository.update_last_login(user_id=user.id)
-
         refresh_token, token_created_at = create_refresh_token({"sub": str(user.id)})
 
         access_token, token_created_at = create_access_token(
             {"sub": str(user.id)}, created_at=token_created_at
         )
-        await self.user_repository.update_token_creation_at(user_id=user.id, token_creation_at=token_created_at)
+        # One UPDATE for the login time, the new token version and, when the stored hash is
+        # below the current cost, the rehashed password only known here
+        await self.user_repository.record_login(
+            user_id=user.id, token_creation_at=token_created_at, hashed_password=upgraded_hash
+        )
+        await revoke_cached_tokens(user.id)
 
         sentry_sdk.add_breadcrumb(
             category="auth",
@@ -137,9 +144,10 @@ class AuthService:
         if not user:
             raise UnauthorizedException("Invalid email")
 
-        hashed_password = get_password_hash(reset_password_data.password)
+        hashed_password = await password_hasher.hash(reset_password_data.password)
 
         await self.user_repository.update(user_id=user.id, user_data={"password": hashed_password})
+        await revoke_cached_tokens(user.id)
 
         sentry_sdk.add_breadcrumb(
             category="auth",
@@ -0,0 +1,235 @@
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from ..core.ids import time_ordered_id
+from .cro_audit_service import (
+    COMPETITOR_MIN_PERCENTILE,
+    SiteAnalysisRequest,
+    project_revenue,
+)
+from .cro_catalog import CROCatalog, get_catalog
+from .industry_benchmarks import get_benchmark_index
+from .uplift_simulation import SIMULATED_ISSUES, SIMULATION_DRAWS, simulate_uplift_batch
+
+TOP_ISSUES = SIMULATED_ISSUES
+COMPETITOR_COUNT = 3
+
+
+def competitor_conversion_rates(
+    requests: List[SiteAnalysisRequest], conversion_rates: np.ndarray, rng: np.random.Generator
+) -> np.ndarray:
+    """Batch form of the competitor sampling in `generate_competitor_data`."""
+    shape = (len(requests), COMPETITOR_COUNT)
+    index = get_benchmark_index()
+    if index is None:
+        return conversion_rates[:, None] + rng.uniform(0.5, 2.5, size=shape)
+    percentiles = index.matrices["conversion_rate"]
+    rows = np.array([index.row(request.industry) for request in requests])
+    site_ranks = (percentiles[rows] < conversion_rates[:, None]).sum(axis=1)
+    lowest_ranks = np.minimum(np.maximum(site_ranks, COMPETITOR_MIN_PERCENTILE) + 1, 99)
+    ranks = rng.integers(lowest_ranks[:, None], 100, size=shape)
+    return percentiles[rows[:, None], ranks - 1].astype(float)
+
+
+def generate_audits_batch(
+    requests: List[SiteAnalysisRequest],
+    rng: Optional[np.random.Generator] = None,
+    catalog: Optional[CROCatalog] = None,
+    draws: int = SIMULATION_DRAWS,
+) -> List[Dict[str, Any]]:
+    """
+    Generate audits for many sites in one vectorized pass.
+
+    Every random draw of the scalar pipeline (issue selection, severities, impact
+    scores, uplifts, competitors, recommendations) is sampled as an array over the
+    whole batch and revenue is computed with array math. Results are returned as
+    JSON-ready dicts shaped like `CROAuditResult`: building a pydantic model per
+    site would cost more than generating the audit itself.
+
+    The uplift simulation runs the same SIMULATION_DRAWS per site as a single audit, so
+    batch results are as stable as scalar ones.
+    """
+    if not requests:
+        return []
+    rng = rng or np.random.default_rng()
+    catalog = catalog or get_catalog()
+    site_count = len(requests)
+    catalog_size = len(catalog.issues)
+    min_issues, max_issues = catalog.issue_count_range
+    max_issues = min(max_issues, catalog_size)
+
+    visitors = np.array([request.monthly_visitors for request in requests], dtype=float)
+    conversion_rates = np.array([request.current_conversion_rate for request in requests])
+    order_values = np.array([request.average_order_value for request in requests])
+
+    # Issue selection: a random permutation of the catalog per site, truncated to its issue count
+    issue_counts = rng.integers(min_issues, max_issues + 1, size=site_count)
+    picked = np.argsort(rng.random((site_count, catalog_size)), axis=1)[:, :max_issues]
+    selected = np.arange(max_issues) < issue_counts[:, None]
+
+    # Severity codes 0/1/2 (High/Medium/Low), skewed towards High for weak conversion rates
+    high_weight = np.where(conversion_rates < 2.0, 0.4, 0.2)[:, None]
+    severity_draws = rng.random((site_count, max_issues))
+    severity_codes = (severity_draws >= high_weight).astype(np.int64) + (
+        severity_draws >= high_weight + 0.4
+    )
+
+    parameters = catalog.severity_table[severity_codes]
+    impact_scores = np.floor(
+        parameters[..., 0]
+        + rng.random(severity_codes.shape) * (parameters[..., 1] - parameters[..., 0] + 1)
+    ).astype(np.int64)
+    uplifts = np.round(
+        parameters[..., 2]
+        + rng.random(severity_codes.shape) * (parameters[..., 3] - parameters[..., 2]),
+        1,
+    )
+    categories = catalog.issue_category_index[picked]
+    bounds = catalog.description_bounds[categories]
+    description_percents = rng.integers(bounds[..., 0], bounds[..., 1] + 1)
+
+    # Order each site's issues by impact score, pushing unselected slots to the end
+    order = np.argsort(np.where(selected, -impact_scores, 1), axis=1, kind="stable")
+    picked, selected, severity_codes, impact_scores, uplifts, categories, description_percents = (
+        np.take_along_axis(values, order, axis=1)
+        for values in (
+            picked,
+            selected,
+            severity_codes,
+            impact_scores,
+            uplifts,
+            categories,
+            description_percents,
+        )
+    )
+
+    # Revenue model over the whole batch
+    simulation = simulate_uplift_batch(
+        uplifts[:, :TOP_ISSUES], severity_codes[:, :TOP_ISSUES], rng, draws
+    )
+    realistic_uplift = simulation["p50"]
+    current_revenue, new_conversion_rates, new_revenue, monthly_uplift = project_revenue(
+        visitors, conversion_rates, order_values, realistic_uplift
+    )
+    uplift_ranges = {quantile: simulation[quantile] for quantile in ("p10", "p50", "p90")}
+    revenue_ranges = {
+        quantile: project_revenue(visitors, conversion_rates, order_values, uplift)[3]
+        for quantile, uplift in uplift_ranges.items()
+    }
+    roi_months = rng.integers(2, 7, size=site_count)
+
+    competitor_rates = np.round(competitor_conversion_rates(requests, conversion_rates, rng), 2)
+    competitor_revenues = rng.integers(500000, 2000001, size=(site_count, COMPETITOR_COUNT))
+    competitor_advantages = rng.integers(
+        0, len(catalog.competitor_advantages), size=(site_count, COMPETITOR_COUNT)
+    )
+
+    recommendation_picks = rng.integers(
+        0, len(catalog.recommendations[0]), size=(site_count, TOP_ISSUES)
+    )
+    general_picks = np.argsort(
+        rng.random((site_count, len(catalog.general_recommendations))), axis=1
+    )[:, :2]
+    confidence_scores = simulation["confidence"]
+
+    columns = {
+        "picked": picked.tolist(),
+        "selected": selected.tolist(),
+        "severity": severity_codes.tolist(),
+        "impact": impact_scores.tolist(),
+        "uplift": uplifts.tolist(),
+        "category": categories.tolist(),
+        "percent": description_percents.tolist(),
+    }
+
+    competitor_rates = competitor_rates.tolist()
+    competitor_revenues = competitor_revenues.tolist()
+    competitor_advantages = competitor_advantages.tolist()
+    recommendation_picks = recommendation_picks.tolist()
+    general_picks = general_picks.tolist()
+    confidence_scores = confidence_scores.tolist()
+    uplift_ranges = {quantile: values.tolist() for quantile, values in uplift_ranges.items()}
+    revenue_ranges = {quantile: values.tolist() for quantile, values in revenue_ranges.items()}
+    current_revenue, new_revenue, monthly_uplift = (
+        current_revenue.tolist(),
+        new_revenue.tolist(),
+        monthly_uplift.tolist(),
+    )
+    conversion_rates, new_conversion_rates, realistic_uplift, roi_months = (
+        conversion_rates.tolist(),
+        new_conversion_rates.tolist(),
+        realistic_uplift.tolist(),
+        roi_months.tolist(),
+    )
+
+    payloads = []
+    for row, request in enumerate(requests):
+        issues = [
+            {
+                "category": catalog.categories[category],
+                "issue": catalog.issues[issue_index],
+                "severity": catalog.severities[severity],
+                "impact_score": impact,
+                "potential_uplift": uplift,
+                "description": catalog.description_texts[category][percent],
+            }
+            for issue_index, is_selected, severity, impact, uplift, category, percent in zip(
+                *(columns[name][row] for name in columns)
+            )
+            if is_selected
+        ]
+
+        recommendations: List[str] = []
+        for slot, category in enumerate(columns["category"][row][:TOP_ISSUES]):
+            recommendation = catalog.recommendations[category][recommendation_picks[row][slot]]
+            if recommendation not in recommendations:
+                recommendations.append(recommendation)
+        recommendations.extend(
+            catalog.general_recommendations[index] for index in general_picks[row]
+        )
+
+        payloads.append(
+            {
+                "audit_id": time_ordered_id(),
+                "website_url": str(request.website_url),
+                "current_metrics": {
+                    "monthly_visitors": request.monthly_visitors,
+                    "conversion_rate": request.current_conversion_rate,
+                    "average_order_value": request.average_order_value,
+                    "monthly_revenue": round(current_revenue[row]),
+                },
+                "issues_found": issues,
+                "competitor_analysis": [
+                    {
+                        "name": catalog.competitor_names[slot],
+                        "conversion_rate": competitor_rates[row][slot],
+                        "estimated_revenue": competitor_revenues[row][slot],
+                        "key_advantage": catalog.competitor_advantages[
+                            competitor_advantages[row][slot]
+                        ],
+                    }
+                    for slot in range(COMPETITOR_COUNT)
+                ],
+                "revenue_potential": {
+                    "current_monthly_revenue": round(current_revenue[row]),
+                    "potential_monthly_revenue": round(new_revenue[row]),
+                    "monthly_revenue_uplift": round(monthly_uplift[row]),
+                    "annual_revenue_uplift": round(monthly_uplift[row] * 12),
+                    "current_conversion_rate": round(conversion_rates[row], 2),
+                    "potential_conversion_rate": round(new_conversion_rates[row], 2),
+                    "total_uplift_percentage": round(realistic_uplift[row], 1),
+                    "uplift_percentage_range": {
+                        quantile: round(values[row], 1)
+                        for quantile, values in uplift_ranges.items()
+                    },
+                    "monthly_revenue_uplift_range": {
+                        quantile: round(values[row]) for quantile, values in revenue_ranges.items()
+                    },
+                    "roi_timeframe": f"{roi_months[row]} months",
+                },
+                "recommendations": recommendations[:8],
+                "confidence_score": confidence_scores[row],
+            }
+        )
+    return payloads
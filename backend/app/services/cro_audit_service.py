@@ -1,8 +1,17 @@
-from typing import List, Dict
+from typing import Any, List, Dict, Iterable, Iterator, Optional, Tuple
+from urllib.parse import urlsplit
 from pydantic import HttpUrl
+from ..core.fetcher import FetchedPage
+from ..core.ids import time_ordered_id
 from ..schemas.base import BaseModel
+from .cro_catalog import CROCatalog, get_catalog
+from .industry_benchmarks import get_benchmark_index
+from .page_analysis import detect_page_issues
+from .uplift_simulation import SIMULATED_ISSUES, simulate_uplift
+from itertools import accumulate
+import hashlib
+import numpy as np
 import random
-import uuid
 
 class CROIssue(BaseModel):
     category: str
@@ -36,120 +45,121 @@ class SiteAnalysisRequest(BaseModel):
     industry: str = "ecommerce"
     primary_goal: str
 
+# --- Catalog ---
+# Issues, severities, descriptions and recommendations live in app/data/cro_catalog.json,
+# see CROCatalog
+
+# Competitors are drawn from the industry distribution above the median and the site itself
+COMPETITOR_MIN_PERCENTILE = 50
+
 # --- Core Logic ---
-def generate_cro_issues(website_url: str, conversion_rate: float, aov: float) -> List[CROIssue]:
-    # ...copy logic from reference_code.py...
-    issue_templates = [
-        {"category": "Checkout Process", "issues": [
-            "Multi-step checkout causing 34% cart abandonment",
-            "Missing trust badges on checkout page",
-            "No guest checkout option available",
-            "Payment method limitations detected",
-            "Unexpected shipping costs revealed at checkout"
-        ]},
-        {"category": "Product Pages", "issues": [
-            "Product images lacking zoom functionality",
-            "Missing product reviews and ratings",
-            "Unclear product descriptions and benefits",
-            "No size guide or product specifications",
-            "Poor mobile product page experience"
-        ]},
-        {"category": "Site Performance", "issues": [
-            "Page load time exceeding 3.2 seconds",
-            "Mobile site speed issues detected",
-            "Images not optimized for web",
-            "Third-party scripts slowing site",
-            "Core Web Vitals failing Google standards"
-        ]},
-        {"category": "User Experience", "issues": [
-            "No live chat or customer support visible",
-            "Search functionality returning poor results",
-            "Navigation menu too complex",
-            "Missing breadcrumb navigation",
-            "No clear value proposition on homepage"
-        ]},
-        {"category": "Social Proof", "issues": [
-            "No customer testimonials displayed",
-            "Missing social media integration",
-            "No urgency or scarcity indicators",
-            "Return policy not prominently displayed",
-            "No security certifications visible"
-        ]}
-    ]
-    issues = []
-    num_issues = random.randint(8, 15)
+def iter_cro_issues(website_url: str, conversion_rate: float, aov: float, rng: Optional[random.Random] = None, detected_issues: Optional[List[str]] = None, catalog: Optional[CROCatalog] = None) -> Iterator[CROIssue]:
+    """
+    Yield issues in generation order, before any impact ordering is applied.
+
+    `detected_issues` are catalog issues observed on the fetched page; when given they are
+    reported instead of random catalog picks, with severity and impact still drawn from `rng`.
+    Detected issues missing from the catalog (e.g. removed by a reload) are skipped.
+    """
+    rng = rng or random.Random()
+    catalog = catalog or get_catalog()
     severity_weights = {
         "High": 0.4 if conversion_rate < 2.0 else 0.2,
         "Medium": 0.4,
         "Low": 0.2 if conversion_rate < 2.0 else 0.4
     }
-    used_issues = set()
-    for _ in range(num_issues):
-        category_data = random.choice(issue_templates)
-        available_issues = [issue for issue in category_data["issues"] if issue not in used_issues]
-        if not available_issues:
-            continue
-        issue_text = random.choice(available_issues)
-        used_issues.add(issue_text)
-        severity = random.choices(list(severity_weights.keys()), weights=list(severity_weights.values()))[0]
-        if severity == "High":
-            impact_score = random.randint(70, 95)
-            potential_uplift = random.uniform(15, 45)
-        elif severity == "Medium":
-            impact_score = random.randint(40, 69)
-            potential_uplift = random.uniform(8, 20)
-        else:
-            impact_score = random.randint(15, 39)
-            potential_uplift = random.uniform(2, 10)
-        descriptions = {
-            "Checkout Process": f"This checkout issue is costing you approximately {random.randint(20, 50)}% of potential conversions.",
-            "Product Pages": f"Product page optimization could increase conversion rates by {random.randint(10, 25)}%.",
-            "Site Performance": f"Site speed improvements typically result in {random.randint(15, 30)}% conversion uplift.",
-            "User Experience": f"UX improvements in this area show average gains of {random.randint(12, 28)}%.",
-            "Social Proof": f"Adding social proof elements can boost conversions by {random.randint(8, 22)}%."
-        }
-        issues.append(CROIssue(
-            category=category_data["category"],
-            issue=issue_text,
+    severities = list(severity_weights)
+    cum_weights = list(accumulate(severity_weights.values()))
+    if detected_issues is None:
+        picks = catalog.draw_issues(rng)
+    else:
+        picks = (catalog.issue_codes[issue] for issue in detected_issues if issue in catalog.issue_codes)
+    for issue in picks:
+        category = catalog.issue_categories[issue]
+        severity = rng.choices(severities, cum_weights=cum_weights)[0]
+        impact_low, impact_high, uplift_low, uplift_high = catalog.severity_parameters[severity]
+        impact_score = rng.randint(impact_low, impact_high)
+        potential_uplift = rng.uniform(uplift_low, uplift_high)
+        template, percent_low, percent_high = catalog.descriptions[category]
+        yield CROIssue(
+            category=catalog.categories[category],
+            issue=catalog.issues[issue],
             severity=severity,
             impact_score=impact_score,
             potential_uplift=round(potential_uplift, 1),
-            description=descriptions[category_data["category"]]
-        ))
+            description=template.format(rng.randint(percent_low, percent_high))
+        )
+
+def generate_cro_issues(website_url: str, conversion_rate: float, aov: float, rng: Optional[random.Random] = None) -> List[CROIssue]:
+    issues = iter_cro_issues(website_url, conversion_rate, aov, rng)
     return sorted(issues, key=lambda x: x.impact_score, reverse=True)
 
-def generate_competitor_data(industry: str, current_cr: float) -> List[CompetitorData]:
-    competitor_names = [
-        "Market Leader Pro", "Industry Pioneer", "Conversion Expert Co",
-        "E-commerce Elite", "Digital Commerce Pro", "Online Retail Master"
-    ]
+def generate_competitor_data(industry: str, current_cr: float, rng: Optional[random.Random] = None, catalog: Optional[CROCatalog] = None) -> List[CompetitorData]:
+    """
+    Competitors outperforming the site, sampled from its industry's conversion rate
+    percentiles in the benchmark index; without an index they are offset from `current_cr`.
+    """
+    rng = rng or random.Random()
+    catalog = catalog or get_catalog()
+    index = get_benchmark_index()
+    if index is not None:
+        site_rank = index.percentile_rank(industry, "conversion_rate", current_cr)
+        lowest_rank = min(max(site_rank, COMPETITOR_MIN_PERCENTILE) + 1, 99)
     competitors = []
     for i in range(3):
-        competitor_cr = current_cr + random.uniform(0.5, 2.5)
-        estimated_revenue = random.randint(500000, 2000000)
-        advantages = [
-            "Superior checkout experience",
-            "Advanced personalization engine",
-            "Comprehensive review system",
-            "Mobile-first design approach",
-            "AI-powered product recommendations",
-            "Optimized email marketing funnel"
-        ]
+        if index is None:
+            competitor_cr = current_cr + rng.uniform(0.5, 2.5)
+        else:
+            competitor_cr = index.percentile(industry, "conversion_rate", rng.randint(lowest_rank, 99))
+        estimated_revenue = rng.randint(500000, 2000000)
         competitors.append(CompetitorData(
-            name=competitor_names[i],
+            name=catalog.competitor_names[i],
             conversion_rate=round(competitor_cr, 2),
             estimated_revenue=estimated_revenue,
-            key_advantage=random.choice(advantages)
+            key_advantage=rng.choice(catalog.competitor_advantages)
         ))
     return competitors
 
-def calculate_revenue_potential(monthly_visitors: int, current_cr: float, aov: float, issues: List[CROIssue]) -> Dict:
+def project_revenue(monthly_visitors, current_cr, aov, uplift_percentage):
+    """
+    Revenue model shared by every revenue path.
+
+    Pure arithmetic so it evaluates identically on scalars and on broadcast NumPy arrays.
+    Returns (current monthly revenue, new conversion rate, new monthly revenue, monthly uplift).
+    """
     current_monthly_revenue = monthly_visitors * (current_cr / 100) * aov
-    total_uplift_potential = sum(issue.potential_uplift for issue in issues[:5])
-    realistic_uplift = total_uplift_potential * 0.7
-    new_conversion_rate = current_cr * (1 + realistic_uplift / 100)
+    new_conversion_rate = current_cr * (1 + uplift_percentage / 100)
     new_monthly_revenue = monthly_visitors * (new_conversion_rate / 100) * aov
     monthly_uplift = new_monthly_revenue - current_monthly_revenue
+    return current_monthly_revenue, new_conversion_rate, new_monthly_revenue, monthly_uplift
+
+def build_current_metrics(monthly_visitors: int, current_cr: float, aov: float) -> Dict:
+    return {
+        "monthly_visitors": monthly_visitors,
+        "conversion_rate": current_cr,
+        "average_order_value": aov,
+        "monthly_revenue": round(monthly_visitors * (current_cr / 100) * aov)
+    }
+
+def simulate_issue_uplift(issues: List[CROIssue], rng: Optional[random.Random] = None, catalog: Optional[CROCatalog] = None) -> Dict:
+    """Monte Carlo P10/P50/P90 of the total uplift of fixing the top issues, see `simulate_uplift`."""
+    rng = rng or random.Random()
+    catalog = catalog or get_catalog()
+    top_issues = sorted(issues, key=lambda x: x.impact_score, reverse=True)[:SIMULATED_ISSUES]
+    return simulate_uplift(
+        [issue.potential_uplift for issue in top_issues],
+        [catalog.severity_codes[issue.severity] for issue in top_issues],
+        np.random.default_rng(rng.getrandbits(64))
+    )
+
+def calculate_revenue_potential(monthly_visitors: int, current_cr: float, aov: float, issues: List[CROIssue], rng: Optional[random.Random] = None, simulation: Optional[Dict] = None, roi_timeframe: Optional[str] = None) -> Dict:
+    if simulation is None:
+        rng = rng or random.Random()
+        simulation = simulate_issue_uplift(issues, rng)
+    uplift_range = {quantile: simulation[quantile] for quantile in ("p10", "p50", "p90")}
+    current_monthly_revenue, new_conversion_rate, new_monthly_revenue, monthly_uplift = project_revenue(
+        monthly_visitors, current_cr, aov, uplift_range["p50"]
+    )
     annual_uplift = monthly_uplift * 12
     return {
         "current_monthly_revenue": round(current_monthly_revenue),
@@ -158,62 +168,119 @@ def calculate_revenue_potential(monthly_visitors: int, current_cr: float, aov: f
         "annual_revenue_uplift": round(annual_uplift),
         "current_conversion_rate": round(current_cr, 2),
         "potential_conversion_rate": round(new_conversion_rate, 2),
-        "total_uplift_percentage": round(realistic_uplift, 1),
-        "roi_timeframe": f"{random.randint(2, 6)} months"
+        "total_uplift_percentage": round(uplift_range["p50"], 1),
+        "uplift_percentage_range": {quantile: round(uplift, 1) for quantile, uplift in uplift_range.items()},
+        "monthly_revenue_uplift_range": {
+            quantile: round(project_revenue(monthly_visitors, current_cr, aov, uplift)[3])
+            for quantile, uplift in uplift_range.items()
+        },
+        "roi_timeframe": roi_timeframe or f"{(rng or random.Random()).randint(2, 6)} months"
     }
 
-def generate_recommendations(issues: List[CROIssue]) -> List[str]:
-    recommendations_map = {
-        "Checkout Process": [
-            "Implement single-page checkout with progress indicators",
-            "Add multiple payment options including digital wallets",
-            "Display trust badges and security certifications prominently",
-            "Offer guest checkout option alongside account creation",
-            "Show all costs upfront including shipping and taxes"
-        ],
-        "Product Pages": [
-            "Add high-quality product images with 360° view capability",
-            "Implement user-generated content and review system",
-            "Create detailed product specifications and size guides",
-            "Add related product recommendations",
-            "Optimize product page layout for mobile devices"
-        ],
-        "Site Performance": [
-            "Optimize images and implement lazy loading",
-            "Minimize and compress CSS/JavaScript files",
-            "Implement Content Delivery Network (CDN)",
-            "Remove unused third-party scripts",
-            "Upgrade hosting infrastructure for better performance"
-        ],
-        "User Experience": [
-            "Add live chat or chatbot for instant customer support",
-            "Improve site search with filters and autocomplete",
-            "Simplify navigation menu structure",
-            "Add clear call-to-action buttons throughout the site",
-            "Create mobile-first responsive design"
-        ],
-        "Social Proof": [
-            "Display customer testimonials on key pages",
-            "Add social media feeds and sharing options",
-            "Implement urgency indicators (stock levels, time-limited offers)",
-            "Prominently display return and refund policies",
-            "Show security badges and certifications"
-        ]
-    }
+def generate_recommendations(issues: List[CROIssue], rng: Optional[random.Random] = None, catalog: Optional[CROCatalog] = None) -> List[str]:
+    rng = rng or random.Random()
+    catalog = catalog or get_catalog()
     top_issues = sorted(issues, key=lambda x: x.impact_score, reverse=True)[:5]
     recommendations = []
     for issue in top_issues:
-        category_recommendations = recommendations_map.get(issue.category, [])
+        category = catalog.category_codes.get(issue.category)
+        category_recommendations = () if category is None else catalog.recommendations[category]
         if category_recommendations:
-            recommendation = random.choice(category_recommendations)
+            recommendation = rng.choice(category_recommendations)
             if recommendation not in recommendations:
                 recommendations.append(recommendation)
-    general_recommendations = [
-        "Implement A/B testing framework for continuous optimization",
-        "Set up conversion tracking and analytics dashboards",
-        "Create abandoned cart email recovery sequence",
-        "Optimize for mobile-first user experience",
-        "Implement exit-intent popups with compelling offers"
-    ]
-    recommendations.extend(random.sample(general_recommendations, 2))
+    recommendations.extend(rng.sample(catalog.general_recommendations, 2))
     return recommendations[:8]
+
+def normalize_website_url(website_url: str) -> str:
+    """Canonical form of a site url: lowercase host, no default port, fragment or trailing slash."""
+    parts = urlsplit(str(website_url))
+    host = (parts.hostname or "").lower()
+    if parts.port and (parts.scheme, parts.port) not in (("http", 80), ("https", 443)):
+        host = f"{host}:{parts.port}"
+    path = parts.path.rstrip("/")
+    query = f"?{parts.query}" if parts.query else ""
+    return f"{parts.scheme.lower()}://{host}{path}{query}"
+
+def audit_request_key(request: SiteAnalysisRequest) -> str:
+    """Stable identity of an analysis request: normalized url plus every input metric."""
+    return "|".join((
+        normalize_website_url(request.website_url),
+        str(request.monthly_visitors),
+        repr(float(request.current_conversion_rate)),
+        repr(float(request.average_order_value)),
+        request.industry.strip().lower(),
+        request.primary_goal.strip().lower(),
+    ))
+
+def audit_seed(request: SiteAnalysisRequest) -> int:
+    return int.from_bytes(hashlib.sha256(audit_request_key(request).encode()).digest()[:8], "big")
+
+def iter_audit_sections(request: SiteAnalysisRequest, deterministic: bool = False, audit_id: Optional[str] = None, page: Optional[FetchedPage] = None, detected_issues: Optional[List[str]] = None) -> Iterator[Tuple[str, Any]]:
+    """
+    Produce an audit section by section, as `(section, payload)` pairs.
+
+    Sections are emitted in order: "audit" (id, url and current metrics), one "issue" per
+    CROIssue as it is generated, then "competitor_analysis", "revenue_potential",
+    "recommendations" and "summary". In deterministic mode every draw comes from a
+    `random.Random` seeded by `audit_seed`, so the same site and metrics always produce
+    the same report (apart from `audit_id`). A fetched `page` drives issue detection, see
+    `detect_page_issues`; without a usable page issues are drawn from the catalog. Callers
+    that already ran the detection elsewhere pass its result as `detected_issues` instead.
+    """
+    rng = random.Random(audit_seed(request)) if deterministic else random.Random()
+    catalog = get_catalog()
+    yield "audit", {
+        "audit_id": audit_id or time_ordered_id(),
+        "website_url": str(request.website_url),
+        "current_metrics": build_current_metrics(request.monthly_visitors, request.current_conversion_rate, request.average_order_value),
+    }
+    issues = []
+    if detected_issues is None:
+        detected_issues = detect_page_issues(page)
+    for issue in iter_cro_issues(str(request.website_url), request.current_conversion_rate, request.average_order_value, rng, detected_issues, catalog):
+        issues.append(issue)
+        yield "issue", issue
+    issues.sort(key=lambda x: x.impact_score, reverse=True)
+    yield "competitor_analysis", generate_competitor_data(request.industry, request.current_conversion_rate, rng, catalog)
+    simulation = simulate_issue_uplift(issues, rng, catalog)
+    yield "revenue_potential", calculate_revenue_potential(
+        request.monthly_visitors,
+        request.current_conversion_rate,
+        request.average_order_value,
+        issues,
+        rng,
+        simulation
+    )
+    yield "recommendations", generate_recommendations(issues, rng, catalog)
+    yield "summary", {"confidence_score": simulation["confidence"]}
+
+def assemble_audit_result(sections: Iterable[Tuple[str, Any]]) -> CROAuditResult:
+    report: Dict[str, Any] = {"issues_found": []}
+    for section, payload in sections:
+        if section == "issue":
+            report["issues_found"].append(payload)
+        elif section in ("audit", "summary"):
+            report.update(payload)
+        else:
+            report[section] = payload
+    report["issues_found"].sort(key=lambda x: x.impact_score, reverse=True)
+    return CROAuditResult(**report)
+
+def iter_result_sections(result: CROAuditResult) -> Iterator[Tuple[str, Any]]:
+    """Replay a finished audit in the section order of `iter_audit_sections`."""
+    yield "audit", {
+        "audit_id": result.audit_id,
+        "website_url": result.website_url,
+        "current_metrics": result.current_metrics,
+    }
+    for issue in result.issues_found:
+        yield "issue", issue
+    yield "competitor_analysis", result.competitor_analysis
+    yield "revenue_potential", result.revenue_potential
+    yield "recommendations", result.recommendations
+    yield "summary", {"confidence_score": result.confidence_score}
+
+def run_audit_pipeline(request: SiteAnalysisRequest, deterministic: bool = False, page: Optional[FetchedPage] = None) -> CROAuditResult:
+    """Run the full audit for one site, see `iter_audit_sections`."""
+    return assemble_audit_result(iter_audit_sections(request, deterministic, page=page))
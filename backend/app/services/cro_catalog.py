@@ -0,0 +1,263 @@
+import hashlib
+import json
+import logging
+import os
+import random
+import threading
+import time
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CATALOG_PATH = Path(__file__).resolve().parent.parent / "data" / "cro_catalog.json"
+CATALOG_FORMAT_VERSION = 1
+# Availability tables hold one entry per subset of a category's issues
+MAX_CATEGORY_ISSUES = 12
+# Effort of fixing one issue of a category that has no estimate in the file
+DEFAULT_EFFORT_DAYS = 5.0
+DEFAULT_RELOAD_SECONDS = 1.0
+
+
+def _frozen(values: np.ndarray) -> np.ndarray:
+    values.setflags(write=False)
+    return values
+
+
+class CROCatalog:
+    """
+    Compiled, read-only form of the CRO catalog data file.
+
+    Categories, issues and severities are addressed by integer index. Every issue has a
+    global index and the issues of a category are contiguous, so the issues already
+    picked for an audit are one int bitmask, and the issues still available in a category
+    are a table lookup on the category's slice of that mask rather than a filtered list.
+    Everything is built once per file version and only read afterwards; a reload
+    compiles a new catalog instead of mutating this one.
+    """
+
+    def __init__(self, data: Mapping[str, Any], digest: str = ""):
+        if data.get("format_version") != CATALOG_FORMAT_VERSION:
+            raise ValueError(f"Unsupported catalog format version {data.get('format_version')}")
+        self.version = data["version"]
+        self.digest = digest
+        self.issue_count_range: Tuple[int, int] = tuple(data["issues_per_audit"])
+
+        self.severities: Tuple[str, ...] = tuple(data["severities"])
+        # severity -> (impact score low, impact score high, uplift low, uplift high)
+        self.severity_parameters: Mapping[str, Tuple[int, int, int, int]] = MappingProxyType(
+            {
+                severity: (*parameters["impact_score"], *parameters["potential_uplift"])
+                for severity, parameters in data["severities"].items()
+            }
+        )
+        self.severity_codes: Mapping[str, int] = MappingProxyType(
+            {severity: code for code, severity in enumerate(self.severities)}
+        )
+        self.severity_table = _frozen(
+            np.array([self.severity_parameters[name] for name in self.severities], dtype=float)
+        )
+
+        categories = data["categories"]
+        self.categories: Tuple[str, ...] = tuple(category["name"] for category in categories)
+        self.category_codes: Mapping[str, int] = MappingProxyType(
+            {name: code for code, name in enumerate(self.categories)}
+        )
+        self.category_issues: Tuple[Tuple[str, ...], ...] = tuple(
+            tuple(category["issues"]) for category in categories
+        )
+        self.issues: Tuple[str, ...] = tuple(
+            issue for issues in self.category_issues for issue in issues
+        )
+        self.issue_codes: Mapping[str, int] = MappingProxyType(
+            {issue: code for code, issue in enumerate(self.issues)}
+        )
+        if len(self.issue_codes) != len(self.issues):
+            raise ValueError("Catalog issues must be unique")
+        self.issue_categories: Tuple[int, ...] = tuple(
+            code for code, issues in enumerate(self.category_issues) for _ in issues
+        )
+        # Array form of `issue_categories` for the vectorized batch path
+        self.issue_category_index = _frozen(np.array(self.issue_categories, dtype=np.int64))
+
+        self.category_offsets: Tuple[int, ...] = tuple(
+            int(offset)
+            for offset in np.cumsum([0] + [len(issues) for issues in self.category_issues])[:-1]
+        )
+        self.category_masks: Tuple[int, ...] = tuple(
+            (1 << len(issues)) - 1 for issues in self.category_issues
+        )
+        # [category][used bits of the category] -> global indexes of its unused issues, in order
+        self.available_issues: Tuple[Tuple[Tuple[int, ...], ...], ...] = tuple(
+            self._availability_table(offset, len(issues))
+            for offset, issues in zip(self.category_offsets, self.category_issues)
+        )
+
+        # Estimated engineering days to fix one issue of the category
+        self.effort_days: Tuple[float, ...] = tuple(
+            float(category.get("effort_days", DEFAULT_EFFORT_DAYS)) for category in categories
+        )
+        if any(effort <= 0 for effort in self.effort_days):
+            raise ValueError("Catalog effort estimates must be positive")
+
+        # category -> (description template, lower bound, upper bound) of the quoted percentage
+        self.descriptions: Tuple[Tuple[str, int, int], ...] = tuple(
+            (category["description"]["template"], *category["description"]["percent"])
+            for category in categories
+        )
+        self.description_bounds = _frozen(
+            np.array([description[1:] for description in self.descriptions], dtype=np.int64)
+        )
+        # Rendered descriptions, indexed by [category][quoted percentage]
+        self.description_texts: Tuple[Tuple[str, ...], ...] = tuple(
+            tuple(template.format(percent) for percent in range(high + 1))
+            for template, _, high in self.descriptions
+        )
+        self.recommendations: Tuple[Tuple[str, ...], ...] = tuple(
+            tuple(category["recommendations"]) for category in categories
+        )
+        self.general_recommendations: Tuple[str, ...] = tuple(data["general_recommendations"])
+        self.competitor_names: Tuple[str, ...] = tuple(data["competitors"]["names"])
+        self.competitor_advantages: Tuple[str, ...] = tuple(data["competitors"]["advantages"])
+
+    @staticmethod
+    def _availability_table(offset: int, size: int) -> Tuple[Tuple[int, ...], ...]:
+        if not 0 < size <= MAX_CATEGORY_ISSUES:
+            raise ValueError(f"Catalog categories need 1 to {MAX_CATEGORY_ISSUES} issues")
+        return tuple(
+            tuple(offset + slot for slot in range(size) if not used >> slot & 1)
+            for used in range(1 << size)
+        )
+
+    @classmethod
+    def from_file(cls, path: Path) -> "CROCatalog":
+        content = Path(path).read_bytes()
+        return cls(json.loads(content), hashlib.sha256(content).hexdigest()[:16])
+
+    def draw_issues(self, rng: random.Random) -> Iterator[int]:
+        """
+        Lazily pick distinct issues, yielding their global indexes.
+
+        Each pick chooses a category uniformly and then one of its unused issues, skipping
+        the pick when the category is exhausted.
+        """
+        used = 0
+        for _ in range(rng.randint(*self.issue_count_range)):
+            category = rng.randrange(len(self.categories))
+            offset = self.category_offsets[category]
+            available = self.available_issues[category][
+                used >> offset & self.category_masks[category]
+            ]
+            if not available:
+                continue
+            issue = rng.choice(available)
+            used |= 1 << issue
+            yield issue
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "digest": self.digest,
+            "categories": len(self.categories),
+            "issues": len(self.issues),
+        }
+
+
+class CatalogLoader:
+    """
+    Serve the current catalog and recompile it when its file changes.
+
+    The file's mtime and size are checked at most every `reload_seconds`. A changed file
+    is compiled in full before the single reference swap, so callers holding the old
+    catalog finish with it unchanged and never see a partial one. A file that fails to
+    parse or validate is logged and the previous catalog stays in service; write updates
+    to a temporary file and rename it over the catalog so readers never parse a partial
+    write.
+    """
+
+    def __init__(self, path: Path, reload_seconds: float = DEFAULT_RELOAD_SECONDS):
+        self.path = Path(path)
+        self.reload_seconds = reload_seconds
+        self._lock = threading.Lock()
+        self._signature: Tuple[int, int] = self._stat()
+        self._checked_at = time.monotonic()
+        self.reloads = 0
+        self.failed_reloads = 0
+        self.catalog = CROCatalog.from_file(self.path)
+
+    def get(self) -> CROCatalog:
+        if self.reload_seconds >= 0 and time.monotonic() - self._checked_at >= self.reload_seconds:
+            self.check()
+        return self.catalog
+
+    def check(self) -> bool:
+        """Reload the catalog if the file changed, returning whether it was replaced."""
+        with self._lock:
+            self._checked_at = time.monotonic()
+            try:
+                signature = self._stat()
+                if signature == self._signature:
+                    return False
+                # Recorded before compiling so a broken file is retried only once it changes
+                self._signature = signature
+                catalog = CROCatalog.from_file(self.path)
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                self.failed_reloads += 1
+                logger.warning(
+                    f"Keeping CRO catalog {self.catalog.version}, reload failed: {str(e)}"
+                )
+                return False
+            if catalog.digest == self.catalog.digest:
+                return False
+            self.catalog = catalog
+            self.reloads += 1
+            logger.info(f"Reloaded CRO catalog version {catalog.version} ({catalog.digest})")
+            return True
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            **self.catalog.info(),
+            "reloads": self.reloads,
+            "failed_reloads": self.failed_reloads,
+        }
+
+    def _stat(self) -> Tuple[int, int]:
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+
+_loader: Optional[CatalogLoader] = None
+_loader_lock = threading.Lock()
+
+
+def get_catalog_loader(
+    path: Optional[Path] = None, reload_seconds: Optional[float] = None
+) -> CatalogLoader:
+    """
+    Process-wide catalog loader, created on first use.
+
+    Audit worker processes are spawned without running startup, so the path and reload
+    interval fall back to the AUDIT_CATALOG_PATH and AUDIT_CATALOG_RELOAD_SECONDS
+    environment variables. Unlike reloads, an invalid catalog on first load raises.
+    """
+    global _loader
+    if _loader is None:
+        with _loader_lock:
+            if _loader is None:
+                if reload_seconds is None:
+                    reload_seconds = float(
+                        os.getenv("AUDIT_CATALOG_RELOAD_SECONDS", DEFAULT_RELOAD_SECONDS)
+                    )
+                _loader = CatalogLoader(
+                    path or os.getenv("AUDIT_CATALOG_PATH") or DEFAULT_CATALOG_PATH,
+                    reload_seconds,
+                )
+    return _loader
+
+
+def get_catalog() -> CROCatalog:
+    """Current catalog; take it once per audit so one audit never mixes two versions."""
+    return get_catalog_loader().get()
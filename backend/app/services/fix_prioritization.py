@@ -0,0 +1,185 @@
+import math
+from typing import List, Literal, Optional, Tuple
+
+import numpy as np
+from pydantic import Field
+
+from ..schemas.base import BaseModel
+from .cro_audit_service import CROIssue, project_revenue
+from .cro_catalog import DEFAULT_EFFORT_DAYS, CROCatalog, get_catalog
+from .uplift_simulation import CAPTURE_MEAN
+
+# Efforts and budgets are solved in whole units of this many days
+EFFORT_UNIT_DAYS = 0.5
+# Each further fix in a category overlaps the ones before it and keeps this share of its uplift
+CATEGORY_OVERLAP = 0.6
+# Above this many issue x budget unit cells the exact solver gives way to the greedy bound
+DP_MAX_CELLS = 2_000_000
+
+
+class FixPrioritizationRequest(BaseModel):
+    issues: List[CROIssue] = Field(..., min_length=1)
+    effort_budget_days: float = Field(..., gt=0, allow_inf_nan=False)
+    monthly_visitors: int = Field(..., ge=0)
+    current_conversion_rate: float = Field(..., ge=0)
+    average_order_value: float = Field(..., ge=0)
+
+
+class PlannedFix(BaseModel):
+    issue: CROIssue
+    effort_days: float
+    # Uplift credited to this fix after category overlap and the expected capture share
+    effective_uplift: float
+
+
+class FixPlan(BaseModel):
+    fixes: List[PlannedFix]
+    effort_budget_days: float
+    effort_days: float
+    total_uplift_percentage: float
+    monthly_revenue_uplift: int
+    annual_revenue_uplift: int
+    method: Literal["dp", "greedy"]
+    # Best uplift any selection could reach, equal to the plan's uplift when solved exactly
+    uplift_upper_bound: float
+
+
+def _category_items(
+    issues: List[CROIssue], catalog: CROCatalog
+) -> List[Tuple[int, List[int], np.ndarray]]:
+    """
+    Group issues by category as (cost in units, issue indexes, cumulative values).
+
+    Fixes compound on the conversions the previous ones left, so a set of effective
+    uplifts u combines to 1 - prod(1 - u). Its log, sum(-log(1 - u)), is additive and is
+    the value the knapsack maximizes. Within a category every fix costs the same and the
+    k-th one is discounted by CATEGORY_OVERLAP ** k, so the best k fixes of a category are
+    always its k largest uplifts and a category reduces to a choice of how many to fix.
+    """
+    groups = {}
+    for position, issue in enumerate(issues):
+        groups.setdefault(issue.category, []).append(position)
+    items = []
+    for category, positions in groups.items():
+        code = catalog.category_codes.get(category)
+        effort = DEFAULT_EFFORT_DAYS if code is None else catalog.effort_days[code]
+        cost = max(math.ceil(effort / EFFORT_UNIT_DAYS - 1e-9), 1)
+        positions.sort(key=lambda position: issues[position].potential_uplift, reverse=True)
+        uplifts = np.array([issues[position].potential_uplift for position in positions])
+        effective = np.clip(
+            uplifts / 100 * CAPTURE_MEAN * CATEGORY_OVERLAP ** np.arange(len(uplifts)), 0, 0.999
+        )
+        values = np.concatenate(([0.0], np.cumsum(-np.log1p(-effective))))
+        items.append((cost, positions, values))
+    return items
+
+
+def _solve_dp(items, budget: int) -> Tuple[List[int], float]:
+    """Exact multiple-choice knapsack over categories, vectorized along the budget axis."""
+    best = np.zeros(budget + 1)
+    choices = []
+    for cost, positions, values in items:
+        updated = best.copy()
+        choice = np.zeros(budget + 1, dtype=np.int32)
+        for count in range(1, min(len(positions), budget // cost) + 1):
+            spent = count * cost
+            candidate = best[: budget + 1 - spent] + values[count]
+            improved = candidate > updated[spent:]
+            updated[spent:][improved] = candidate[improved]
+            choice[spent:][improved] = count
+        choices.append(choice)
+        best = updated
+    counts = [0] * len(items)
+    remaining = budget
+    for slot in range(len(items) - 1, -1, -1):
+        counts[slot] = int(choices[slot][remaining])
+        remaining -= counts[slot] * items[slot][0]
+    return counts, float(best[budget])
+
+
+def _solve_greedy(items, budget: int) -> Tuple[List[int], float, float]:
+    """
+    Take fixes by value per effort unit while they fit.
+
+    A category's densities only fall with each further fix, so the global density order
+    keeps every category's picks a prefix of its sorted fixes. Filling the first fix that
+    does not fit fractionally gives the LP relaxation, an upper bound on the optimum.
+    """
+    marginals = [
+        (-(values[count] - values[count - 1]) / cost, slot, count)
+        for slot, (cost, positions, values) in enumerate(items)
+        for count in range(1, len(positions) + 1)
+    ]
+    marginals.sort()
+    counts = [0] * len(items)
+    remaining, value, bound = budget, 0.0, None
+    for density, slot, count in marginals:
+        cost = items[slot][0]
+        if count != counts[slot] + 1:
+            continue
+        if cost > remaining:
+            if bound is None:
+                bound = value - density * remaining
+            continue
+        counts[slot] = count
+        remaining -= cost
+        value -= density * cost
+    return counts, value, value if bound is None else bound
+
+
+def prioritize_fixes(
+    issues: List[CROIssue],
+    effort_budget_days: float,
+    monthly_visitors: int,
+    current_conversion_rate: float,
+    average_order_value: float,
+    catalog: Optional[CROCatalog] = None,
+    dp_max_cells: int = DP_MAX_CELLS,
+) -> FixPlan:
+    """
+    Pick the set of fixes with the largest combined uplift within an effort budget.
+
+    Every issue costs its category's effort estimate from the catalog. The selection is
+    solved exactly with a knapsack DP over effort units, or with the greedy bound when
+    issues x budget units exceed `dp_max_cells`; see `_category_items` for the uplift
+    model. Selected fixes are returned by effective uplift.
+    """
+    catalog = catalog or get_catalog()
+    items = _category_items(issues, catalog)
+    # A budget beyond fixing everything changes nothing, and would size the DP table by it
+    total_cost = sum(cost * len(positions) for cost, positions, _ in items)
+    budget = int(min(effort_budget_days / EFFORT_UNIT_DAYS + 1e-9, total_cost))
+    if len(issues) * (budget + 1) <= dp_max_cells:
+        method = "dp"
+        counts, value = _solve_dp(items, budget)
+        bound = value
+    else:
+        method = "greedy"
+        counts, value, bound = _solve_greedy(items, budget)
+
+    fixes = []
+    for (cost, positions, values), count in zip(items, counts):
+        for rank, position in enumerate(positions[:count]):
+            fixes.append(
+                PlannedFix(
+                    issue=issues[position],
+                    effort_days=cost * EFFORT_UNIT_DAYS,
+                    effective_uplift=round(-math.expm1(values[rank] - values[rank + 1]) * 100, 2),
+                )
+            )
+    fixes.sort(key=lambda fix: fix.effective_uplift, reverse=True)
+
+    uplift = -math.expm1(-value) * 100
+    monthly_uplift = project_revenue(
+        monthly_visitors, current_conversion_rate, average_order_value, uplift
+    )[3]
+    return FixPlan(
+        fixes=fixes,
+        effort_budget_days=effort_budget_days,
+        effort_days=sum(fix.effort_days for fix in fixes),
+        total_uplift_percentage=round(uplift, 1),
+        monthly_revenue_uplift=round(monthly_uplift),
+        annual_revenue_uplift=round(monthly_uplift * 12),
+        method=method,
+        uplift_upper_bound=round(-math.expm1(-bound) * 100, 1),
+    )
@@ -0,0 +1,214 @@
+import csv
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Literal, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+BenchmarkMetric = Literal["conversion_rate", "average_order_value"]
+BENCHMARK_METRICS: Tuple[BenchmarkMetric, ...] = ("conversion_rate", "average_order_value")
+DEFAULT_INDUSTRY = "ecommerce"
+DEFAULT_INDEX_PATH = Path(__file__).resolve().parent.parent / "data" / "industry_benchmarks.bin"
+
+# Every record stores the 1st..99th percentile of each metric, so percentile p lives at p - 1
+PERCENTILES = np.arange(1, 100)
+INDEX_MAGIC = b"CROBIDX1"
+INDEX_VERSION = 1
+HEADER_DTYPE = np.dtype([("magic", "S8"), ("version", "<u4"), ("count", "<u4")])
+RECORD_DTYPE = np.dtype(
+    [
+        ("industry", "S32"),
+        ("sample_size", "<u4"),
+        ("conversion_rate", "<f4", (len(PERCENTILES),)),
+        ("average_order_value", "<f4", (len(PERCENTILES),)),
+    ]
+)
+
+
+def normalize_industry(industry: str) -> str:
+    return "_".join(industry.strip().lower().replace("-", " ").replace("&", " ").split())
+
+
+class IndustryBenchmarkIndex:
+    """
+    Read-only view of the packed industry benchmark file.
+
+    The file is a small header followed by fixed-size records and is opened with
+    `np.memmap`, so every uvicorn worker and audit process maps the same page cache
+    pages instead of holding its own copy. Lookups index straight into the mapping.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        header = np.fromfile(self.path, dtype=HEADER_DTYPE, count=1)
+        if not len(header) or header["magic"][0] != INDEX_MAGIC:
+            raise ValueError(f"{self.path} is not an industry benchmark index")
+        if header["version"][0] != INDEX_VERSION:
+            raise ValueError(f"Unsupported benchmark index version {header['version'][0]}")
+        self.records = np.memmap(
+            self.path,
+            dtype=RECORD_DTYPE,
+            mode="r",
+            offset=HEADER_DTYPE.itemsize,
+            shape=(int(header["count"][0]),),
+        )
+        self.rows: Dict[str, int] = {
+            name.decode(): row for row, name in enumerate(self.records["industry"])
+        }
+        self.default_row = self.rows.get(DEFAULT_INDUSTRY, 0)
+        # Plain ndarray views into the mapping, created once so lookups allocate no arrays
+        records = self.records.view(np.ndarray)
+        self.matrices: Dict[str, np.ndarray] = {
+            metric: records[metric] for metric in BENCHMARK_METRICS
+        }
+        self.tables: Dict[str, List[np.ndarray]] = {
+            metric: list(matrix) for metric, matrix in self.matrices.items()
+        }
+
+    @property
+    def industries(self) -> List[str]:
+        return list(self.rows)
+
+    def row(self, industry: str) -> int:
+        """Record of an industry, falling back to the default industry when unknown."""
+        return self.rows.get(normalize_industry(industry), self.default_row)
+
+    def percentiles(self, industry: str, metric: BenchmarkMetric) -> np.ndarray:
+        return self.tables[metric][self.row(industry)]
+
+    def percentile(self, industry: str, metric: BenchmarkMetric, percentile: int) -> float:
+        return float(self.tables[metric][self.row(industry)][percentile - 1])
+
+    def percentile_rank(self, industry: str, metric: BenchmarkMetric, value: float) -> int:
+        """Number of percentile points strictly below `value`, from 0 to 99."""
+        return int(np.searchsorted(self.percentiles(industry, metric), value, side="left"))
+
+    def summary(self, industry: str) -> Dict[str, object]:
+        row = self.row(industry)
+        return {
+            "industry": self.records["industry"][row].decode(),
+            "sample_size": int(self.records["sample_size"][row]),
+            **{
+                metric: {
+                    f"p{percentile}": round(float(self.tables[metric][row][percentile - 1]), 2)
+                    for percentile in (5, 10, 25, 50, 75, 90, 95)
+                }
+                for metric in BENCHMARK_METRICS
+            },
+        }
+
+
+def interpolate_percentiles(points: Dict[int, float]) -> np.ndarray:
+    """
+    Densify sparse percentile points (e.g. p5..p95) onto the 1..99 grid.
+
+    Tails beyond the outermost points continue the slope of the last two points instead
+    of flattening out, and never go below zero.
+    """
+    known = np.array(sorted(points), dtype=float)
+    values = np.array([points[percentile] for percentile in sorted(points)], dtype=float)
+    dense = np.interp(PERCENTILES, known, values)
+    if len(known) > 1:
+        low_slope = (values[1] - values[0]) / (known[1] - known[0])
+        high_slope = (values[-1] - values[-2]) / (known[-1] - known[-2])
+        below, above = PERCENTILES < known[0], PERCENTILES > known[-1]
+        dense[below] = values[0] - (known[0] - PERCENTILES[below]) * low_slope
+        dense[above] = values[-1] + (PERCENTILES[above] - known[-1]) * high_slope
+    return np.maximum(dense, 0)
+
+
+def read_summary_csv(path: Path) -> List[Tuple[str, int, Dict[str, np.ndarray]]]:
+    """
+    Read `industry,metric,sample_size,p5,...,p95` rows into dense per-industry percentiles.
+    """
+    industries: Dict[str, Tuple[int, Dict[str, np.ndarray]]] = {}
+    with open(path, newline="") as source:
+        for line in csv.DictReader(source):
+            industry = normalize_industry(line["industry"])
+            points = {
+                int(column[1:]): float(value)
+                for column, value in line.items()
+                if column.startswith("p") and column[1:].isdigit() and value
+            }
+            sample_size, metrics = industries.setdefault(industry, (0, {}))
+            metrics[line["metric"]] = interpolate_percentiles(points)
+            industries[industry] = (max(sample_size, int(line["sample_size"] or 0)), metrics)
+    return [(industry, size, metrics) for industry, (size, metrics) in industries.items()]
+
+
+def read_observations_csv(path: Path) -> List[Tuple[str, int, Dict[str, np.ndarray]]]:
+    """Read raw `industry,conversion_rate,average_order_value` site observations."""
+    samples: Dict[str, List[Tuple[float, float]]] = {}
+    with open(path, newline="") as source:
+        for line in csv.DictReader(source):
+            samples.setdefault(normalize_industry(line["industry"]), []).append(
+                (float(line["conversion_rate"]), float(line["average_order_value"]))
+            )
+    return [
+        (
+            industry,
+            len(values),
+            dict(zip(BENCHMARK_METRICS, np.percentile(np.array(values), PERCENTILES, axis=0).T)),
+        )
+        for industry, values in samples.items()
+    ]
+
+
+def build_benchmark_index(
+    industries: Iterable[Tuple[str, int, Dict[str, np.ndarray]]], path: Path
+) -> int:
+    """
+    Pack per-industry percentiles into an index file and return the record count.
+
+    The file is written next to the target and renamed over it, so processes that
+    already mapped the previous file keep a consistent view until they reopen it.
+    """
+    rows: Sequence = sorted(industries, key=lambda row: row[0])
+    records = np.zeros(len(rows), dtype=RECORD_DTYPE)
+    for record, (industry, sample_size, metrics) in zip(records, rows):
+        if len(industry.encode()) > RECORD_DTYPE["industry"].itemsize:
+            raise ValueError(f"Industry name too long: {industry}")
+        record["industry"] = industry.encode()
+        record["sample_size"] = sample_size
+        for metric in BENCHMARK_METRICS:
+            # Percentiles must be non-decreasing for searchsorted based ranks
+            record[metric] = np.maximum.accumulate(np.asarray(metrics[metric], dtype=np.float32))
+    header = np.array([(INDEX_MAGIC, INDEX_VERSION, len(rows))], dtype=HEADER_DTYPE)
+
+    path = Path(path)
+    descriptor, temporary = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(descriptor, "wb") as output:
+            output.write(header.tobytes())
+            output.write(records.tobytes())
+        os.chmod(temporary, 0o644)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+    return len(rows)
+
+
+_index: Optional[IndustryBenchmarkIndex] = None
+_index_loaded = False
+
+
+def get_benchmark_index(path: Optional[Path] = None) -> Optional[IndustryBenchmarkIndex]:
+    """
+    Process-wide benchmark index, mapped on first use.
+
+    Returns None when the file is missing or invalid so callers keep working without it.
+    """
+    global _index, _index_loaded
+    if not _index_loaded:
+        _index_loaded = True
+        index_path = path or os.getenv("AUDIT_BENCHMARK_INDEX_PATH") or DEFAULT_INDEX_PATH
+        try:
+            _index = IndustryBenchmarkIndex(index_path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Industry benchmark index unavailable: {str(e)}")
+    return _index
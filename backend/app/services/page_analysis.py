@@ -0,0 +1,119 @@
+from typing import List, Optional
+
+from app.core.fetcher import FetchedPage
+from app.core.html_rules import (
+    HTMLRuleEngine,
+    PageRule,
+    RuleEngineResult,
+    charset_from_content_type,
+)
+
+# Pages above this size are treated as slow regardless of the measured fetch time
+HEAVY_PAGE_BYTES = 1_500_000
+SLOW_PAGE_SECONDS = 3.2
+SLOW_PAGE_ISSUE = "Page load time exceeding 3.2 seconds"
+
+# Every rule names the catalog issue it reports, see app/data/cro_catalog.json
+PAGE_RULES: List[PageRule] = [
+    PageRule(
+        "Missing trust badges on checkout page",
+        attributes=r"trust|secure|ssl|norton|mcafee|verisign|badge",
+        text=r"secure checkout|ssl secured|money[- ]back|guarantee",
+    ),
+    PageRule(
+        "No guest checkout option available",
+        text=r"guest checkout|check ?out as (?:a )?guest|continue as (?:a )?guest",
+    ),
+    PageRule(
+        "Payment method limitations detected",
+        attributes=r"paypal|apple-?pay|google-?pay|klarna|afterpay|amazon-?pay|shop-?pay",
+        text=r"paypal|apple pay|google pay|klarna|afterpay|amazon pay|shop pay",
+    ),
+    PageRule(
+        "Unexpected shipping costs revealed at checkout",
+        text=r"free (?:shipping|delivery)|shipping (?:costs?|rates?|fees?)|delivery (?:costs?|fees?)",
+    ),
+    PageRule("Product images lacking zoom functionality", attributes=r"zoom|lightbox|magnif"),
+    PageRule(
+        "Missing product reviews and ratings",
+        attributes=r"aggregaterating|review|rating|stars",
+        text=r"\breviews?\b|\bratings?\b",
+    ),
+    PageRule(
+        "No size guide or product specifications",
+        text=r"size (?:guide|chart)|specifications|dimensions",
+    ),
+    PageRule("Poor mobile product page experience", tags=["meta"], attributes=r"name=viewport"),
+    PageRule(
+        "Third-party scripts slowing site",
+        tags=["script"],
+        attributes=r"\bsrc=(?:https?:)?//",
+        mode="excess",
+        threshold=8,
+    ),
+    PageRule(
+        "Images not optimized for web",
+        tags=["img"],
+        attributes=r"^(?!.*\bloading=lazy)",
+        mode="excess",
+        threshold=10,
+    ),
+    PageRule(
+        "No live chat or customer support visible",
+        attributes=r"intercom|zendesk|zdassets|drift|livechat|tawk\.to|crisp\.chat|tidio|olark",
+        text=r"live chat|chat with us",
+    ),
+    PageRule(
+        "Search functionality returning poor results",
+        tags=["input", "form"],
+        attributes=r"type=search|role=search|name=(?:q|s|search)\b",
+    ),
+    PageRule("Missing breadcrumb navigation", attributes=r"breadcrumb"),
+    PageRule("No clear value proposition on homepage", tags=["h1"]),
+    PageRule("No customer testimonials displayed", attributes=r"testimonial", text=r"testimonial"),
+    PageRule(
+        "Missing social media integration",
+        tags=["a", "link"],
+        # The host must start the value or follow a / or a subdomain dot: dropbox.com is not x.com
+        attributes=(
+            r"[=/.](?:facebook|instagram|twitter|x|pinterest|tiktok|linkedin|youtube)\.com/"
+        ),
+    ),
+    PageRule(
+        "No urgency or scarcity indicators",
+        text=r"only \d+ left|low stock|limited time|ends in|hurry|selling fast",
+    ),
+    PageRule(
+        "Return policy not prominently displayed",
+        attributes=r"href=[^ ]*(?:return|refund)",
+        text=r"returns? policy|free returns|refund",
+    ),
+    PageRule(
+        "No security certifications visible",
+        attributes=r"norton|mcafee|verisign|trustpilot|bbb\.org|pci",
+        text=r"pci[- ]dss|certified secure|verified by",
+    ),
+]
+
+page_rule_engine = HTMLRuleEngine(PAGE_RULES)
+
+
+def scan_page(page: FetchedPage) -> RuleEngineResult:
+    return page_rule_engine.run(page.content, charset_from_content_type(page.content_type))
+
+
+def detect_page_issues(page: Optional[FetchedPage]) -> Optional[List[str]]:
+    """
+    Catalog issues observed on a fetched page, in rule order.
+
+    Returns None when there is nothing usable to inspect (no page, a failed fetch or a
+    non-HTML body) so callers fall back to the catalog draws.
+    """
+    if page is None or not page.ok or not page.content:
+        return None
+    if page.content_type and "html" not in page.content_type.lower():
+        return None
+    issues = scan_page(page).issues
+    if page.elapsed > SLOW_PAGE_SECONDS or len(page.content) > HEAVY_PAGE_BYTES:
+        issues.insert(0, SLOW_PAGE_ISSUE)
+    return issues
@@ -0,0 +1,91 @@
+import io
+import math
+from typing import Dict, List, Literal
+
+import numpy as np
+from pydantic import Field
+
+from ..schemas.base import BaseModel
+from .cro_audit_service import project_revenue
+
+ScenarioMetric = Literal[
+    "current_monthly_revenue",
+    "potential_monthly_revenue",
+    "potential_conversion_rate",
+    "monthly_revenue_uplift",
+    "annual_revenue_uplift",
+]
+
+# Order of the grid axes, matching the dimensions of every returned matrix
+SCENARIO_AXES = (
+    "monthly_visitors",
+    "conversion_rates",
+    "average_order_values",
+    "uplift_percentages",
+)
+
+
+class RevenueScenarioGridRequest(BaseModel):
+    monthly_visitors: List[int] = Field(..., min_length=1)
+    conversion_rates: List[float] = Field(..., min_length=1)
+    average_order_values: List[float] = Field(..., min_length=1)
+    uplift_percentages: List[float] = Field(..., min_length=1)
+    metrics: List[ScenarioMetric] = Field(
+        default_factory=lambda: ["monthly_revenue_uplift"], min_length=1
+    )
+    format: Literal["json", "npz"] = "json"
+    dtype: Literal["float32", "float64"] = "float64"
+
+    @property
+    def shape(self) -> tuple:
+        return tuple(len(getattr(self, axis)) for axis in SCENARIO_AXES)
+
+    @property
+    def cell_count(self) -> int:
+        return math.prod(self.shape)
+
+    @property
+    def value_count(self) -> int:
+        return self.cell_count * len(set(self.metrics))
+
+
+def calculate_revenue_grid(request: RevenueScenarioGridRequest) -> Dict[str, np.ndarray]:
+    """
+    Evaluate the revenue model over every axis combination in one broadcast pass.
+
+    Each axis becomes a NumPy vector reshaped onto its own dimension so `project_revenue`
+    (the same formula used by `calculate_revenue_potential`) yields full
+    visitors x conversion rate x AOV x uplift matrices without a Python loop.
+    """
+    visitors, conversion_rates, order_values, uplifts = (
+        np.asarray(getattr(request, axis), dtype=np.float64).reshape(
+            [-1 if position == dimension else 1 for position in range(len(SCENARIO_AXES))]
+        )
+        for dimension, axis in enumerate(SCENARIO_AXES)
+    )
+    current_revenue, new_conversion_rate, new_revenue, monthly_uplift = project_revenue(
+        visitors, conversion_rates, order_values, uplifts
+    )
+
+    shape = request.shape
+    computed = {
+        "current_monthly_revenue": lambda: current_revenue,
+        "potential_monthly_revenue": lambda: new_revenue,
+        "potential_conversion_rate": lambda: new_conversion_rate,
+        "monthly_revenue_uplift": lambda: monthly_uplift,
+        "annual_revenue_uplift": lambda: monthly_uplift * 12,
+    }
+    return {
+        metric: np.broadcast_to(computed[metric](), shape).astype(request.dtype, copy=False)
+        for metric in dict.fromkeys(request.metrics)
+    }
+
+
+def serialize_revenue_grid_npz(
+    request: RevenueScenarioGridRequest, grid: Dict[str, np.ndarray]
+) -> bytes:
+    """Pack the grid and its axes into an uncompressed `.npz` archive."""
+    buffer = io.BytesIO()
+    axes = {axis: np.asarray(getattr(request, axis)) for axis in SCENARIO_AXES}
+    np.savez(buffer, **axes, **grid)
+    return buffer.getvalue()
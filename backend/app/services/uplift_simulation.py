@@ -0,0 +1,148 @@
+from statistics import NormalDist
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+
+# Per-audit draws. Antithetic pairs keep the P50 within about 0.01 points (one standard
+# deviation across seeds) at this count and P10/P90 within about 0.06, and one audit
+# simulates in about 2 ms on the job queue's workers.
+SIMULATION_DRAWS = 100_000
+SIMULATED_ISSUES = 5
+
+# Share of an issue's potential uplift a fix is expected to capture
+CAPTURE_MEAN = 0.7
+# Spread of the captured share by severity code (High, Medium, Low)
+CAPTURE_SPREAD = np.array([0.15, 0.2, 0.25], dtype=np.float32)
+# Correlation of captured shares within a site, the same team ships every fix
+CAPTURE_CORRELATION = 0.5
+QUANTILES = (0.1, 0.5, 0.9)
+# Sites are simulated in blocks of about this many float32 normals (512 KiB). A block and
+# its temporaries stay in L2 through the passes over it, while one (sites, draws, issues)
+# array for a whole batch makes every pass wait on memory and runs about twice as slow.
+SIMULATION_BLOCK_VALUES = 2**17
+
+# Standard normal inverse CDF at the midpoints of 2**12 equal probability bins. Looking up
+# random codes is several times cheaper than `standard_normal`, and the table is
+# antisymmetric (code c and 4095 - c are negatives) which makes antithetic pairs free.
+# 4096 bins resolve the quantiles as well as 65536 did once captures are clipped to [0, 1],
+# and the 16 KiB table stays in L1. Only the upper half needs `inv_cdf`, the rest mirrors it.
+NORMAL_TABLE_BITS = 12
+NORMAL_TABLE_SIZE = 2**NORMAL_TABLE_BITS
+_upper_half = np.array(
+    [
+        NormalDist().inv_cdf((code + 0.5) / NORMAL_TABLE_SIZE)
+        for code in range(NORMAL_TABLE_SIZE // 2, NORMAL_TABLE_SIZE)
+    ],
+    dtype=np.float32,
+)
+NORMAL_TABLE = np.concatenate([-_upper_half[::-1], _upper_half])
+
+
+def simulate_uplift_batch(
+    potential_uplifts: np.ndarray,
+    severity_codes: np.ndarray,
+    rng: np.random.Generator,
+    draws: int = SIMULATION_DRAWS,
+) -> Dict[str, np.ndarray]:
+    """
+    Monte Carlo distribution of the total conversion uplift of many sites.
+
+    `potential_uplifts` and `severity_codes` are (sites, issues) arrays of the issues a
+    site would fix. Each draw captures a share of every issue's potential, normal around
+    CAPTURE_MEAN with a severity dependent spread and clipped to [0, 1], with a shared
+    per-site factor correlating the shares. Normals come from a lookup table in
+    antithetic pairs, and each block of sites and draws is one float32 (sites, draws,
+    issues) array reduced with a matrix product.
+
+    Returns P10/P50/P90 of the total uplift percentage per site and a confidence value
+    in 0-100 that shrinks as the P10-P90 band widens relative to the median.
+    """
+    potential_uplifts = np.asarray(potential_uplifts, dtype=np.float32)
+    severity_codes = np.asarray(severity_codes)
+    site_count, issue_count = potential_uplifts.shape
+    block = max(1, SIMULATION_BLOCK_VALUES // ((issue_count + 1) * draws))
+    p10, p50, p90 = (np.empty(site_count, dtype=np.float32) for _ in QUANTILES)
+    for start in range(0, site_count, block):
+        rows = slice(start, start + block)
+        p10[rows], p50[rows], p90[rows] = _simulate_quantiles(
+            potential_uplifts[rows], severity_codes[rows], rng, draws
+        )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        band = np.where(p50 > 0, (p90 - p10) / (2 * p50), 1.0)
+    return {
+        "p10": p10.astype(float),
+        "p50": p50.astype(float),
+        "p90": p90.astype(float),
+        "confidence": np.clip(np.round(100 * (1 - band)), 0, 100).astype(int),
+    }
+
+
+def _simulate_quantiles(
+    potential_uplifts: np.ndarray,
+    severity_codes: np.ndarray,
+    rng: np.random.Generator,
+    draws: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """P10/P50/P90 of the total uplift for one block of sites, see `simulate_uplift_batch`."""
+    site_count, issue_count = potential_uplifts.shape
+    spread = CAPTURE_SPREAD[severity_codes][:, None, :, None]
+
+    # Row 0 is the shared site factor and the second half of the draws mirrors the first.
+    # Halves are a leading axis so every operation below runs over contiguous memory, and
+    # long runs of draws go in chunks that keep to the same SIMULATION_BLOCK_VALUES budget.
+    half = (draws + 1) // 2
+    width = max(1, SIMULATION_BLOCK_VALUES // (2 * site_count * (issue_count + 1)))
+    totals = np.empty((site_count, 2, half), dtype=np.float32)
+    for start in range(0, half, width):
+        columns = slice(start, min(start + width, half))
+        totals[:, :, columns] = _simulate_totals(
+            potential_uplifts, spread, rng, columns.stop - columns.start
+        )
+
+    totals = totals.reshape(site_count, -1)
+    # A full sort beats np.quantile here, which spends most of its time on overhead
+    totals.sort(axis=1)
+    return tuple(totals[:, int(quantile * (totals.shape[1] - 1))] for quantile in QUANTILES)
+
+
+def _simulate_totals(
+    potential_uplifts: np.ndarray,
+    spread: np.ndarray,
+    rng: np.random.Generator,
+    width: int,
+) -> np.ndarray:
+    """Total uplift of `width` antithetic draw pairs per site, shaped (sites, 2, width)."""
+    site_count, issue_count = potential_uplifts.shape
+    normals = np.empty((site_count, 2, issue_count + 1, width), dtype=np.float32)
+    # Four codes from the top bits of each 16-bit lane of the raw 64-bit generator output,
+    # about four times cheaper than bounded `rng.integers` and just as uniform
+    count = site_count * (issue_count + 1) * width
+    codes = rng.bit_generator.random_raw(-(-count // 4)).view(np.uint16)[:count]
+    codes >>= 16 - NORMAL_TABLE_BITS
+    codes = codes.reshape(site_count, issue_count + 1, width)
+    np.take(NORMAL_TABLE, codes, out=normals[:, 0], mode="clip")
+    np.negative(normals[:, 0], out=normals[:, 1])
+
+    captured = normals[:, :, 1:]
+    captured *= np.float32(np.sqrt(1 - CAPTURE_CORRELATION**2))
+    captured += np.float32(CAPTURE_CORRELATION) * normals[:, :, :1]
+    captured *= spread
+    captured += np.float32(CAPTURE_MEAN)
+    np.clip(captured, 0, 1, out=captured)
+
+    return np.matmul(potential_uplifts[:, None, None, :], captured)[:, :, 0]
+
+
+def simulate_uplift(
+    potential_uplifts: Sequence[float],
+    severity_codes: Sequence[int],
+    rng: np.random.Generator,
+    draws: int = SIMULATION_DRAWS,
+) -> Dict[str, float]:
+    """Single-site form of `simulate_uplift_batch`."""
+    if not len(potential_uplifts):
+        return {"p10": 0.0, "p50": 0.0, "p90": 0.0, "confidence": 0}
+    result = simulate_uplift_batch(
+        np.asarray(potential_uplifts)[None, :], np.asarray(severity_codes)[None, :], rng, draws
+    )
+    return {name: values[0].item() for name, values in result.items()}
@@ -1,6 +1,8 @@
+import time
 from datetime import datetime
 from app.core.exceptions import NotFoundException
 from app.core.monitoring.decorators import monitor_transaction
+from app.core.security.token_cache import revoke_cached_tokens, token_versions
 from app.models.domain import UserCreate, UserUpdate
 from app.repositories import UserRepository
 
@@ -31,6 +33,7 @@ class UserService:
             raise NotFoundException(message="User not found")
 
         updated_user = await self.user_repository.update(user_id=user_id, user_data=user_data)
+        await revoke_cached_tokens(user_id)
         return updated_user.dict()
 
     async def get_by_token_creation_at(
@@ -39,4 +42,24 @@ class UserService:
         user = await self.user_repository.get_by_token_creation_at(user_id = user_id, token_creation_at = token_creation_at)
         if not user:
             return None
-        return user.dict()
\ No newline at end of file
+        return user.dict()
+
+    async def get_authenticated_user(
+        self, user_id: int, token_creation_at: datetime
+    ) -> dict | None:
+        """
+        The user a token belongs to, None if the user is gone or the token was rotated out.
+
+        Served from the token version cache when it can, otherwise one query checks the user
+        and the token's creation time together.
+        """
+        user = await token_versions.get(user_id, token_creation_at)
+        if user is not None:
+            return user
+        fetched_at = time.time()
+        user = await self.get_by_token_creation_at(
+            user_id=user_id, token_creation_at=token_creation_at
+        )
+        if user is not None:
+            token_versions.set(user_id, user, fetched_at)
+        return user
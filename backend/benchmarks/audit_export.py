@@ -0,0 +1,143 @@
+"""
+Throughput and memory of the streaming audit export over a million synthetic audits.
+
+By default audits come from an in-memory source that answers keyset page queries like
+`AuditRepository.export_page`, generating each page on demand, so the encoding layer is
+measured alone. With --database the audits are first inserted into the database at
+POSTGRES_URL and exported through the real repository:
+
+    cd backend && python -m benchmarks.audit_export --audits 1000000
+    cd backend && python -m benchmarks.audit_export --audits 1000000 --database --seed
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import time
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import List, Optional, Tuple
+
+from app.services.audit_export import export_audits, iter_export_pages
+from app.services.cro_audit_service import SiteAnalysisRequest, run_audit_pipeline
+
+BASE_TIME = datetime(2026, 1, 1)
+
+
+def build_templates(count: int) -> List[dict]:
+    """Distinct audit payloads that synthetic audits are stamped out from."""
+    return [
+        run_audit_pipeline(
+            SiteAnalysisRequest(
+                website_url=f"https://shop{index}.example.com",
+                monthly_visitors=20000 + index * 1000,
+                current_conversion_rate=1.2 + index * 0.1,
+                average_order_value=60.0 + index,
+                primary_goal="sales",
+            ),
+            deterministic=True,
+        ).model_dump(mode="json")
+        for index in range(count)
+    ]
+
+
+class SyntheticAudits:
+    """Stands in for `AuditRepository`, audit i is created i seconds after BASE_TIME."""
+
+    def __init__(self, count: int, templates: List[dict]):
+        self.count = count
+        # JSONB renders with the default separators, as json.dumps does. Payloads are kept
+        # without their leading audit id, which is stamped in per audit
+        prefix = len('{"audit_id": "') + 36
+        self.payloads = [json.dumps(template)[prefix:] for template in templates]
+
+    async def export_page(
+        self, after: Optional[Tuple[datetime, str]], limit: int, since=None, until=None
+    ):
+        start = 0 if after is None else int((after[0] - BASE_TIME).total_seconds()) + 1
+        rows = []
+        for index in range(start, min(start + limit, self.count)):
+            audit_id = str(uuid.UUID(int=index))
+            payload = self.payloads[index % len(self.payloads)]
+            rows.append(
+                SimpleNamespace(
+                    audit_id=audit_id,
+                    website_url="https://shop.example.com",
+                    created_at=BASE_TIME + timedelta(seconds=index),
+                    payload=f'{{"audit_id": "{audit_id}{payload}',
+                )
+            )
+        return rows
+
+
+async def seed_database(repository, count: int, templates: List[dict], batch: int) -> None:
+    from app.services.audit_history import audit_summary_columns
+    from app.services.audit_retention import add_months, month_start, partition_name
+
+    month = month_start(datetime.utcnow())
+    await repository.create_partition(
+        name=partition_name(month), start=month, end=add_months(month, 1)
+    )
+    for offset in range(0, count, batch):
+        payloads = []
+        for index in range(offset, min(offset + batch, count)):
+            payload = dict(templates[index % len(templates)], audit_id=str(uuid.uuid4()))
+            payloads.append(payload)
+        await repository.create_many(
+            payloads=payloads, summaries=[audit_summary_columns(payload) for payload in payloads]
+        )
+
+
+async def run_export(source, export_format: str, page_size: int) -> Tuple[int, float, int]:
+    size = 0
+    started_at = time.perf_counter()
+    async for chunk in export_audits(iter_export_pages(source, page_size), export_format):
+        size += len(chunk)
+    return size, time.perf_counter() - started_at, peak_rss_kb()
+
+
+def peak_rss_kb() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    templates = build_templates(args.templates)
+    if args.database:
+        from app.core.db import postgres_db
+        from app.repositories import AuditRepository
+
+        await postgres_db.connect_to_db(os.getenv("POSTGRES_URL"))
+        source = AuditRepository(postgres_db)
+        if args.seed:
+            started_at = time.perf_counter()
+            await seed_database(source, args.audits, templates, args.page_size)
+            print(f"seeded {args.audits} audits in {time.perf_counter() - started_at:.1f} s")
+    else:
+        source = SyntheticAudits(args.audits, templates)
+
+    print(f"{'format':>7} {'audits/s':>10} {'MB':>8} {'MB/s':>7} {'peak rss MB':>12}")
+    baseline = peak_rss_kb()
+    for export_format in args.formats:
+        size, elapsed, peak = await run_export(source, export_format, args.page_size)
+        print(
+            f"{export_format:>7} {args.audits / elapsed:>10.0f} {size / 1e6:>8.0f} "
+            f"{size / 1e6 / elapsed:>7.1f} {peak / 1024:>7.0f} (+{(peak - baseline) / 1024:.0f})"
+        )
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--audits", type=int, default=1_000_000)
+    parser.add_argument("--formats", nargs="+", default=["ndjson", "csv"])
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--templates", type=int, default=16)
+    parser.add_argument("--database", action="store_true", help="export from POSTGRES_URL")
+    parser.add_argument("--seed", action="store_true", help="insert the audits first")
+    asyncio.run(main_async(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
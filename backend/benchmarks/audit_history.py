@@ -0,0 +1,159 @@
+"""
+Latency of per-site audit history pages over a million stored audits.
+
+Seeds the database at POSTGRES_URL with synthetic audits spread over many sites (once,
+with --seed), then times history pages through the covering (normalized_url, created_at)
+index, first pages and pages deep into a site's history via cursors, against the same
+page read the pre-index way: filtering on the raw url with OFFSET and decoding payloads.
+
+    cd backend && python -m benchmarks.audit_history --audits 1000000 --sites 10000 --seed
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, List
+
+from sqlalchemy import insert, text
+
+from app.core.db import postgres_db
+from app.models.domain import CROAuditRecord
+from app.repositories import AuditRepository
+from app.services.audit_history import audit_summary_columns, list_audit_history
+from app.services.audit_retention import add_months, month_start, partition_name
+from app.services.cro_audit_service import SiteAnalysisRequest, run_audit_pipeline
+
+
+def site_url(site: int) -> str:
+    return f"https://shop{site}.example.com"
+
+
+async def seed(repository: AuditRepository, audits: int, sites: int, batch: int) -> None:
+    now = datetime.utcnow()
+    # One audit per second going back from now, partitions for every month that covers
+    month = month_start(now - timedelta(seconds=audits))
+    while month <= now:
+        await repository.create_partition(
+            name=partition_name(month), start=month, end=add_months(month, 1)
+        )
+        month = add_months(month, 1)
+
+    templates = [
+        run_audit_pipeline(
+            SiteAnalysisRequest(
+                website_url=site_url(index),
+                monthly_visitors=20000 + index * 1000,
+                current_conversion_rate=1.2 + index * 0.1,
+                average_order_value=60.0 + index,
+                primary_goal="sales",
+            ),
+            deterministic=True,
+        ).model_dump(mode="json")
+        for index in range(16)
+    ]
+    rng = random.Random(7)
+    for offset in range(0, audits, batch):
+        rows = []
+        for index in range(offset, min(offset + batch, audits)):
+            payload = dict(
+                templates[index % len(templates)],
+                audit_id=str(uuid.uuid4()),
+                website_url=site_url(rng.randrange(sites)),
+            )
+            rows.append(
+                {
+                    "audit_id": payload["audit_id"],
+                    "website_url": payload["website_url"],
+                    "created_at": now - timedelta(seconds=index),
+                    "payload": payload,
+                    **audit_summary_columns(payload),
+                }
+            )
+        async with postgres_db.get_session() as session:
+            await session.execute(insert(CROAuditRecord).values(rows))
+            await session.commit()
+    # Index-only scans need an up to date visibility map
+    async with postgres_db.client.connect() as connection:
+        connection = await connection.execution_options(isolation_level="AUTOCOMMIT")
+        await connection.execute(text("VACUUM ANALYZE cro_audits"))
+
+
+async def offset_page(website_url: str, page: int, limit: int) -> None:
+    async with postgres_db.get_session() as session:
+        result = await session.execute(
+            text(
+                "SELECT payload FROM cro_audits WHERE website_url = :website_url "
+                "ORDER BY created_at DESC LIMIT :limit OFFSET :offset"
+            ),
+            {"website_url": website_url, "limit": limit, "offset": page * limit},
+        )
+        # The driver decodes every JSONB payload into Python objects
+        result.all()
+
+
+async def timed_ms(run: Callable[[], Awaitable[None]], repeat: int) -> List[float]:
+    timings = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        await run()
+        timings.append((time.perf_counter() - started_at) * 1000)
+    return timings
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    await postgres_db.connect_to_db(os.getenv("POSTGRES_URL"))
+    repository = AuditRepository(postgres_db)
+    if args.seed:
+        started_at = time.perf_counter()
+        await seed(repository, args.audits, args.sites, batch=1000)
+        print(f"seeded {args.audits} audits in {time.perf_counter() - started_at:.1f} s")
+
+    rng = random.Random(11)
+    sites = [site_url(rng.randrange(args.sites)) for _ in range(args.repeat)]
+
+    print(f"{'query':>22} {'p50 ms':>8} {'p95 ms':>8}")
+    for page in (0, args.deep_page):
+        # Cursors come from walking the earlier pages, only the page itself is timed
+        cursors = []
+        for url in sites:
+            cursor = None
+            for _ in range(page):
+                history = await list_audit_history(repository, url, cursor, args.limit)
+                cursor = history.next_cursor
+            cursors.append((url, cursor))
+        keyset, offset = iter(cursors), iter(sites)
+
+        def keyset_page():
+            return list_audit_history(repository, *next(keyset), args.limit)
+
+        def offset_page_of_site():
+            return offset_page(next(offset), page, args.limit)
+
+        for name, run in (
+            (f"keyset page {page}", keyset_page),
+            (f"offset page {page}", offset_page_of_site),
+        ):
+            timings = sorted(await timed_ms(run, args.repeat))
+            p95 = timings[int(len(timings) * 0.95) - 1]
+            print(f"{name:>22} {statistics.median(timings):>8.2f} {p95:>8.2f}")
+    await postgres_db.close_db_connection()
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--audits", type=int, default=1_000_000)
+    parser.add_argument("--sites", type=int, default=10_000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--deep-page", type=int, default=4, help="page reached through cursors")
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--seed", action="store_true", help="insert the audits first")
+    asyncio.run(main_async(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Per-request overhead of `protected_auth` with and without its token caches.
+
+Times the token verification step alone, `verify_token` against a cache hit, and the whole
+dependency over a `UserService` whose repository answers from memory and counts the queries
+it would have sent, so the cost authentication adds besides those queries is what remains:
+
+    cd backend && python -m benchmarks.auth_overhead --requests 20000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, List, Optional
+
+from fastapi.security import HTTPAuthorizationCredentials
+from starlette.requests import Request
+
+from app.core.security.dependencies import protected_auth
+from app.core.security.security import create_access_token, verify_token
+from app.core.security.token_cache import token_versions, verified_tokens
+from app.models.domain import User
+from app.services import UserService
+
+
+class InMemoryUsers:
+    """Stands in for `UserRepository`, answers the lookup `protected_auth` makes and counts it."""
+
+    def __init__(self, token_creation_at: datetime):
+        self.queries = 0
+        self.user = User(
+            id=1, email="user@example.com", password="x", token_creation_at=token_creation_at
+        )
+
+    async def get_by_token_creation_at(
+        self, user_id: int, token_creation_at: datetime
+    ) -> Optional[User]:
+        self.queries += 1
+        creation_at = self.user.token_creation_at
+        if token_creation_at <= creation_at < token_creation_at + timedelta(seconds=1):
+            return self.user
+        return None
+
+
+async def timed_us(run: Callable[[], Awaitable[Any]], repeat: int) -> List[float]:
+    timings = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        await run()
+        timings.append((time.perf_counter() - started_at) * 1e6)
+    return timings
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    token, _ = create_access_token({"sub": "1"}, created_at=datetime.utcnow())
+    repository = InMemoryUsers(verify_token(token, "access")["iat"])
+    users = UserService(repository)
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    async def verify_uncached():
+        return verify_token(token, "access")
+
+    async def verify_cached():
+        return verified_tokens.verify(token, "access")
+
+    async def auth_uncached():
+        verified_tokens.clear()
+        await token_versions.invalidate(1)
+        return await auth_cached()
+
+    async def auth_cached():
+        request = Request({"type": "http", "headers": []})
+        return await protected_auth(request, user_service=users, authorization=credentials)
+
+    print(f"{'step':>24} {'p50 us':>8} {'p95 us':>8} {'req/s':>9} {'queries/req':>12}")
+    for name, run in (
+        ("verify_token", verify_uncached),
+        ("cached verify", verify_cached),
+        ("protected_auth uncached", auth_uncached),
+        ("protected_auth cached", auth_cached),
+    ):
+        await timed_us(run, args.requests // 10)
+        repository.queries = 0
+        timings = sorted(await timed_us(run, args.requests))
+        p95 = timings[int(len(timings) * 0.95) - 1]
+        print(
+            f"{name:>24} {statistics.median(timings):>8.1f} {p95:>8.1f} "
+            f"{1e6 / statistics.mean(timings):>9.0f} {repository.queries / args.requests:>12.2f}"
+        )
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20000)
+    asyncio.run(main_async(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Statements and transactions each authentication flow sends to the database.
+
+Runs signup, a duplicate signup, login, refresh and an authenticated request through the
+real services against the database at POSTGRES_URL, counting what reaches the driver, and
+times each flow:
+
+    cd backend && python -m benchmarks.auth_queries --repeat 20
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List
+
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import event
+from starlette.requests import Request
+
+from app.core.db import postgres_db
+from app.core.exceptions import ConflictException
+from app.core.security.dependencies import protected_auth
+from app.core.security.security import verify_token
+from app.core.security.token_cache import revoke_cached_tokens
+from app.models.domain import SignupRequest
+from app.repositories import ProfileRepository, ResetPasswordRepository, UserRepository
+from app.services import AuthService, UserService
+
+PASSWORD = "benchmark42"
+
+
+class QueryCounter:
+    def __init__(self) -> None:
+        self.statements = 0
+        self.transactions = 0
+
+    def attach(self, engine: Any) -> None:
+        event.listen(engine, "before_cursor_execute", self._on_statement)
+        event.listen(engine, "begin", self._on_begin)
+
+    def reset(self) -> None:
+        self.statements = 0
+        self.transactions = 0
+
+    def _on_statement(self, *args: Any) -> None:
+        self.statements += 1
+
+    def _on_begin(self, *args: Any) -> None:
+        self.transactions += 1
+
+
+async def measure(
+    counter: QueryCounter, run: Callable[[], Awaitable[Any]], repeat: int
+) -> Dict[str, float]:
+    timings, statements, transactions = [], [], []
+    for _ in range(repeat):
+        counter.reset()
+        started_at = time.perf_counter()
+        await run()
+        timings.append((time.perf_counter() - started_at) * 1000)
+        statements.append(counter.statements)
+        transactions.append(counter.transactions)
+    return {
+        "statements": statistics.mean(statements),
+        "transactions": statistics.mean(transactions),
+        "p50_ms": statistics.median(timings),
+    }
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    await postgres_db.connect_to_db(os.getenv("POSTGRES_URL"))
+    counter = QueryCounter()
+    counter.attach(postgres_db.client.sync_engine)
+    user_repository = UserRepository(postgres_db)
+    auth_service = AuthService(
+        user_repository, ProfileRepository(postgres_db), ResetPasswordRepository(postgres_db)
+    )
+    user_service = UserService(user_repository)
+    state: Dict[str, Any] = {}
+
+    async def signup():
+        state["email"] = f"bench-{uuid.uuid4().hex}@example.com"
+        user, _, _ = await auth_service.signup(
+            SignupRequest(full_name="Bench User", email=state["email"], password=PASSWORD)
+        )
+        state["user_id"] = user.id
+
+    async def duplicate_signup():
+        try:
+            await auth_service.signup(
+                SignupRequest(full_name="Bench User", email=state["email"], password=PASSWORD)
+            )
+        except ConflictException:
+            pass
+
+    async def login():
+        state["access"], state["refresh"] = await auth_service.login(state["email"], PASSWORD)
+
+    async def refresh():
+        state["access"] = await auth_service.refresh_token(
+            verify_token(state["refresh"], "refresh")
+        )
+
+    async def authenticated_request(cold: bool):
+        if cold:
+            await revoke_cached_tokens(state["user_id"])
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=state["access"])
+        request = Request({"type": "http", "headers": []})
+        await protected_auth(request, user_service=user_service, authorization=credentials)
+
+    print(f"{'flow':>22} {'statements':>11} {'transactions':>13} {'p50 ms':>8}")
+    for name, run in (
+        ("signup", signup),
+        ("duplicate signup", duplicate_signup),
+        ("login", login),
+        ("refresh", refresh),
+        ("request, cold caches", lambda: authenticated_request(cold=True)),
+        ("request, warm caches", lambda: authenticated_request(cold=False)),
+    ):
+        result = await measure(counter, run, args.repeat)
+        print(
+            f"{name:>22} {result['statements']:>11.1f} {result['transactions']:>13.1f} "
+            f"{result['p50_ms']:>8.2f}"
+        )
+    await postgres_db.close_db_connection()
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    asyncio.run(main_async(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Throughput of the vectorized batch audit against the scalar pipeline run once per site.
+
+Generates audits for the same synthetic sites with `run_audit_pipeline` per site, dumped
+to the JSON-ready dicts the batch returns, and with `generate_audits_batch`. Both simulate
+SIMULATION_DRAWS per site, so results are equally stable:
+
+    cd backend && python -m benchmarks.batch_analysis --sites 1000
+"""
+
+import argparse
+import time
+from typing import Callable, List
+
+import numpy as np
+
+from app.services.cro_audit_batch import generate_audits_batch
+from app.services.cro_audit_service import SiteAnalysisRequest, run_audit_pipeline
+from app.services.uplift_simulation import SIMULATION_DRAWS
+
+INDUSTRIES = ["fashion", "electronics", "beauty", "home", "general"]
+
+
+def build_requests(count: int, rng: np.random.Generator) -> List[SiteAnalysisRequest]:
+    return [
+        SiteAnalysisRequest(
+            website_url=f"https://shop{index}.example.com",
+            monthly_visitors=int(rng.integers(1000, 1_000_000)),
+            current_conversion_rate=round(float(rng.uniform(0.2, 6.0)), 2),
+            average_order_value=round(float(rng.uniform(10.0, 400.0)), 2),
+            industry=INDUSTRIES[index % len(INDUSTRIES)],
+            primary_goal="sales",
+        )
+        for index in range(count)
+    ]
+
+
+def best_seconds(run: Callable[[], object], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        run()
+        samples.append(time.perf_counter() - started_at)
+    return min(samples)
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sites", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+    requests = build_requests(args.sites, np.random.default_rng(7))
+    # Warm the catalog, benchmark index and normal table outside the timings
+    generate_audits_batch(requests[:10])
+    run_audit_pipeline(requests[0])
+
+    scalar = best_seconds(
+        lambda: [run_audit_pipeline(request).model_dump(mode="json") for request in requests],
+        args.repeat,
+    )
+    batch = best_seconds(lambda: generate_audits_batch(requests), args.repeat)
+
+    print(f"{args.sites} sites, {SIMULATION_DRAWS} draws each")
+    print(f"{'':<16} {'total ms':>9} {'per site us':>12} {'speedup':>8}")
+    for label, seconds in (("scalar pipeline", scalar), ("batch", batch)):
+        print(
+            f"{label:<16} {seconds * 1000:>9.1f} {seconds / args.sites * 1e6:>12.1f} "
+            f"{scalar / seconds:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
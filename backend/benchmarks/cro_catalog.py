@@ -0,0 +1,91 @@
+"""
+Per-audit cost of issue and recommendation generation from the compiled catalog.
+
+Compares the original implementation in reference_code.py, which rebuilds its issue,
+description and recommendation tables on every call and re-filters the remaining issues
+with a list comprehension per pick, against the compiled catalog:
+
+    cd backend && python -m benchmarks.cro_catalog --audits 20000
+"""
+
+import argparse
+import random
+import time
+from typing import Callable, List
+
+import reference_code
+
+from app.services.cro_audit_service import generate_recommendations, iter_cro_issues
+from app.services.cro_catalog import CROCatalog, get_catalog, get_catalog_loader
+
+CATEGORY_ISSUES = [
+    {"category": category, "issues": list(issues)}
+    for category, issues in zip(get_catalog().categories, get_catalog().category_issues)
+]
+
+
+def filtered_draw(rng: random.Random) -> List[str]:
+    """Issue picks as the pipeline made them before the catalog was compiled."""
+    used_issues = set()
+    picked = []
+    for _ in range(rng.randint(8, 15)):
+        category_data = rng.choice(CATEGORY_ISSUES)
+        available_issues = [issue for issue in category_data["issues"] if issue not in used_issues]
+        if not available_issues:
+            continue
+        issue_text = rng.choice(available_issues)
+        used_issues.add(issue_text)
+        picked.append(issue_text)
+    return picked
+
+
+def per_call_us(run: Callable[[], object], calls: int) -> float:
+    started_at = time.perf_counter()
+    for _ in range(calls):
+        run()
+    return (time.perf_counter() - started_at) / calls * 1e6
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--audits", type=int, default=20000)
+    args = parser.parse_args(argv)
+    catalog = get_catalog()
+    rng = random.Random(7)
+
+    def before() -> None:
+        random.seed(rng.getrandbits(64))
+        issues = reference_code.generate_cro_issues("https://shop.example.com", 1.8, 80.0)
+        reference_code.generate_recommendations(issues)
+
+    def after() -> None:
+        issues = sorted(
+            iter_cro_issues("https://shop.example.com", 1.8, 80.0, rng, catalog=catalog),
+            key=lambda x: x.impact_score,
+            reverse=True,
+        )
+        generate_recommendations(issues, rng, catalog)
+
+    # Identical seeds give identical picks, the compiled draw only changes their cost
+    seed = rng.getrandbits(64)
+    picks = [catalog.issues[issue] for issue in catalog.draw_issues(random.Random(seed))]
+    assert picks == filtered_draw(random.Random(seed))
+
+    path = get_catalog_loader().path
+    rows = [
+        ("issues + recommendations, per call tables", per_call_us(before, args.audits)),
+        ("issues + recommendations, compiled catalog", per_call_us(after, args.audits)),
+        ("issue picks, filtered lists", per_call_us(lambda: filtered_draw(rng), args.audits)),
+        (
+            "issue picks, bitmask tables",
+            per_call_us(lambda: list(catalog.draw_issues(rng)), args.audits),
+        ),
+        ("catalog compile (reload)", per_call_us(lambda: CROCatalog.from_file(path), 200)),
+    ]
+    print(f"catalog version {catalog.version} ({catalog.digest}), {path.stat().st_size} bytes")
+    for label, microseconds in rows:
+        print(f"{label:<44} {microseconds:>9.1f} us")
+
+
+if __name__ == "__main__":
+    main()
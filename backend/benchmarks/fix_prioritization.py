@@ -0,0 +1,65 @@
+"""
+Latency of the fix prioritization solvers on multi-page sized audits.
+
+Generates issue lists of increasing size from the catalog and times the exact knapsack
+DP and the greedy bound at several effort budgets, with the uplift each one reaches:
+
+    cd backend && python -m benchmarks.fix_prioritization --issues 100 300 1000
+"""
+
+import argparse
+import random
+import time
+from typing import List
+
+from app.services.cro_audit_service import CROIssue, iter_cro_issues
+from app.services.fix_prioritization import prioritize_fixes
+
+
+def build_issues(count: int, rng: random.Random) -> List[CROIssue]:
+    """Issues of a multi-page audit: catalog draws repeated once per audited page."""
+    issues: List[CROIssue] = []
+    while len(issues) < count:
+        issues.extend(iter_cro_issues("https://shop.example.com", 1.8, 80.0, rng))
+    return issues[:count]
+
+
+def best_of_ms(run, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        run()
+        timings.append((time.perf_counter() - started_at) * 1000)
+    return min(timings)
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--issues", type=int, nargs="+", default=[100, 300, 1000])
+    parser.add_argument("--budgets", type=float, nargs="+", default=[20, 60, 200])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+    rng = random.Random(7)
+
+    print(f"{'issues':>7} {'days':>6} {'dp ms':>8} {'dp %':>6} {'greedy ms':>10} {'greedy %':>9}")
+    for count in args.issues:
+        issues = build_issues(count, rng)
+        for budget in args.budgets:
+            plans = {}
+            timings = {}
+            for method, cells in (("dp", None), ("greedy", 0)):
+                options = {} if cells is None else {"dp_max_cells": cells}
+
+                def run():
+                    plans[method] = prioritize_fixes(issues, budget, 50000, 1.8, 80.0, **options)
+
+                timings[method] = best_of_ms(run, args.repeat)
+            print(
+                f"{count:>7} {budget:>6.0f} {timings['dp']:>8.2f} "
+                f"{plans['dp'].total_uplift_percentage:>6.1f} {timings['greedy']:>10.2f} "
+                f"{plans['greedy'].total_uplift_percentage:>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
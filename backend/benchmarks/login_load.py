@@ -0,0 +1,116 @@
+"""
+Responsiveness of the rest of the API while a burst of logins runs bcrypt.
+
+Serves a small app in process with a login route that checks a password the way
+`AuthService.login` does and a cheap ping route, then fires a burst of concurrent logins
+while pings are due at a steady rate. Runs once with bcrypt called inline on the event loop
+and once through the bounded `password_hasher` pool:
+
+    cd backend && python -m benchmarks.login_load --logins 32 --pings 200
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections import Counter
+from typing import List, Tuple
+
+import httpx
+from fastapi import FastAPI
+from pydantic import BaseModel
+
+from app.core.exceptions import UnauthorizedException, setup_exception_handlers
+from app.core.middlewares import RequestIDMiddleware
+from app.core.security.hashing import password_hasher
+from app.core.security.security import get_password_hash, verify_password
+
+PASSWORD = "correct-horse-42"
+
+
+class LoginRequest(BaseModel):
+    password: str
+
+
+def build_app(hashed_password: str, inline: bool) -> FastAPI:
+    app = FastAPI()
+    setup_exception_handlers(app)
+    app.add_middleware(RequestIDMiddleware)
+
+    @app.post("/login")
+    async def login(body: LoginRequest):
+        if inline:
+            valid = verify_password(body.password, hashed_password)
+        else:
+            valid = await password_hasher.verify(body.password, hashed_password)
+        if not valid:
+            raise UnauthorizedException(message="Invalid credentials")
+        return {"status": "ok"}
+
+    @app.get("/ping")
+    async def ping():
+        return {"status": "ok"}
+
+    return app
+
+
+async def run_load(
+    app: FastAPI, logins: int, pings: int, ping_interval: float
+) -> Tuple[List[float], Counter, float]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def login() -> int:
+            response = await client.post("/login", json={"password": PASSWORD})
+            return response.status_code
+
+        async def ping() -> List[float]:
+            # Latency counts from when each ping was due, so time a blocked event loop kept a
+            # ping from even being sent is included
+            timings = []
+            due = time.perf_counter()
+            for _ in range(pings):
+                await asyncio.sleep(max(0.0, due - time.perf_counter()))
+                await client.get("/ping")
+                timings.append((time.perf_counter() - due) * 1000)
+                due += ping_interval
+            return timings
+
+        started_at = time.perf_counter()
+        pinger = asyncio.create_task(ping())
+        statuses = Counter(await asyncio.gather(*(login() for _ in range(logins))))
+        login_seconds = time.perf_counter() - started_at
+        return await pinger, statuses, login_seconds
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    hashed_password = get_password_hash(PASSWORD)
+    print(
+        f"{'mode':>9} {'ping p50 ms':>12} {'ping p99 ms':>12} {'ping max ms':>12} "
+        f"{'burst s':>8}  logins by status"
+    )
+    for mode in ("inline", "executor"):
+        app = build_app(hashed_password, inline=mode == "inline")
+        timings, statuses, login_seconds = await run_load(
+            app, args.logins, args.pings, args.ping_interval
+        )
+        timings.sort()
+        p99 = timings[int(len(timings) * 0.99) - 1]
+        print(
+            f"{mode:>9} {statistics.median(timings):>12.1f} {p99:>12.1f} {timings[-1]:>12.1f} "
+            f"{login_seconds:>8.1f}  {dict(sorted(statuses.items()))}"
+        )
+    print(password_hasher.metrics())
+    password_hasher.shutdown()
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--logins", type=int, default=32, help="concurrent login requests")
+    parser.add_argument("--pings", type=int, default=200)
+    parser.add_argument("--ping-interval", type=float, default=0.01, help="seconds")
+    asyncio.run(main_async(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
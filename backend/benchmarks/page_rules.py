@@ -0,0 +1,69 @@
+"""
+CPU and memory profile of the single-pass page rule engine.
+
+Builds synthetic product pages of increasing size, runs every CRO page rule over each
+of them and reports parse time, per-rule CPU time and peak traced memory:
+
+    cd backend && python -m benchmarks.page_rules --sizes-mb 1 4 16
+"""
+
+import argparse
+import time
+import tracemalloc
+from typing import List
+
+from app.services.page_analysis import PAGE_RULES, page_rule_engine
+
+PRODUCT_CARD = (
+    '<div class="product-card"><img src="/p.jpg" alt="Running shoe">'
+    "<h2>Trail runner</h2><p>Lightweight and breathable with a grippy sole &amp; more.</p>"
+    '<a href="/products/trail-runner">View</a><span class="price">$89</span></div>'
+)
+
+
+def build_page(size: int) -> bytes:
+    head = (
+        "<!doctype html><html><head><title>Store</title>"
+        '<meta name="viewport" content="width=device-width">'
+        '<script src="https://cdn.example.com/app.js"></script>'
+        "<style>.product-card{display:flex}</style></head><body><h1>Shoes for every trail</h1>"
+    )
+    tail = '<footer><a href="https://instagram.com/store">Instagram</a></footer></body></html>'
+    cards = PRODUCT_CARD * max((size - len(head) - len(tail)) // len(PRODUCT_CARD), 1)
+    return (head + cards + tail).encode()
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes-mb", type=float, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--top", type=int, default=5, help="slowest rules to list per page")
+    args = parser.parse_args(argv)
+
+    print(f"{len(PAGE_RULES)} rules, peak KB excludes the page buffer")
+    print(f"{'page MB':>8} {'wall s':>8} {'parse s':>8} {'rules s':>8} {'MB/s':>7} {'peak KB':>8}")
+    for size_mb in args.sizes_mb:
+        page = build_page(int(size_mb * 1024 * 1024))
+        started_at = time.perf_counter()
+        result = page_rule_engine.run(page)
+        elapsed = time.perf_counter() - started_at
+
+        # Separate pass, tracing allocations slows the parse down several times
+        tracemalloc.start()
+        baseline, _ = tracemalloc.get_traced_memory()
+        page_rule_engine.run(page)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        rule_seconds = sum(result.rule_cpu_seconds.values())
+        print(
+            f"{len(page) / 2**20:>8.1f} {elapsed:>8.3f} {result.parse_cpu_seconds:>8.3f} "
+            f"{rule_seconds:>8.3f} {len(page) / 2**20 / elapsed:>7.1f} "
+            f"{(peak - baseline) / 1024:>8.0f}"
+        )
+        slowest = sorted(result.rule_cpu_seconds.items(), key=lambda item: -item[1])
+        for issue, seconds in slowest[: args.top]:
+            print(f"{'':>10}{seconds * 1000:>9.1f} ms  {issue}")
+
+
+if __name__ == "__main__":
+    main()
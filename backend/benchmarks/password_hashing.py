@@ -0,0 +1,64 @@
+"""
+bcrypt cost against hash latency on this machine, and the cost startup calibration picks.
+
+Times hashes at each cost in a range, best and median of a few samples, then runs the same
+calibration as startup for a latency target:
+
+    cd backend && python -m benchmarks.password_hashing --min-rounds 10 --max-rounds 14
+    cd backend && python -m benchmarks.password_hashing --target 0.1
+"""
+
+import argparse
+import statistics
+import time
+from typing import List
+
+from app.core.config import settings
+from app.core.security.security import calibrate_bcrypt_rounds, pwd_context
+
+
+def hash_timings_ms(rounds: int, samples: int) -> List[float]:
+    handler = pwd_context.handler("bcrypt").using(rounds=rounds)
+    timings = []
+    for _ in range(samples):
+        started_at = time.perf_counter()
+        handler.hash("benchmark-password")
+        timings.append((time.perf_counter() - started_at) * 1000)
+    return timings
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--min-rounds", type=int, default=settings.security.PASSWORD_HASH_MIN_ROUNDS
+    )
+    parser.add_argument(
+        "--max-rounds", type=int, default=settings.security.PASSWORD_HASH_MAX_ROUNDS
+    )
+    parser.add_argument(
+        "--target", type=float, default=settings.security.PASSWORD_HASH_TARGET_SECONDS
+    )
+    parser.add_argument("--samples", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print(f"{'rounds':>6} {'best ms':>9} {'median ms':>10} {'hashes/s':>9}")
+    for rounds in range(args.min_rounds, args.max_rounds + 1):
+        timings = hash_timings_ms(rounds, args.samples)
+        print(
+            f"{rounds:>6} {min(timings):>9.1f} {statistics.median(timings):>10.1f} "
+            f"{1000 / statistics.median(timings):>9.2f}"
+        )
+        # Every further round doubles, stop once a hash is far past any sensible target
+        if min(timings) > 4000 * args.target:
+            break
+
+    started_at = time.perf_counter()
+    rounds = calibrate_bcrypt_rounds(args.target, args.min_rounds, args.max_rounds)
+    print(
+        f"calibrated for {args.target * 1000:.0f} ms: {rounds} rounds "
+        f"(calibration took {time.perf_counter() - started_at:.2f} s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Throughput benchmark for the pooled site fetcher.
+
+Serves a fixture HTML page from a local threaded HTTP server and measures pages/sec
+fetched through `SiteFetcher` at several concurrency levels:
+
+    cd backend && python -m benchmarks.site_fetcher --pages 2000 --latency-ms 20
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import socket
+import time
+from typing import Callable, List
+
+import uvicorn
+
+from app.core.fetcher import SiteFetcher
+
+FIXTURE_LATENCY = 0.0
+FIXTURE_PAGE = (
+    b"<!doctype html><html><head><title>Fixture store</title>"
+    b'<meta name="viewport" content="width=device-width"></head><body>'
+    b'<nav class="breadcrumb">Home / Shoes</nav><form role="search"><input name="q"></form>'
+    + b'<img src="/p.jpg" alt="product">' * 20
+    + b"<p>Lorem ipsum dolor sit amet.</p>" * 400
+    + b"</body></html>"
+)
+
+
+async def fixture_app(scope: dict, receive: Callable, send: Callable) -> None:
+    if scope["type"] != "http":
+        return
+    if FIXTURE_LATENCY:
+        await asyncio.sleep(FIXTURE_LATENCY)
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", b"text/html; charset=utf-8"),
+                (b"content-length", str(len(FIXTURE_PAGE)).encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": FIXTURE_PAGE})
+
+
+def serve_fixture(port: int, latency: float) -> None:
+    global FIXTURE_LATENCY
+    FIXTURE_LATENCY = latency
+    uvicorn.run(fixture_app, host="127.0.0.1", port=port, log_level="warning", backlog=4096)
+
+
+async def run_level(base_url: str, concurrency: int, pages: int) -> dict:
+    fetcher = SiteFetcher()
+    await fetcher.start(
+        max_connections=concurrency,
+        max_connections_per_host=concurrency,
+        max_keepalive_connections=concurrency,
+        allow_private_hosts=True,
+    )
+    try:
+        started_at = time.perf_counter()
+        results = await fetcher.fetch_many(f"{base_url}/page/{index}" for index in range(pages))
+        elapsed = time.perf_counter() - started_at
+    finally:
+        await fetcher.stop()
+    failed = sum(not page.ok for page in results)
+    latencies = sorted(page.elapsed for page in results)
+    return {
+        "concurrency": concurrency,
+        "pages_per_sec": pages / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "failed": failed,
+    }
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", type=int, default=1000)
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="simulated server time")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64])
+    args = parser.parse_args(argv)
+
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    # Serve from another process so the server does not compete with the client for the GIL
+    server = multiprocessing.Process(
+        target=serve_fixture, args=(port, args.latency_ms / 1000), daemon=True
+    )
+    server.start()
+    while socket.socket().connect_ex(("127.0.0.1", port)):
+        time.sleep(0.05)
+    base_url = f"http://127.0.0.1:{port}"
+
+    print(f"{len(FIXTURE_PAGE)} byte page, {args.pages} pages, {args.latency_ms}ms latency")
+    print(f"{'concurrency':>12} {'pages/sec':>10} {'p50 ms':>8} {'p99 ms':>8} {'failed':>7}")
+    try:
+        for concurrency in args.concurrency:
+            result = asyncio.run(run_level(base_url, concurrency, args.pages))
+            print(
+                f"{result['concurrency']:>12} {result['pages_per_sec']:>10.1f} "
+                f"{result['p50_ms']:>8.1f} {result['p99_ms']:>8.1f} {result['failed']:>7}"
+            )
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
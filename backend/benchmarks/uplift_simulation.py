@@ -0,0 +1,94 @@
+"""
+Latency of the Monte Carlo uplift simulation.
+
+Times one audit's simulation at the default draw count against a straightforward
+`standard_normal` + `np.quantile` implementation of the same model, then the batch
+path over many sites:
+
+    cd backend && python -m benchmarks.uplift_simulation --draws 100000 --sites 1000
+"""
+
+import argparse
+import time
+from typing import Callable, List
+
+import numpy as np
+
+from app.services.uplift_simulation import (
+    CAPTURE_CORRELATION,
+    CAPTURE_MEAN,
+    CAPTURE_SPREAD,
+    SIMULATION_DRAWS,
+    simulate_uplift,
+    simulate_uplift_batch,
+)
+
+POTENTIAL_UPLIFTS = [40.1, 30.2, 18.5, 12.0, 8.3]
+SEVERITY_CODES = [0, 0, 1, 1, 2]
+
+
+def baseline_uplift(potential_uplifts, severity_codes, rng: np.random.Generator, draws: int):
+    shared = rng.standard_normal((draws, 1))
+    own = rng.standard_normal((draws, len(potential_uplifts)))
+    normals = CAPTURE_CORRELATION * shared + np.sqrt(1 - CAPTURE_CORRELATION**2) * own
+    captured = np.clip(CAPTURE_MEAN + normals * CAPTURE_SPREAD[severity_codes], 0, 1)
+    return np.quantile(captured @ np.asarray(potential_uplifts), [0.1, 0.5, 0.9])
+
+
+def timings_ms(run: Callable[[], object], repeat: int) -> List[float]:
+    run()
+    samples = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - started_at) * 1000)
+    return sorted(samples)
+
+
+def report(label: str, samples: List[float]) -> None:
+    p50, p99 = samples[len(samples) // 2], samples[int(len(samples) * 0.99)]
+    print(f"{label:<34} {p50:>9.2f} {p99:>9.2f}")
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--draws", type=int, default=SIMULATION_DRAWS)
+    parser.add_argument("--sites", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args(argv)
+    rng = np.random.default_rng(7)
+
+    result = simulate_uplift(POTENTIAL_UPLIFTS, SEVERITY_CODES, rng, args.draws)
+    print(
+        f"uplift P10/P50/P90 {result['p10']:.1f}/{result['p50']:.1f}/{result['p90']:.1f}%"
+        f", confidence {result['confidence']}"
+    )
+    print(f"{'':<34} {'p50 ms':>9} {'p99 ms':>9}")
+    report(
+        f"simulate_uplift ({args.draws} draws)",
+        timings_ms(
+            lambda: simulate_uplift(POTENTIAL_UPLIFTS, SEVERITY_CODES, rng, args.draws),
+            args.repeat,
+        ),
+    )
+    report(
+        "standard_normal + np.quantile",
+        timings_ms(
+            lambda: baseline_uplift(POTENTIAL_UPLIFTS, SEVERITY_CODES, rng, args.draws),
+            args.repeat,
+        ),
+    )
+
+    uplifts = np.tile(POTENTIAL_UPLIFTS, (args.sites, 1))
+    codes = np.tile(SEVERITY_CODES, (args.sites, 1))
+    report(
+        f"batch ({args.sites} x {args.draws} draws)",
+        timings_ms(
+            lambda: simulate_uplift_batch(uplifts, codes, rng, args.draws),
+            max(args.repeat // 100, 3),
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
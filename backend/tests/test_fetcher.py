@@ -0,0 +1,121 @@
+import asyncio
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from app.core import fetcher
+from app.core.fetcher import SiteFetcher, is_public_address
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.hits.append(self.path)
+        location = parse_qs(urlsplit(self.path).query).get("to")
+        if location:
+            self.send_response(302)
+            self.send_header("Location", location[0])
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = b"<html><title>fixture</title></html>"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def fixture_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    server.hits = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def loopback_is_public(monkeypatch):
+    """Treat the fixture server's address as public, everything else keeps the real rule."""
+    monkeypatch.setattr(
+        fetcher, "is_public_address", lambda host: host == "127.0.0.1" or is_public_address(host)
+    )
+
+
+def fetch(url: str, **options):
+    async def run():
+        site_fetcher = SiteFetcher()
+        await site_fetcher.start(connect_timeout=2.0, total_timeout=5.0, **options)
+        try:
+            return await site_fetcher.fetch(url)
+        finally:
+            await site_fetcher.stop()
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize(
+    "host, public",
+    [
+        ("93.184.216.34", True),
+        ("2606:4700:4700::1111", True),
+        ("127.0.0.1", False),
+        ("10.1.2.3", False),
+        ("169.254.169.254", False),
+        ("::1", False),
+        ("fe80::1%eth0", False),
+        ("::ffff:127.0.0.1", False),
+        ("not-an-address", False),
+    ],
+)
+def test_is_public_address(host, public):
+    assert is_public_address(host) is public
+
+
+def test_private_host_is_blocked_before_connecting(fixture_server):
+    page = fetch(f"http://127.0.0.1:{fixture_server.server_port}/")
+
+    assert page.error.startswith("BlockedHostError")
+    assert fixture_server.hits == []
+
+
+def test_private_hosts_allowed_when_configured(fixture_server):
+    page = fetch(f"http://127.0.0.1:{fixture_server.server_port}/", allow_private_hosts=True)
+
+    assert page.ok
+    assert page.content == b"<html><title>fixture</title></html>"
+    assert fixture_server.hits == ["/"]
+
+
+def test_connection_uses_the_checked_address(fixture_server, loopback_is_public, monkeypatch):
+    # The first lookup passes the check, any later one would rebind to a private address
+    lookups = []
+
+    async def rebinding_getaddrinfo(self, host, port, **kwargs):
+        lookups.append(host)
+        address = "127.0.0.1" if len(lookups) == 1 else "127.0.0.2"
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (address, port))]
+
+    monkeypatch.setattr(asyncio.BaseEventLoop, "getaddrinfo", rebinding_getaddrinfo)
+    page = fetch(f"http://rebind.test:{fixture_server.server_port}/")
+
+    assert page.ok
+    assert lookups == ["rebind.test"]
+    assert fixture_server.hits == ["/"]
+
+
+def test_redirect_to_private_host_is_blocked(fixture_server, loopback_is_public):
+    port = fixture_server.server_port
+    page = fetch(f"http://127.0.0.1:{port}/?to=http://[::1]:{port}/")
+
+    assert page.error.startswith("BlockedHostError")
+    assert "non-public ::1" in page.error
+    assert fixture_server.hits == [f"/?to=http://[::1]:{port}/"]
@@ -0,0 +1,45 @@
+import pytest
+from pydantic import ValidationError
+
+from app.services.cro_audit_service import CROIssue
+from app.services.fix_prioritization import FixPrioritizationRequest, prioritize_fixes
+
+ISSUES = [
+    CROIssue(
+        category=category,
+        issue=f"{category} issue {index}",
+        severity="High",
+        impact_score=80,
+        description="",
+        potential_uplift=uplift,
+    )
+    for index, (category, uplift) in enumerate(
+        [("checkout", 18.0), ("checkout", 9.5), ("mobile", 12.0), ("trust", 4.0)]
+    )
+]
+
+
+def plan(effort_budget_days: float):
+    return prioritize_fixes(ISSUES, effort_budget_days, 50000, 1.5, 80.0)
+
+
+@pytest.mark.parametrize("effort_budget_days", [1e6, 1e300, float("inf")])
+def test_budget_beyond_every_fix_is_clamped(effort_budget_days):
+    result = plan(effort_budget_days)
+
+    assert result.method == "dp"
+    assert len(result.fixes) == len(ISSUES)
+    assert result.total_uplift_percentage == plan(1e4).total_uplift_percentage
+    assert result.effort_budget_days == effort_budget_days
+
+
+@pytest.mark.parametrize("effort_budget_days", [float("inf"), float("nan"), "Infinity"])
+def test_request_rejects_non_finite_budgets(effort_budget_days):
+    with pytest.raises(ValidationError):
+        FixPrioritizationRequest(
+            issues=ISSUES,
+            effort_budget_days=effort_budget_days,
+            monthly_visitors=50000,
+            current_conversion_rate=1.5,
+            average_order_value=80.0,
+        )
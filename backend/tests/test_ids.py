@@ -0,0 +1,31 @@
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from app.core.ids import id_created_at, time_ordered_id
+
+
+def test_time_ordered_id_carries_its_creation_time():
+    before = datetime.utcnow() - timedelta(milliseconds=1)
+    value = time_ordered_id()
+    after = datetime.utcnow()
+
+    parsed = uuid.UUID(value)
+    assert str(parsed) == value
+    assert parsed.version == 7
+    assert parsed.variant == uuid.RFC_4122
+    assert before <= id_created_at(value) <= after
+    assert id_created_at(value).microsecond % 1000 == 0
+
+
+def test_time_ordered_ids_sort_by_creation_time():
+    first = time_ordered_id()
+    time.sleep(0.002)
+
+    assert first < time_ordered_id()
+    assert len({time_ordered_id() for _ in range(1000)}) == 1000
+
+
+def test_other_ids_have_no_creation_time():
+    assert id_created_at(str(uuid.uuid4())) is None
+    assert id_created_at("not-an-id") is None
@@ -0,0 +1,135 @@
+import io
+import itertools
+
+import numpy as np
+import pytest
+
+from app.services.cro_audit_service import calculate_revenue_potential, project_revenue
+from app.services.revenue_scenarios import (
+    SCENARIO_AXES,
+    RevenueScenarioGridRequest,
+    calculate_revenue_grid,
+    serialize_revenue_grid_npz,
+)
+
+ALL_METRICS = [
+    "current_monthly_revenue",
+    "potential_monthly_revenue",
+    "potential_conversion_rate",
+    "monthly_revenue_uplift",
+    "annual_revenue_uplift",
+]
+
+
+@pytest.fixture
+def mixed_request() -> RevenueScenarioGridRequest:
+    # Zeros, tiny and huge magnitudes, fractional values and negative uplifts on every axis
+    return RevenueScenarioGridRequest(
+        monthly_visitors=[0, 1, 12345, 10_000_000],
+        conversion_rates=[0.0, 0.01, 2.5, 100.0],
+        average_order_values=[0.0, 0.99, 80.0, 12345.67],
+        uplift_percentages=[-100.0, -12.5, 0.0, 0.1, 37.3, 400.0],
+        metrics=ALL_METRICS,
+    )
+
+
+def grid_cells(request: RevenueScenarioGridRequest):
+    axes = [getattr(request, axis) for axis in SCENARIO_AXES]
+    for index in itertools.product(*(range(len(values)) for values in axes)):
+        yield index, tuple(values[position] for values, position in zip(axes, index))
+
+
+def test_grid_matches_project_revenue(mixed_request):
+    grid = calculate_revenue_grid(mixed_request)
+
+    for metric in ALL_METRICS:
+        assert grid[metric].shape == mixed_request.shape
+        assert grid[metric].dtype == np.float64
+    for index, (visitors, conversion_rate, order_value, uplift) in grid_cells(mixed_request):
+        current, new_conversion_rate, new_revenue, monthly_uplift = project_revenue(
+            visitors, conversion_rate, order_value, uplift
+        )
+        assert grid["current_monthly_revenue"][index] == current
+        assert grid["potential_conversion_rate"][index] == new_conversion_rate
+        assert grid["potential_monthly_revenue"][index] == new_revenue
+        assert grid["monthly_revenue_uplift"][index] == monthly_uplift
+        assert grid["annual_revenue_uplift"][index] == monthly_uplift * 12
+
+
+def test_grid_matches_calculate_revenue_potential(mixed_request):
+    grid = calculate_revenue_grid(mixed_request)
+
+    for index, (visitors, conversion_rate, order_value, uplift) in grid_cells(mixed_request):
+        simulation = {"p10": uplift, "p50": uplift, "p90": uplift, "confidence": 100}
+        potential = calculate_revenue_potential(
+            visitors,
+            conversion_rate,
+            order_value,
+            [],
+            simulation=simulation,
+            roi_timeframe="3 months",
+        )
+        assert potential["current_monthly_revenue"] == round(
+            float(grid["current_monthly_revenue"][index])
+        )
+        assert potential["potential_monthly_revenue"] == round(
+            float(grid["potential_monthly_revenue"][index])
+        )
+        assert potential["potential_conversion_rate"] == round(
+            float(grid["potential_conversion_rate"][index]), 2
+        )
+        assert potential["monthly_revenue_uplift"] == round(
+            float(grid["monthly_revenue_uplift"][index])
+        )
+        assert potential["annual_revenue_uplift"] == round(
+            float(grid["annual_revenue_uplift"][index])
+        )
+
+
+def test_grid_float32_stays_close_to_float64(mixed_request):
+    exact = calculate_revenue_grid(mixed_request)
+    single = calculate_revenue_grid(mixed_request.model_copy(update={"dtype": "float32"}))
+
+    for metric in ALL_METRICS:
+        assert single[metric].dtype == np.float32
+        np.testing.assert_allclose(single[metric], exact[metric], rtol=1e-6)
+
+
+def test_grid_single_cell_and_repeated_metrics():
+    request = RevenueScenarioGridRequest(
+        monthly_visitors=[50000],
+        conversion_rates=[1.5],
+        average_order_values=[80.0],
+        uplift_percentages=[20.0],
+        metrics=["monthly_revenue_uplift", "monthly_revenue_uplift", "current_monthly_revenue"],
+    )
+    grid = calculate_revenue_grid(request)
+
+    assert list(grid) == ["monthly_revenue_uplift", "current_monthly_revenue"]
+    assert grid["current_monthly_revenue"].shape == (1, 1, 1, 1)
+    assert grid["monthly_revenue_uplift"][0, 0, 0, 0] == project_revenue(50000, 1.5, 80.0, 20.0)[3]
+
+
+def test_npz_round_trip(mixed_request):
+    grid = calculate_revenue_grid(mixed_request)
+
+    with np.load(io.BytesIO(serialize_revenue_grid_npz(mixed_request, grid))) as archive:
+        for axis in SCENARIO_AXES:
+            np.testing.assert_array_equal(archive[axis], getattr(mixed_request, axis))
+        for metric, values in grid.items():
+            np.testing.assert_array_equal(archive[metric], values)
+
+
+def test_value_count_counts_distinct_metrics(mixed_request):
+    request = mixed_request.model_copy(
+        update={
+            "metrics": [
+                "monthly_revenue_uplift",
+                "monthly_revenue_uplift",
+                "current_monthly_revenue",
+            ]
+        }
+    )
+
+    assert mixed_request.value_count == mixed_request.cell_count * len(ALL_METRICS)
+    assert request.value_count == request.cell_count * 2
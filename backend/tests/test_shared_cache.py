@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+
+from app.core.jobs import Job, JobQueue, JobStatus
+from app.core.shared_cache import SharedCache
+
+
+@pytest.fixture
+def open_cache(tmp_path):
+    """Open another worker's connection to the same shared cache file."""
+    caches = []
+
+    def open_cache() -> SharedCache:
+        cache = SharedCache()
+        cache.open(tmp_path / "shared.db", max_bytes=1024 * 1024)
+        caches.append(cache)
+        return cache
+
+    yield open_cache
+    for cache in caches:
+        cache.close()
+
+
+def test_async_forms_run_off_the_event_loop(open_cache):
+    cache = open_cache()
+
+    async def run():
+        await cache.aset_many("audit", ((f"id-{index}", b"{}") for index in range(100)))
+        return await cache.aget("audit", "id-99"), await cache.aget("audit", "missing")
+
+    assert asyncio.run(run()) == (b"{}", None)
+    assert cache.errors == 0
+    assert cache.writes == 100
+
+
+def test_disabled_cache_misses_without_a_thread():
+    cache = SharedCache()
+
+    async def run():
+        await cache.aset("audit", "id", b"{}")
+        return await cache.aget("audit", "id")
+
+    assert asyncio.run(run()) is None
+
+
+def test_job_states_reach_other_workers(open_cache):
+    this_worker, other_worker = open_cache(), open_cache()
+    polled = []
+
+    async def run():
+        queue = JobQueue()
+        await queue.start(
+            workers=1, process_workers=0, max_queue_size=10, store_size=10, shared_cache=this_worker
+        )
+        release = asyncio.Event()
+
+        async def work(job: Job) -> None:
+            await release.wait()
+
+        job = queue.submit(work)
+        await asyncio.sleep(JobQueue.SHARED_PUBLISH_INTERVAL * 4)
+        polled.append(await other_worker.aget(JobQueue.SHARED_NAMESPACE, job.job_id))
+        release.set()
+        await asyncio.sleep(0)
+        # Stopping flushes the state changes that are still buffered
+        await queue.stop()
+        polled.append(await other_worker.aget(JobQueue.SHARED_NAMESPACE, job.job_id))
+
+    asyncio.run(run())
+
+    statuses = [Job.model_validate_json(content).status for content in polled]
+    assert statuses == [JobStatus.RUNNING, JobStatus.DONE]
+    assert this_worker.errors == 0
@@ -0,0 +1,62 @@
+import asyncio
+import time
+from datetime import datetime
+
+import pytest
+
+from app.core.security.token_cache import TokenVersionCache
+from app.core.shared_cache import SharedCache
+
+TOKEN_CREATION_AT = datetime(2024, 5, 1, 12, 0, 0)
+USER = {"id": 7, "email": "user@example.com", "token_creation_at": TOKEN_CREATION_AT}
+
+
+@pytest.fixture
+def workers(tmp_path):
+    """Two workers' token version caches, each with its own connection to one shared cache."""
+    caches = []
+    for _ in range(2):
+        shared_cache = SharedCache()
+        shared_cache.open(tmp_path / "shared.db", max_bytes=1024 * 1024)
+        caches.append(TokenVersionCache(max_size=10, ttl=60, shared_cache=shared_cache))
+    yield caches
+    for cache in caches:
+        cache.shared_cache.close()
+
+
+def test_invalidate_reaches_other_workers(workers):
+    this_worker, other_worker = workers
+    for cache in workers:
+        cache.set(7, USER, fetched_at=time.time())
+
+    async def run():
+        assert await other_worker.get(7, TOKEN_CREATION_AT) == USER
+        await this_worker.invalidate(7)
+        return await other_worker.get(7, TOKEN_CREATION_AT)
+
+    assert asyncio.run(run()) is None
+
+
+def test_entries_fetched_after_invalidate_are_served(workers):
+    this_worker, other_worker = workers
+
+    async def run():
+        await this_worker.invalidate(7)
+        other_worker.set(7, USER, fetched_at=time.time())
+        return await other_worker.get(7, TOKEN_CREATION_AT)
+
+    assert asyncio.run(run()) == USER
+
+
+def test_without_shared_cache_only_this_worker_forgets():
+    this_worker, other_worker = (TokenVersionCache(max_size=10, ttl=60) for _ in range(2))
+    for cache in (this_worker, other_worker):
+        cache.set(7, USER, fetched_at=time.time())
+
+    async def run():
+        await this_worker.invalidate(7)
+        return await this_worker.get(7, TOKEN_CREATION_AT), await other_worker.get(
+            7, TOKEN_CREATION_AT
+        )
+
+    assert asyncio.run(run()) == (None, USER)